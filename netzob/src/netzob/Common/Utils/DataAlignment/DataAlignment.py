@@ -113,9 +113,28 @@ class DataAlignment(object):
     'hello' | 'PUT' | 'totototo' | 'PA' | 'dqs4qsd33'
     ------- | ----- | ---------- | ---- | -----------
 
+    The results of the parsing of the data types can be memoized during
+    an alignment, which pays off when the same values appear in many
+    messages. The hit rate of the cache is then available.
+
+    >>> messages = ["USER {0}".format(name) for name in ["root", "netzob", "root", "admin"] * 5]
+    >>> symbol = Symbol(fields=[Field("USER "), Field(ASCII(nbChars=(1, 10)))])
+    >>> dAlignment = DataAlignment(messages, symbol, cacheSize=128)
+    >>> alignedData = dAlignment.execute()
+    >>> print(len(alignedData))
+    20
+    >>> print(dAlignment.parsingCache)
+    ParsingCache (3/128 entries, 17 hits, 3 misses, hit rate 85.0%)
+
     """
 
-    def __init__(self, data, field, depth=None, encoded=True, styled=False):
+    def __init__(self,
+                 data,
+                 field,
+                 depth=None,
+                 encoded=True,
+                 styled=False,
+                 cacheSize=None):
         """Constructor.
 
         :param data: the list of data that will be aligned, data must be encoded in HexaString
@@ -128,6 +147,8 @@ class DataAlignment(object):
         :type encoded: :class:`bool`
         :keyword styled: indicated if the result visualization filter should be applied
         :type styled: :class:`bool`
+        :keyword cacheSize: if set, the results of the data types parsing are memoized in a :class:`ParsingCache` of this size during each alignment
+        :type cacheSize: :class:`int`
 
         """
         self.data = data
@@ -135,6 +156,8 @@ class DataAlignment(object):
         self.depth = depth
         self.encoded = encoded
         self.styled = styled
+        self.cacheSize = cacheSize
+        self.parsingCache = None
 
     def execute(self):
         """Execute the alignment of data following specified field
@@ -157,30 +180,44 @@ class DataAlignment(object):
 
         result.headers = [str(field.name) for field in targetedFieldLeafFields]
         from netzob.Model.Vocabulary.Domain.Parser.MessageParser import MessageParser
+        if self.cacheSize is not None:
+            from netzob.Model.Vocabulary.Domain.Parser.ParsingCache import ParsingCache
+            self.parsingCache = ParsingCache(self.cacheSize)
+        else:
+            self.parsingCache = None
+
+        alignedMsgs = []
         for d in self.data:
-            mp = MessageParser()
+            mp = MessageParser(parsingCache=self.parsingCache)
             # alignedMsg = mp.parseRaw(TypeConverter.convert(d, HexaString, Raw), targetedFieldLeafFields)
-            alignedMsg = next(mp.parseRaw(d, targetedFieldLeafFields))
-
-            alignedEncodedMsg = []
-            for ifield, currentField in enumerate(targetedFieldLeafFields):
-
-                # now we apply encoding and mathematic functions
-                fieldValue = alignedMsg[ifield]
-
-                if self.encoded and len(
-                        list(currentField.encodingFunctions.values())) > 0:
-                    for encodingFunction in list(
-                            currentField.encodingFunctions.values()):
-                        fieldValue = encodingFunction.encode(fieldValue)
-                else:
-                    fieldValue = TypeConverter.convert(fieldValue, BitArray,
-                                                       Raw)
-
-                if currentField in self.field.getLeafFields(depth=self.depth):
-                    alignedEncodedMsg.append(fieldValue)
+            alignedMsgs.append(next(mp.parseRaw(d, targetedFieldLeafFields)))
+
+        if self.parsingCache is not None:
+            self._logger.debug("Alignment of {0} messages: {1}", len(
+                self.data), self.parsingCache)
+
+        # now we apply encoding and mathematic functions, column by column
+        fieldLeafFields = self.field.getLeafFields(depth=self.depth)
+        columns = []
+        for ifield, currentField in enumerate(targetedFieldLeafFields):
+            if currentField not in fieldLeafFields:
+                continue
+
+            fieldValues = [alignedMsg[ifield] for alignedMsg in alignedMsgs]
+            encodingFunctions = list(currentField.encodingFunctions.values())
+            if self.encoded and len(encodingFunctions) > 0:
+                for encodingFunction in encodingFunctions:
+                    fieldValues = [
+                        encodingFunction.encode(fieldValue)
+                        for fieldValue in fieldValues
+                    ]
+            else:
+                fieldValues = TypeConverter.convertMany(fieldValues, BitArray,
+                                                        Raw)
+            columns.append(fieldValues)
 
-            result.append(alignedEncodedMsg)
+        for iMsg in range(len(alignedMsgs)):
+            result.append([column[iMsg] for column in columns])
 
         return result
 
@@ -240,7 +277,7 @@ class DataAlignment(object):
     # Static method
     @staticmethod
     @typeCheck(str, AbstractField, int)
-    def align(data, field, depth=None, encoded=True):
+    def align(data, field, depth=None, encoded=True, cacheSize=None):
         """Execute an alignment of specified data with provided field.
         Data must be provided as a list of hexastring.
 
@@ -252,11 +289,14 @@ class DataAlignment(object):
         :type depth: :class:`int`.
         :keyword encoded: set to True if you want the returned result to follow the encoding functions
         :type encoded: :class:`boolean`
+        :keyword cacheSize: if set, the size of the cache of the data types parsing results
+        :type cacheSize: :class:`int`
         :return: the aligned data
         :rtype: :class:`netzob.Common.Utils.MatrixList.MatrixList`
         """
 
-        dAlignment = DataAlignment(data, field, depth, encoded=encoded)
+        dAlignment = DataAlignment(
+            data, field, depth, encoded=encoded, cacheSize=cacheSize)
         return dAlignment.execute()
 
     # Properties
@@ -339,6 +379,26 @@ class DataAlignment(object):
 
         self.__encoded = encoded
 
+    @property
+    def cacheSize(self):
+        """The maximum number of results of the data types parsing which
+        are memoized during an alignment. If set to None, no cache is used.
+        The cache of the last alignment, with its hit rate statistics, is
+        available in :attr:`parsingCache`.
+
+        :type: :class:`int`
+        """
+        return self.__cacheSize
+
+    @cacheSize.setter
+    @typeCheck(int)
+    def cacheSize(self, cacheSize):
+        if cacheSize is not None and cacheSize <= 0:
+            raise ValueError(
+                "CacheSize must be >0, use None to disable the cache")
+
+        self.__cacheSize = cacheSize
+
     @property
     def styled(self):
         """The styled defines if it applies the visu filters on aligned data
@@ -99,11 +99,53 @@ except Exception as e:
     has_colour = False
 
 
+class _BraceMessage(object):
+    """A log message formatted with :meth:`str.format` only when it is
+    emitted."""
+
+    __slots__ = ('fmt', 'args')
+
+    def __init__(self, fmt, args):
+        self.fmt = fmt
+        self.args = args
+
+    def __str__(self):
+        return str(self.fmt).format(*self.args)
+
+
+class BraceFormatFilter(logging.Filter):
+    """A filter which lets the netzob loggers accept arguments following
+    the :meth:`str.format` syntax. Since filters are only applied on the
+    records which are emitted, arguments are not formatted if their
+    level is disabled.
+
+    >>> import logging
+    >>> logger = logging.getLogger("BraceFormatFilterExample")
+    >>> logger.addFilter(BraceFormatFilter())
+    >>> record = logger.makeRecord(logger.name, logging.DEBUG, __file__, 0, "Parsing {0} with {1}", ("data", "field"), None)
+    >>> logger.filter(record)
+    True
+    >>> print(record.getMessage())
+    Parsing data with field
+    """
+
+    def filter(self, record):
+        if record.args:
+            record.msg = _BraceMessage(record.msg, record.args)
+            record.args = ()
+        return True
+
+
 def NetzobLogger(klass):
     """This class decorator adds (if necessary) an instance
     of the logger (self.__logger) to the attached class
     and removes from the getState the logger.
 
+    The arguments given to the logger are formatted using the
+    :meth:`str.format` syntax, only if the message is emitted:
+    ::
+        self._logger.debug("Parsing {0} with {1}", data, field)
+
     """
 
     # Verify if a logger already exists
@@ -123,14 +165,26 @@ def NetzobLogger(klass):
         fmt = '%(relativeCreated)d: [%(levelname)s] %(module)s:%(funcName)s: %(message)s'
         handler.setFormatter(logging.Formatter(fmt))
         klass._logger.addHandler(handler)
+        klass._logger.addFilter(BraceFormatFilter())
         klass._logger.propagate = False
 
     # Exclude logger from __getstate__
     def getState(self, **kwargs):
         r = dict()
-        for k, v in list(self.__dict__.items()):
+        for k, v in list(getattr(self, '__dict__', {}).items()):
             if not isinstance(v, logging.Logger):
                 r[k] = v
+
+        # attributes stored in slots are given apart (see pickle protocol 2)
+        slots = dict()
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name.startswith('__') and not name.endswith('__'):
+                    name = "_{0}{1}".format(cls.__name__.lstrip('_'), name)
+                if hasattr(self, name):
+                    slots[name] = getattr(self, name)
+        if len(slots) > 0:
+            return (r if len(r) > 0 else None, slots)
         return r
 
     def setState(self, dict):
@@ -143,6 +197,12 @@ def NetzobLogger(klass):
     return klass
 
 
+# Type checking made by the typeCheck decorator can be disabled (for instance
+# in production) by setting the environment variable NETZOB_NO_TYPE_CHECK
+# to "yes" before netzob is imported.
+TYPE_CHECK_ENABLED = os.environ.get('NETZOB_NO_TYPE_CHECK') != "yes"
+
+
 def typeCheck(*types):
     """Decorator which reduces the amount of code to type-check attributes.
 
@@ -163,24 +223,27 @@ def typeCheck(*types):
 
     .. note:: set type = "SELF" to check the type of the self parameter
     .. warning:: if argument is None, the type checking is not executed on it.
+    .. note:: if the environment variable NETZOB_NO_TYPE_CHECK is set to "yes" when netzob is imported, the decorated functions are left unchanged and no type checking is executed.
 
     """
+    nbArguments = len(types) + 1
+    hasSelf = any(type == "SELF" for type in types)
 
     def _typeCheck_(func):
+        if not TYPE_CHECK_ENABLED:
+            return func
+
         def wrapped_f(*args, **kwargs):
-            arguments = args[1:]
-            if len(arguments) == len(types):
-                # Replace "SELF" with args[0] type
-                final_types = []
-                for type in types:
-                    if type == "SELF":
-                        final_types.append(args[0].__class__)
-                    else:
-                        final_types.append(type)
-
-                for i, argument in enumerate(arguments):
+            if len(args) == nbArguments:
+                final_types = types
+                if hasSelf:
+                    # Replace "SELF" with args[0] type
+                    final_types = tuple(args[0].__class__ if type == "SELF"
+                                        else type for type in types)
+
+                for argument, expected in zip(args[1:], final_types):
                     if argument is not None and not isinstance(argument,
-                                                               final_types[i]):
+                                                               expected):
                         raise TypeError(
                             "Invalid type for arguments, expecting: {0} and received {1}".
                             format(', '.join([t.__name__ for t in final_types
@@ -46,6 +46,8 @@ import abc
 
 
 class SortableObject(object, metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @abc.abstractmethod
     def priority(self):
         raise NotImplementedError(
@@ -34,7 +34,7 @@
 #+---------------------------------------------------------------------------+
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
-from bintrees import AVLTree
+from bisect import bisect_right
 
 #+---------------------------------------------------------------------------+
 #| Related third party imports                                               |
@@ -51,10 +51,12 @@ from netzob.Common.Utils.SortableObject import SortableObject
 class SortedTypedList(object):
     """This data structure allows to sort and maintain sorted
     a list of objects inheriting from :class:`netzob.Common.Utils.SortableObject.SortableObject`.
-    It uses an AVLTree proposed by :mod:`bintrees` to represent elements in the list.
 
-    :TODO: The inner object __tree stores the given element using an AVLTree. Thus
-    exposing new methods only requires the creation of a wrapper method in this class.
+    Elements and their priorities are stored in two contiguous lists kept
+    sorted by priority. Elements having the same priority are kept in
+    their insertion order. Appending elements whose priority is not lower
+    than the last one (such as messages imported in their capture order)
+    takes O(1) per element, other insertions are merged with a single sort.
 
     >>> from netzob.all import *
     >>> from netzob.Common.Utils.SortedTypedList import SortedTypedList
@@ -75,12 +77,24 @@ class SortedTypedList(object):
     >>> print(len(l))
     6
 
+    Elements sharing the same priority are all kept and the list can be
+    iterated over its elements.
+
+    >>> l.addAll([RawMessage(b"msg7", date=25.0), RawMessage(b"msg8", date=1.0)])
+    >>> print(len(l))
+    8
+    >>> [m.data for m in l]
+    [b'msg8', b'msg2', b'msg5', b'msg1', b'msg7', b'msg4', b'msg3', b'msg6']
+    >>> l.clear()
+    >>> print(len(l))
+    0
+
     """
 
     def __init__(self, membersTypes, elements=None):
         self.membersTypes = membersTypes
-        self.__treePriorities = AVLTree()
-        self.__mapMessages = dict()
+        self.__priorities = []
+        self.__elements = []
         if elements is not None and len(elements) > 0:
             self._extend(elements)
 
@@ -93,7 +107,17 @@ class SortedTypedList(object):
         """
         if element is None:
             raise TypeError("Element cannot be None")
-        self._extend([element])
+        self._check(element)
+
+        priority = element.priority()
+        priorities = self.__priorities
+        if len(priorities) == 0 or priority >= priorities[-1]:
+            priorities.append(priority)
+            self.__elements.append(element)
+        else:
+            position = bisect_right(priorities, priority)
+            priorities.insert(position, priority)
+            self.__elements.insert(position, element)
 
     def addAll(self, elements):
         """Insert in their proper place all the specified element.
@@ -112,16 +136,12 @@ class SortedTypedList(object):
 
         :rtype: :mod:list
         """
-
-        l = []
-        for x in list(self.__treePriorities.keys()):
-            l.extend(self.__mapMessages[x])
-        return l
+        return list(self.__elements)
 
     def clear(self):
-        """remove all items from the list.
-        It's a O(n) operation"""
-        self.__treePriorities.clear()
+        """remove all items from the list."""
+        self.__priorities = []
+        self.__elements = []
 
     def _extend(self, elements):
         """Add all the elements in the current list.
@@ -129,17 +149,29 @@ class SortedTypedList(object):
         :parameter elements: a list of :class:`netzob.Common.Utils.SortableObject.SortableObject` to insert.
         :raises: TypeError if something is wrong with the given elements
         """
+        elements = list(elements)
         for e in elements:
             self._check(e)
-
-        d = dict()
-        for e in elements:
-            d[e.priority()] = None
-            if e.priority() in self.__mapMessages:
-                self.__mapMessages[e.priority()].append(e)
-            else:
-                self.__mapMessages[e.priority()] = [e]
-        self.__treePriorities.update(d)
+        if len(elements) == 0:
+            return
+
+        priorities = [e.priority() for e in elements]
+        ordered = all(priorities[i] <= priorities[i + 1]
+                      for i in range(len(priorities) - 1))
+
+        if ordered and (len(self.__priorities) == 0 or
+                        priorities[0] >= self.__priorities[-1]):
+            self.__priorities.extend(priorities)
+            self.__elements.extend(elements)
+            return
+
+        # merge the new elements with the current ones: the sort is stable
+        # and takes advantage of the already sorted runs
+        priorities = self.__priorities + priorities
+        elements = self.__elements + elements
+        order = sorted(range(len(priorities)), key=priorities.__getitem__)
+        self.__priorities = [priorities[i] for i in order]
+        self.__elements = [elements[i] for i in order]
 
     def _check(self, v):
         if not isinstance(v, self.membersTypes):
@@ -154,14 +186,14 @@ class SortedTypedList(object):
     def __len__(self):
         """Returns the number of elements in the sorted list which takes
         O(1) operation :)"""
-        return len(self.__treePriorities)
+        return len(self.__elements)
 
     def __str__(self):
-        return ', \n'.join([str(v) for v in list(self.values())])
+        return ', \n'.join([str(v) for v in self.__elements])
 
     def __repr__(self):
         return repr(str(self))
 
     def __iter__(self):
         """SortedTypedList is an iterable over its values (and not its keys)."""
-        return list(self.__treePriorities.values()).__iter__()
+        return iter(self.values())
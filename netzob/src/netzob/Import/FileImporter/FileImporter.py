@@ -41,6 +41,7 @@ from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Common.Utils.SortedTypedList import SortedTypedList
 from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
 from netzob.Model.Vocabulary.Messages.FileMessage import FileMessage
+from netzob.Import.FileImporter.FileReader import FileReader
 from netzob.Common.NetzobException import NetzobImportException
 
 @NetzobLogger
@@ -90,17 +91,70 @@ class FileImporter(object):
     def __init__(self):
         pass
 
-    @typeCheck(list, bytes)
-    def readMessages(self, filePathList, delimitor=b"\n"):
+    @typeCheck(list, bytes, int, int, str)
+    def readMessages(self,
+                     filePathList,
+                     delimitor=b"\n",
+                     messageSize=0,
+                     lengthSize=0,
+                     byteOrder="big"):
         """Read all the messages found in the specified filePathList and given a delimitor.
 
         :param filePathList: paths of the file to parse
         :type filePathList: a list of :class:`str`
         :param delimitor: the delimitor used to find messages in the same file
         :type delimitor: :class:`str`
+        :param messageSize: if >0, messages are records of this size (in bytes) and the delimitor is not used
+        :type messageSize: :class:`int`
+        :param lengthSize: if >0, messages are prefixed by their length encoded on this number of bytes and the delimitor is not used
+        :type lengthSize: :class:`int`
+        :param byteOrder: the byte order of the length prefixes ("big" or "little")
+        :type byteOrder: :class:`str`
         :return: a sorted list of messages
         :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
+        self.messages = SortedTypedList(AbstractMessage)
+        self.messages.addAll(
+            list(
+                self.iterMessages(filePathList, delimitor, messageSize,
+                                  lengthSize, byteOrder)))
+        return self.messages
+
+    @typeCheck(list, bytes, int, int, str)
+    def iterMessages(self,
+                     filePathList,
+                     delimitor=b"\n",
+                     messageSize=0,
+                     lengthSize=0,
+                     byteOrder="big"):
+        """Iterate over the messages found in the specified files. Files
+        are memory-mapped and scanned as messages are consumed, so that
+        large files can be processed with a bounded memory. Parameters are
+        the ones of :meth:`readMessages`.
+
+        >>> from netzob.all import *
+        >>> importer = FileImporter()
+        >>> messages = importer.iterMessages(["./test/resources/files/test_import_text_message.txt"])
+        >>> print(next(messages).data)
+        b'The life that I have'
+
+        Messages can also be records of a fixed size or records prefixed
+        by their length.
+
+        >>> messages = FileImporter.readFile("./test/resources/files/test_import_raw_message1.dat", messageSize=16).values()
+        >>> print(len(messages), len(messages[0].data), len(messages[-1].data))
+        213 16 8
+        >>> import os, tempfile, struct
+        >>> fd = tempfile.NamedTemporaryFile(suffix=".dat", delete=False)
+        >>> _ = fd.write(b"".join(struct.pack("<I", len(m)) + m for m in [b"hello", b"netzob"]))
+        >>> fd.close()
+        >>> [m.data for m in FileImporter.readFile(fd.name, lengthSize=4, byteOrder="little").values()]
+        [b'hello', b'netzob']
+        >>> os.remove(fd.name)
+
+        :return: an iterator over the messages
+        :rtype: an iterator of :class:`netzob.Model.Vocabulary.Messages.FileMessage.FileMessage`
+        """
         # Verify the existence of input files
         errorMessageList = []
         for filePath in filePathList:
@@ -119,50 +173,71 @@ class FileImporter(object):
 
         if errorMessageList != []:
             raise NetzobImportException("File", "\n".join(errorMessageList))
-                
-        self.messages = SortedTypedList(AbstractMessage)
+
+        if messageSize < 0 or lengthSize < 0:
+            raise ValueError(
+                "The size of the messages and of their length prefix must be >=0"
+            )
+        if messageSize == 0 and lengthSize == 0 and (delimitor is None or
+                                                     len(delimitor) == 0):
+            raise TypeError("Delimitor cannot be None or empty")
+        if byteOrder not in ("big", "little"):
+            raise ValueError("The byte order must be 'big' or 'little'")
+
+        return self.__iterMessages(filePathList, delimitor, messageSize,
+                                   lengthSize, byteOrder)
+
+    def __iterMessages(self, filePathList, delimitor, messageSize, lengthSize,
+                       byteOrder):
         for filePath in filePathList:
-            self.__readMessagesFromFile(filePath, delimitor)
-        
-        return self.messages
-    
-    @typeCheck(str, bytes)
-    def __readMessagesFromFile(self, filePath, delimitor=b'\n'):
+            for message in self.__iterMessagesFromFile(
+                    filePath, delimitor, messageSize, lengthSize, byteOrder):
+                yield message
+
+    @typeCheck(str, bytes, int, int, str)
+    def __iterMessagesFromFile(self, filePath, delimitor, messageSize,
+                               lengthSize, byteOrder):
         if filePath is None or len(str(filePath).strip()) == 0:
             raise TypeError("Filepath cannot be None or empty")
- 
-        if delimitor is None or len(str(delimitor)) == 0:
-            raise TypeError("Delimitor cannot be None or empty")
 
-        file_content = None
-        with open(filePath, 'rb') as fd:
-            file_content = fd.read()
+        with FileReader(filePath) as reader:
+            if messageSize > 0:
+                records = reader.iterFixedSize(messageSize)
+            elif lengthSize > 0:
+                records = reader.iterLengthPrefixed(lengthSize, byteOrder)
+            else:
+                records = reader.iterDelimited(delimitor)
 
-        if file_content is None:
-            raise Exception("No content found in '{}'".format(filePath))
-
-        for i_data, data in enumerate(file_content.split(delimitor)):
-            if len(data) > 0:
-                self.messages.add(FileMessage(data, file_path = filePath, file_message_number = i_data))
+            for i_data, data in enumerate(records):
+                if len(data) > 0:
+                    yield FileMessage(bytes(data), file_path = filePath, file_message_number = i_data)
+                data.release()
 
     @staticmethod
-    @typeCheck(list, bytes)
-    def readFiles(filePathList, delimitor=b'\n'):
+    @typeCheck(list, bytes, int, int, str)
+    def readFiles(filePathList, delimitor=b'\n', messageSize=0, lengthSize=0, byteOrder="big"):
         """Read all messages from a list of files. A delimitor must be specified to delimit messages.
 
         :param filePathList: a list of files to read
         :type filePathList: a list of :class:`str`
         :param delimitor: the delimitor.
         :type delimitor: :class:`str`
+        :param messageSize: if >0, messages are records of this size (in bytes)
+        :type messageSize: :class:`int`
+        :param lengthSize: if >0, messages are prefixed by their length encoded on this number of bytes
+        :type lengthSize: :class:`int`
+        :param byteOrder: the byte order of the length prefixes ("big" or "little")
+        :type byteOrder: :class:`str`
         :return: a list of captured messages
         :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
         importer = FileImporter()
-        return importer.readMessages(filePathList, delimitor = delimitor)
+        return importer.readMessages(filePathList, delimitor, messageSize,
+                                     lengthSize, byteOrder)
     
     @staticmethod
-    @typeCheck(str, bytes)
-    def readFile(filePath, delimitor=b'\n'):
+    @typeCheck(str, bytes, int, int, str)
+    def readFile(filePath, delimitor=b'\n', messageSize=0, lengthSize=0, byteOrder="big"):
         """Read all messages from the specified file. 
         Messages are found based on the specified delimitor. 
 
@@ -170,8 +245,15 @@ class FileImporter(object):
         :type filePath: :class:`str`
         :param delimitor: the delimitor used to find messages in the specified file
         :type delimitor: :class:`str`
+        :param messageSize: if >0, messages are records of this size (in bytes)
+        :type messageSize: :class:`int`
+        :param lengthSize: if >0, messages are prefixed by their length encoded on this number of bytes
+        :type lengthSize: :class:`int`
+        :param byteOrder: the byte order of the length prefixes ("big" or "little")
+        :type byteOrder: :class:`str`
         :return: a list of captured messages
         :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
-        importer = FileImporter()        
-        return importer.readFiles([filePath], delimitor = delimitor)
+        importer = FileImporter()
+        return importer.readFiles([filePath], delimitor, messageSize,
+                                  lengthSize, byteOrder)
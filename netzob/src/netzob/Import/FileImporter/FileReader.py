@@ -0,0 +1,265 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+import mmap
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+
+
+@NetzobLogger
+class FileReader(object):
+    """A reader which splits a file in records.
+
+    The file is memory-mapped and records are returned as memoryviews on
+    the mapping, so they are only copied when the caller needs it. Files
+    which cannot be mapped (such as pipes), or whose mapping is disabled,
+    are read by chunks. Three framings of the records are supported:
+    records separated by a delimiter, records of a fixed size and records
+    prefixed by their length.
+
+    >>> from netzob.all import *
+    >>> from netzob.Import.FileImporter.FileReader import FileReader
+    >>> with FileReader("./test/resources/files/test_import_text_message.txt") as reader:
+    ...     records = [bytes(record) for record in reader.iterDelimited(b"\\n")]
+    >>> print(len(records))
+    14
+    >>> print(records[0], records[-1])
+    b'The life that I have' b''
+
+    >>> import os, tempfile, struct
+    >>> fd = tempfile.NamedTemporaryFile(suffix=".dat", delete=False)
+    >>> _ = fd.write(struct.pack(">H", 5) + b"hello" + struct.pack(">H", 0) + struct.pack(">H", 3) + b"abc")
+    >>> fd.close()
+    >>> with FileReader(fd.name) as reader:
+    ...     print([bytes(record) for record in reader.iterLengthPrefixed(2)])
+    ...     print([bytes(record) for record in reader.iterFixedSize(4)])
+    [b'hello', b'', b'abc']
+    [b'\\x00\\x05he', b'llo\\x00', b'\\x00\\x00\\x03a', b'bc']
+
+    Delimiters spanning the chunks of a file which is not mapped are also
+    found.
+
+    >>> with FileReader(fd.name, chunkSize=3, mapFile=False) as reader:
+    ...     print([bytes(record) for record in reader.iterDelimited(b"\\x00\\x03")])
+    [b'\\x00\\x05hello\\x00\\x00', b'abc']
+    >>> with FileReader(fd.name, chunkSize=3, mapFile=False) as reader:
+    ...     print([bytes(record) for record in reader.iterLengthPrefixed(2)])
+    [b'hello', b'', b'abc']
+    >>> os.remove(fd.name)
+
+    """
+
+    # size (in bytes) of the chunks read when the file is not mapped
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+    @typeCheck(str, int, bool)
+    def __init__(self, filePath, chunkSize=DEFAULT_CHUNK_SIZE, mapFile=True):
+        """Open and map the specified file.
+
+        :parameter filePath: the path of the file to read
+        :type filePath: :class:`str`
+        :keyword chunkSize: the size of the chunks read when the file is not mapped
+        :type chunkSize: :class:`int`
+        :keyword mapFile: whether the file is memory-mapped (if possible) or read by chunks
+        :type mapFile: :class:`bool`
+        """
+        if filePath is None:
+            raise TypeError("filePath cannot be None")
+        if chunkSize is None or chunkSize <= 0:
+            raise ValueError("chunkSize must be >0")
+
+        self.filePath = filePath
+        self.chunkSize = chunkSize
+        self.__fd = open(filePath, 'rb')
+        self.__map = None
+        if not mapFile:
+            return
+        try:
+            self.__map = mmap.mmap(
+                self.__fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # empty files and streams cannot be mapped
+            self.__map = None
+
+    @typeCheck(bytes)
+    def iterDelimited(self, delimitor):
+        """Yield the records separated by the specified delimiter, as
+        :meth:`bytes.split` would do (empty records included).
+
+        :parameter delimitor: the delimiter of the records
+        :type delimitor: :class:`bytes`
+        :rtype: an iterator of :class:`memoryview`
+        """
+        if delimitor is None or len(delimitor) == 0:
+            raise TypeError("Delimitor cannot be None or empty")
+
+        if self.__map is None:
+            for record in self.__iterDelimitedChunks(delimitor):
+                yield record
+            return
+
+        data = memoryview(self.__map)
+        try:
+            start = 0
+            end = self.__map.find(delimitor, start)
+            while end != -1:
+                yield data[start:end]
+                start = end + len(delimitor)
+                end = self.__map.find(delimitor, start)
+            yield data[start:]
+        finally:
+            data.release()
+
+    def __iterDelimitedChunks(self, delimitor):
+        """Yield the delimited records of a file read by chunks. The
+        search of the delimiter restarts before the end of the previous
+        chunk so that delimiters spanning two chunks are found."""
+        buffer = bytearray()
+        searchStart = 0
+        while True:
+            chunk = self.__fd.read(self.chunkSize)
+            if len(chunk) == 0:
+                break
+            buffer += chunk
+
+            start = 0
+            end = buffer.find(delimitor, searchStart)
+            while end != -1:
+                yield memoryview(bytes(buffer[start:end]))
+                start = end + len(delimitor)
+                end = buffer.find(delimitor, start)
+            del buffer[:start]
+            searchStart = max(0, len(buffer) - len(delimitor) + 1)
+        yield memoryview(bytes(buffer))
+
+    @typeCheck(int)
+    def iterFixedSize(self, size):
+        """Yield the records of the specified size. The last record is
+        shorter if the size of the file is not a multiple of the size of
+        the records.
+
+        :parameter size: the size (in bytes) of the records
+        :type size: :class:`int`
+        :rtype: an iterator of :class:`memoryview`
+        """
+        if size is None or size <= 0:
+            raise ValueError("The size of the records must be >0")
+
+        for record in self.__iterSized(lambda header: size, 0):
+            yield record
+
+    @typeCheck(int, str)
+    def iterLengthPrefixed(self, lengthSize, byteOrder="big"):
+        """Yield the records which are prefixed by their length (in bytes,
+        the prefix not included).
+
+        :parameter lengthSize: the size (in bytes) of the length prefix
+        :type lengthSize: :class:`int`
+        :keyword byteOrder: the byte order of the length prefix ("big" or "little")
+        :type byteOrder: :class:`str`
+        :rtype: an iterator of :class:`memoryview`
+        """
+        if lengthSize is None or lengthSize <= 0:
+            raise ValueError("The size of the length prefix must be >0")
+        if byteOrder not in ("big", "little"):
+            raise ValueError("The byte order must be 'big' or 'little'")
+
+        for record in self.__iterSized(
+                lambda header: int.from_bytes(header, byteOrder), lengthSize):
+            yield record
+
+    def __iterSized(self, recordSize, headerSize):
+        """Yield the records whose size is computed from their header."""
+        if self.__map is None:
+            while True:
+                header = self.__fd.read(headerSize)
+                if len(header) < headerSize:
+                    if len(header) > 0:
+                        self.__warnTruncated()
+                    break
+                size = recordSize(header)
+                record = self.__fd.read(size)
+                if headerSize == 0 and len(record) == 0:
+                    break
+                if headerSize > 0 and len(record) < size:
+                    self.__warnTruncated()
+                yield memoryview(record)
+            return
+
+        data = memoryview(self.__map)
+        try:
+            offset = 0
+            while offset < len(data):
+                header = data[offset:offset + headerSize]
+                if len(header) < headerSize:
+                    self.__warnTruncated()
+                    break
+                start = offset + headerSize
+                offset = start + recordSize(header)
+                if headerSize > 0 and offset > len(data):
+                    self.__warnTruncated()
+                yield data[start:offset]
+        finally:
+            data.release()
+
+    def __warnTruncated(self):
+        self._logger.warning("The last record of {0} is truncated".format(
+            self.filePath))
+
+    def close(self):
+        """Release the mapping of the file."""
+        if self.__map is not None:
+            try:
+                self.__map.close()
+            except BufferError:
+                # some records are still referenced, the mapping is
+                # released once they are garbage collected
+                pass
+        self.__fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
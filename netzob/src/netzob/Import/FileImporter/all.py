@@ -35,4 +35,5 @@
 # List subpackages to import with the current one
 # see docs.python.org/2/tutorial/modules.html
 
+from netzob.Import.FileImporter.FileReader import FileReader
 from netzob.Import.FileImporter.FileImporter import FileImporter
@@ -0,0 +1,230 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+import hashlib
+import os
+import tempfile
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+from netzob.Import.PCAPImporter.PCAPImporter import PCAPImporter
+from netzob.Model.Vocabulary.Messages.MessageStore import MessageStore
+
+
+@NetzobLogger
+class PCAPCache(object):
+    """A persistent cache of imported captures.
+
+    The messages imported from a capture are saved as a
+    :class:`MessageStore` file in the cache directory. An entry is
+    identified by the hash of the content of the capture and by the
+    import parameters (BPF filter, layer, number of packets and flows
+    merging), so it is shared by the copies of a capture and it becomes
+    stale as soon as the capture is modified. To avoid hashing the
+    capture on each import, its hash is remembered with its size and its
+    modification time, and is only computed again when one of them
+    changes.
+
+    >>> import os, shutil, tempfile
+    >>> from netzob.all import *
+    >>> cache = PCAPCache(tempfile.mkdtemp())
+    >>> store = cache.readStore("./test/resources/pcaps/test_import_udp.pcap", importLayer=4)
+    >>> print(len(store), store[0].source)
+    14 127.0.0.1:57831
+    >>> print(len([name for name in os.listdir(cache.directory) if name.endswith(".store")]))
+    1
+
+    The second import loads the saved messages.
+
+    >>> store = cache.readStore("./test/resources/pcaps/test_import_udp.pcap", importLayer=4)
+    >>> [m.data for m in store] == [m.data for m in PCAPImporter.readFile("./test/resources/pcaps/test_import_udp.pcap", importLayer=4).values()]
+    True
+    >>> store = cache.readStore("./test/resources/pcaps/test_import_udp.pcap", bpfFilter="udp", importLayer=5)
+    >>> print(len([name for name in os.listdir(cache.directory) if name.endswith(".store")]))
+    2
+    >>> cache.clear()
+    >>> os.listdir(cache.directory)
+    []
+    >>> shutil.rmtree(cache.directory)
+
+    """
+
+    DEFAULT_DIRECTORY = os.path.join(
+        os.path.expanduser("~"), ".cache", "netzob", "pcaps")
+
+    # size (in bytes) of the blocks read to hash a capture
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    STORE_EXTENSION = ".store"
+    STAMP_EXTENSION = ".stamp"
+
+    def __init__(self, directory=None):
+        """Constructor.
+
+        :keyword directory: the directory where the entries of the cache are saved (by default ~/.cache/netzob/pcaps)
+        :type directory: :class:`str`
+        """
+        if directory is None:
+            directory = PCAPCache.DEFAULT_DIRECTORY
+        self.directory = directory
+
+    @typeCheck(str, str, int, int, bool)
+    def readStore(self,
+                  filePath,
+                  bpfFilter="",
+                  importLayer=5,
+                  nbPackets=0,
+                  mergePacketsInFlow=False):
+        """Read the messages of a PCAP file from the cache, or import them
+        and save them in the cache. Parameters are the ones of
+        :meth:`PCAPImporter.readFile`.
+
+        :return: the captured messages ordered by date
+        :rtype: :class:`netzob.Model.Vocabulary.Messages.MessageStore.MessageStore`
+        """
+        if filePath is None:
+            raise TypeError("filePath cannot be None")
+
+        entryPath = self.__entryPath(filePath, bpfFilter, importLayer,
+                                     nbPackets, mergePacketsInFlow)
+        if os.path.exists(entryPath):
+            try:
+                return MessageStore.load(entryPath)
+            except ValueError:
+                self._logger.warning(
+                    "Invalid cache entry {0}, the capture is imported again".
+                    format(entryPath))
+
+        store = PCAPImporter().readStore([filePath], bpfFilter, importLayer,
+                                         nbPackets, mergePacketsInFlow)
+        try:
+            self.__write(entryPath, store.save)
+        except (IOError, OSError, TypeError) as e:
+            self._logger.warning("Cannot save the cache entry {0}: {1}".format(
+                entryPath, e))
+        return store
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        for name in os.listdir(self.directory):
+            if name.endswith(PCAPCache.STORE_EXTENSION) or name.endswith(
+                    PCAPCache.STAMP_EXTENSION):
+                os.remove(os.path.join(self.directory, name))
+
+    def __entryPath(self, filePath, bpfFilter, importLayer, nbPackets,
+                    mergePacketsInFlow):
+        """Return the path of the entry of a capture imported with the
+        specified parameters."""
+        parameters = repr((bpfFilter, importLayer, nbPackets,
+                           mergePacketsInFlow, MessageStore.FILE_VERSION))
+        name = "{0}-{1}{2}".format(
+            self.__contentHash(filePath),
+            hashlib.sha256(parameters.encode("utf-8")).hexdigest()[:16],
+            PCAPCache.STORE_EXTENSION)
+        return os.path.join(self.directory, name)
+
+    def __contentHash(self, filePath):
+        """Return the hash of the content of a capture. The hash is
+        computed again only if the size or the modification time of the
+        capture have changed since it was last computed."""
+        status = os.stat(filePath)
+        stamp = "{0} {1}".format(status.st_size, status.st_mtime_ns)
+        stampPath = os.path.join(self.directory, hashlib.sha256(
+            os.path.abspath(filePath).encode("utf-8")).hexdigest() +
+                                 PCAPCache.STAMP_EXTENSION)
+
+        try:
+            with open(stampPath, 'r') as fd:
+                (previousStamp, contentHash) = fd.read().rsplit(" ", 1)
+            if previousStamp == stamp:
+                return contentHash
+        except (IOError, OSError, ValueError):
+            pass
+
+        digest = hashlib.sha256()
+        with open(filePath, 'rb') as fd:
+            for block in iter(lambda: fd.read(PCAPCache.HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        contentHash = digest.hexdigest()
+
+        try:
+            self.__write(stampPath, lambda path: self.__writeText(
+                path, "{0} {1}".format(stamp, contentHash)))
+        except (IOError, OSError) as e:
+            self._logger.warning("Cannot save the hash of {0}: {1}".format(
+                filePath, e))
+        return contentHash
+
+    @staticmethod
+    def __writeText(path, text):
+        with open(path, 'w') as fd:
+            fd.write(text)
+
+    def __write(self, path, writer):
+        """Write a file of the cache atomically, so that concurrent imports
+        never read a partial entry."""
+        (fd, temporaryPath) = tempfile.mkstemp(dir=self.directory)
+        os.close(fd)
+        try:
+            writer(temporaryPath)
+            os.replace(temporaryPath, path)
+        except:
+            os.remove(temporaryPath)
+            raise
+
+    @property
+    def directory(self):
+        """The directory where the entries of the cache are saved. It is
+        created if needed.
+
+        :type: :class:`str`
+        """
+        return self.__directory
+
+    @directory.setter
+    @typeCheck(str)
+    def directory(self, directory):
+        if directory is None:
+            raise TypeError("Directory cannot be None")
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
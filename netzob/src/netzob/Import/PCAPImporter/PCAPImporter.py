@@ -29,18 +29,21 @@
 #| Standard library imports
 #+---------------------------------------------------------------------------+
 import errno
+import struct
 from gettext import gettext as _
 
 #+---------------------------------------------------------------------------+
 #| Related third party imports
 #+---------------------------------------------------------------------------+
-import pcapy
+try:
+    import pcapy
+except ImportError:
+    pcapy = None
 
 ## FIXME: Temporary deactivate this module as it is not currently supported in Python3
 # import impacket.ImpactDecoder as Decoders
 # import impacket.ImpactPacket as Packets
 ## Instead, import local adapted files
-from netzob.Import.PCAPImporter import ImpactPacket as Packets
 from netzob.Import.PCAPImporter import ImpactDecoder as Decoders
 
 #+---------------------------------------------------------------------------+
@@ -49,6 +52,8 @@ from netzob.Import.PCAPImporter import ImpactDecoder as Decoders
 from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Common.Utils.SortedTypedList import SortedTypedList
 from netzob.Common.NetzobException import NetzobImportException
+from netzob.Import.PCAPImporter.PCAPReader import PCAPReader
+from netzob.Import.PCAPImporter.TCPReassembler import TCPReassembler
 from netzob.Model.Vocabulary.Types.Raw import Raw
 from netzob.Model.Vocabulary.Types.HexaString import HexaString
 from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
@@ -56,6 +61,26 @@ from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
 from netzob.Model.Vocabulary.Messages.L2NetworkMessage import L2NetworkMessage
 from netzob.Model.Vocabulary.Messages.L3NetworkMessage import L3NetworkMessage
 from netzob.Model.Vocabulary.Messages.L4NetworkMessage import L4NetworkMessage
+from netzob.Model.Vocabulary.Messages.MessageStore import MessageStore
+
+
+class _ImportState(object):
+    """State of a single import: its layer, the datalink of the capture
+    being read and the flows being merged. Each import has its own state
+    so that several imports (for instance several generators returned by
+    :meth:`PCAPImporter.iterMessages`) can run at the same time."""
+
+    def __init__(self, importLayer, mergePacketsInFlow=False):
+        self.importLayer = importLayer
+        self.datalink = None
+        self.flowMessage = None
+        self.flowData = None
+        self.reassembler = None
+        self.reassembledMessages = []
+        if mergePacketsInFlow:
+            self.flowData = []
+            if importLayer == 5:
+                self.reassembler = TCPReassembler()
 
 
 @NetzobLogger
@@ -108,7 +133,16 @@ class PCAPImporter(object):
     >>> print(repr(messages[0].data))
     b'GET / HTTP/1.1\\r\\nHost: www.free.fr\\r\\nUser-Agent: aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa(bbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbbb)ccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccccc\\r\\nAccept: text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8\\r\\nAccept-Language: en-US,en;q=0.5\\r\\nAccept-Encoding: gzip, deflate\\r\\nConnection: keep-alive\\r\\n\\r\\n'
 
-    Parameter `mergePacketsInFlow` can be use to merge consecutive messages that share the same source and destination (mimic a TCP flow). In practice, this parameter was introduced for L5 network messages to support TCP flows but it can be use for any level of network messages.
+    Captures are read with the built-in :class:`PCAPReader`, which also
+    supports the pcapng format. `pcapy` is only required to apply BPF filters.
+
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_udp.pcapng").values()
+    >>> print(len(messages))
+    14
+    >>> print(repr(messages[0].data))
+    b'CMDidentify#\\x07\\x00\\x00\\x00Roberto'
+
+    Parameter `mergePacketsInFlow` can be use to merge consecutive messages that share the same source and destination (mimic a TCP flow). For L5 network messages, TCP streams are reassembled following their sequence numbers and a message is produced each time the sender pushes its data (PSH or FIN flags) or the other side starts to send data. For other layers and for UDP, consecutive messages with the same source and destination are merged.
 
     >>> from netzob.all import *
     >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_http_flow.pcap", mergePacketsInFlow=False).values()
@@ -130,38 +164,46 @@ class PCAPImporter(object):
 
     PROTOCOL201 = 201
 
-    # Supported datalinks (by pcapy)
+    # Messages created for each import layer
+    MESSAGE_CLASSES = {
+        1: L2NetworkMessage,
+        2: L2NetworkMessage,
+        3: L3NetworkMessage,
+        4: L4NetworkMessage,
+        5: L4NetworkMessage,
+    }
+
+    # Supported datalinks (given as link types)
     SUPPORTED_DATALINKS = {
-        pcapy.DLT_ARCNET: "DLT_ARCNET",
-        pcapy.DLT_FDDI: "DLT_FDDI",
-        pcapy.DLT_LOOP: "DLT_LOOP",
-        pcapy.DLT_PPP_ETHER: "DLT_PPP_ETHER",
-        pcapy.DLT_ATM_RFC1483: "DLT_ATM_RFC1483",
-        pcapy.DLT_IEEE802: "DLT_IEEE802",
-        pcapy.DLT_LTALK: "DLT_LTALK",
-        pcapy.DLT_PPP_SERIAL: "DLT_PPP_SERIAL",
-        pcapy.DLT_C_HDLC: "DLT_C_HDLC",
-        pcapy.DLT_IEEE802_11: "IEEE802_11",
-        pcapy.DLT_NULL: "DLT_NULL",
-        pcapy.DLT_RAW: "DLT_RAW",
-        pcapy.DLT_EN10MB: "DLT_EN10MB",
-        pcapy.DLT_LINUX_SLL: "LINUX_SLL",
-        pcapy.DLT_PPP: "DLT_PPP",
-        pcapy.DLT_SLIP: "DLT_SLIP",
+        0: "DLT_NULL",
+        1: "DLT_EN10MB",
+        6: "DLT_IEEE802",
+        7: "DLT_ARCNET",
+        8: "DLT_SLIP",
+        9: "DLT_PPP",
+        10: "DLT_FDDI",
+        11: "DLT_ATM_RFC1483",
+        50: "DLT_PPP_SERIAL",
+        51: "DLT_PPP_ETHER",
+        101: "DLT_RAW",
+        104: "DLT_C_HDLC",
+        105: "IEEE802_11",
+        108: "DLT_LOOP",
+        113: "LINUX_SLL",
+        114: "DLT_LTALK",
     }
 
+    # decoder used to detail the content of messages, created on first use
+    __detailsDecoder = None
+
     def __init__(self):
         pass
 
-    @typeCheck(str, str, int)
-    def __readMessagesFromFile(self, filePath, bpfFilter, nbPackets):
-        """Internal methods to read all messages from a given PCAP file."""
+    @typeCheck(_ImportState, str, str, int)
+    def __iterMessagesFromFile(self, state, filePath, bpfFilter, nbPackets):
+        """Internal generator which yields the messages of a given PCAP file."""
         if (filePath is None):
             raise TypeError("filePath cannot be None")
-        if (nbPackets < 0):
-            raise ValueError(
-                "A positive (or null) value is required for the number of packets to read."
-            )
 
         # Check file can be opened (and read)
         try:
@@ -175,6 +217,74 @@ class PCAPImporter(object):
             else:
                 raise e
 
+        if bpfFilter == "":
+            records = self.__iterRecordsWithReader(state, filePath, nbPackets)
+        else:
+            records = self.__iterRecordsWithPcapy(state, filePath, bpfFilter,
+                                                  nbPackets)
+
+        for (epoch, datalink, payload) in records:
+            message = self.__decodePacket(state, epoch, datalink, payload)
+            if message is not None:
+                if state.flowData is not None:
+                    message = self.__mergeInFlow(state, message)
+                if message is not None:
+                    yield message
+            if len(state.reassembledMessages) > 0:
+                for message in state.reassembledMessages:
+                    yield message
+                state.reassembledMessages = []
+
+    def __iterRecordsWithReader(self, state, filePath, nbPackets, start=None,
+                                end=None):
+        """Internal method that walks the records of a capture with the
+        built-in reader."""
+        try:
+            reader = PCAPReader(filePath, start, end)
+        except ValueError as e:
+            raise NetzobImportException("PCAP", str(e))
+
+        with reader:
+            state.datalink = reader.datalink
+            self.__checkDatalink(state)
+            for (iPacket, (epoch, datalink, frame)) in enumerate(reader):
+                if nbPackets > 0 and iPacket >= nbPackets:
+                    break
+                yield (epoch, datalink, frame)
+
+    @typeCheck(str, str, int, int, int, int)
+    def _iterDecodedRecords(self, filePath, bpfFilter, nbPackets,
+                            importLayer, start=None, end=None):
+        """Yield the decoded records of a PCAP file as tuples (epoch,
+        data, attributes) where the attributes are the network
+        properties of the message which would be built from the record.
+        The start and end offsets restrict the reading to a part of a pcap
+        file (see :meth:`PCAPReader.splitRecords`).
+
+        This is used to import captures in parallel without instantiating
+        messages in the threads."""
+        state = _ImportState(importLayer)
+
+        if bpfFilter == "":
+            records = self.__iterRecordsWithReader(state, filePath, nbPackets,
+                                                   start, end)
+        else:
+            records = self.__iterRecordsWithPcapy(state, filePath, bpfFilter,
+                                                  nbPackets)
+        for (epoch, datalink, payload) in records:
+            decodedRecord = self.__decodeRecord(state, epoch, datalink,
+                                                payload)
+            if decodedRecord is not None:
+                yield (epoch, decodedRecord[0], decodedRecord[1])
+
+    def __iterRecordsWithPcapy(self, state, filePath, bpfFilter, nbPackets):
+        """Internal method that reads a capture with pcapy to benefit from
+        its BPF filtering."""
+        if pcapy is None:
+            raise NetzobImportException(
+                "PCAP", "BPF filters can only be used if pcapy is installed",
+                self.INVALID_BPF_FILTER)
+
         # Check (and configure) the bpf filter
         packetReader = pcapy.open_offline(filePath)
         try:
@@ -184,29 +294,56 @@ class PCAPImporter(object):
                 "The provided BPF filter is not valid (it should follow the BPF format)"
             )
 
-        # Check the datalink
-        self.datalink = packetReader.datalink()
-        if self.datalink not in list(PCAPImporter.SUPPORTED_DATALINKS.keys()):
+        state.datalink = packetReader.datalink()
+        self.__checkDatalink(state)
+
+        iPacket = 0
+        while nbPackets == 0 or iPacket < nbPackets:
+            try:
+                (header, payload) = packetReader.next()
+            except pcapy.PcapError:
+                break
+            if header is None:
+                break
+            iPacket += 1
+
+            (secs, usecs) = header.getts()
+            epoch = secs + (usecs / 1000000.0)
+            yield (epoch, state.datalink, payload)
+
+    def __checkDatalink(self, state):
+        """Internal method that verifies the datalink of the capture can be
+        decoded up to the import layer."""
+        if state.datalink not in list(PCAPImporter.SUPPORTED_DATALINKS.keys()):
             self._logger.debug("Unkown datalinks")
 
-        if self.importLayer > 1 and self.datalink != pcapy.DLT_EN10MB and self.datalink != pcapy.DLT_LINUX_SLL and self.datalink != PCAPImporter.PROTOCOL201:
+        if state.importLayer > 1 and state.datalink != PCAPReader.LINKTYPE_ETHERNET and state.datalink != PCAPReader.LINKTYPE_LINUX_SLL and state.datalink != PCAPImporter.PROTOCOL201:
             errorMessage = _("This pcap cannot be imported since the " +
                              "layer 2 is not supported ({0})").format(
-                                 str(self.datalink))
+                                 str(state.datalink))
             raise NetzobImportException("PCAP", errorMessage,
                                         self.INVALID_LAYER2)
-        else:
-            packetReader.loop(nbPackets, self.__packetHandler)
-
-    def __packetHandler(self, header, payload):
-        """Internal callback executed on each packet when parsing the pcap"""
-        (secs, usecs) = header.getts()
-        epoch = secs + (usecs / 1000000.0)
 
-        if self.importLayer == 1 or self.importLayer == 2:
+    def __decodePacket(self, state, epoch, datalink, payload):
+        """Internal method that decodes a packet and returns the message
+        found at the import layer (or None if the packet cannot be
+        imported)."""
+        decodedRecord = self.__decodeRecord(state, epoch, datalink, payload)
+        if decodedRecord is None:
+            return None
+        (data, attributes) = decodedRecord
+        return PCAPImporter.MESSAGE_CLASSES[state.importLayer](data, epoch,
+                                                               *attributes)
+
+    def __decodeRecord(self, state, epoch, datalink, payload):
+        """Internal method that decodes a packet and returns the data found
+        at the import layer with the network attributes of the message
+        (or None if the packet cannot be imported)."""
+
+        if state.importLayer == 1 or state.importLayer == 2:
             try:
                 (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
+                 etherType) = self.__decodeLayer2(datalink, payload)
             except NetzobImportException as e:
                 self._logger.warn(
                     "An error occured while decoding layer2 of a packet: {0}".
@@ -215,16 +352,21 @@ class PCAPImporter(object):
             if len(l2Payload) == 0:
                 return
 
-            # Build the L2NetworkMessage
-            l2Message = L2NetworkMessage(payload, epoch, l2Proto, l2SrcAddr,
-                                         l2DstAddr)
+            return (bytes(payload), (l2Proto, l2SrcAddr, l2DstAddr))
 
-            self.messages.add(l2Message)
+        # most packets are decoded at once by the Ethernet/IPv4 fast path
+        decoded = None
+        if datalink == PCAPReader.LINKTYPE_ETHERNET:
+            decoded = PCAPReader.decodeEthernetIPv4(payload)
 
-        elif self.importLayer == 3:
+        if decoded is not None:
+            (l2Proto, l2SrcAddr, l2DstAddr, l3Proto, l3SrcAddr, l3DstAddr,
+             l4Proto, l4SrcPort, l4DstPort, l2Payload, l3Payload,
+             l4Payload) = decoded
+        elif state.importLayer == 3:
             try:
                 (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
+                 etherType) = self.__decodeLayer2(datalink, payload)
                 (l3Proto, l3SrcAddr, l3DstAddr, l3Payload,
                  ipProtocolNum) = self.__decodeLayer3(etherType, l2Payload)
             except NetzobImportException as e:
@@ -232,116 +374,73 @@ class PCAPImporter(object):
                     "An error occured while decoding layer2 and layer3 of a packet: {0}".
                     format(e))
                 return
-
-            if len(l3Payload) == 0:
-                return
-
-            # Build the L3NetworkMessage
-            l3Message = L3NetworkMessage(l2Payload, epoch, l2Proto, l2SrcAddr,
-                                         l2DstAddr, l3Proto, l3SrcAddr,
-                                         l3DstAddr)
-            self.messages.add(l3Message)
-
-        elif self.importLayer == 4:
+        else:
             try:
                 (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
+                 etherType) = self.__decodeLayer2(datalink, payload)
                 (l3Proto, l3SrcAddr, l3DstAddr, l3Payload,
                  ipProtocolNum) = self.__decodeLayer3(etherType, l2Payload)
                 (l4Proto, l4SrcPort, l4DstPort,
                  l4Payload) = self.__decodeLayer4(ipProtocolNum, l3Payload)
             except NetzobImportException as e:
+                if state.importLayer == 4:
+                    layers = "layer2, layer3 or layer4"
+                else:
+                    layers = "layer2, layer3, layer4 or layer5"
                 self._logger.warn(
-                    "An error occured while decoding layer2, layer3 or layer4 of a packet: {0}".
-                    format(e))
+                    "An error occured while decoding {0} of a packet: {1}".
+                    format(layers, e))
                 return
-            if len(l4Payload) == 0:
+
+        if state.importLayer == 3:
+            if len(l3Payload) == 0:
                 return
 
-            # Build the L4NetworkMessage
-            l4Message = L4NetworkMessage(
-                l3Payload, epoch, l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
-                l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort, l4DstPort)
+            return (bytes(l2Payload), (l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
+                                       l3SrcAddr, l3DstAddr))
+
+        elif state.importLayer == 4:
+            if len(l4Payload) == 0:
+                return
 
-            self.messages.add(l4Message)
+            return (bytes(l3Payload), (l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
+                                       l3SrcAddr, l3DstAddr, l4Proto,
+                                       l4SrcPort, l4DstPort))
 
         else:
-            try:
-                (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
-                (l3Proto, l3SrcAddr, l3DstAddr, l3Payload,
-                 ipProtocolNum) = self.__decodeLayer3(etherType, l2Payload)
-                (l4Proto, l4SrcPort, l4DstPort,
-                 l4Payload) = self.__decodeLayer4(ipProtocolNum, l3Payload)
-            except NetzobImportException as e:
-                self._logger.warn(
-                    "An error occured while decoding layer2, layer3, layer4 or layer5 of a packet: {0}".
-                    format(e))
+            if state.reassembler is not None and l4Proto == "TCP":
+                # the payload is delivered once its TCP stream is reassembled
+                metadata = (l2Proto, l2SrcAddr, l2DstAddr, l3Proto, l3SrcAddr,
+                            l3DstAddr, l4Proto, l4SrcPort, l4DstPort)
+                for (messageEpoch, messageMetadata,
+                     data) in state.reassembler.addSegment(
+                         epoch, (l3SrcAddr, l4SrcPort),
+                         (l3DstAddr, l4DstPort), l3Payload, metadata):
+                    state.reassembledMessages.append(
+                        L4NetworkMessage(data, messageEpoch, *messageMetadata))
                 return
+
             if len(l4Payload) == 0:
                 return
 
-            l5Message = L4NetworkMessage(
-                l4Payload, epoch, l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
-                l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort, l4DstPort)
-            
-            self.messages.add(l5Message)
+            return (bytes(l4Payload), (l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
+                                       l3SrcAddr, l3DstAddr, l4Proto,
+                                       l4SrcPort, l4DstPort))
 
-    def __decodeLayer2(self, header, payload):
+    def __decodeLayer2(self, datalink, payload):
         """Internal method that parses the specified header and extracts
         layer2 related proprieties."""
-
-        def formatMacAddress(arrayMac):
-            return ":".join("{0:0>2}".format(hex(b)[2:])
-                            for b in arrayMac.tolist())
-
-        if self.datalink == pcapy.DLT_EN10MB:
-            l2Decoder = Decoders.EthDecoder()
-            l2Proto = "Ethernet"
-            layer2 = l2Decoder.decode(payload)
-            l2SrcAddr = formatMacAddress(layer2.get_ether_shost())
-            l2DstAddr = formatMacAddress(layer2.get_ether_dhost())
-            l2Payload = payload[layer2.get_header_size():]
-            etherType = layer2.get_ether_type()
-        elif self.datalink == pcapy.DLT_LINUX_SLL:
-            l2Decoder = Decoders.LinuxSLLDecoder()
-            l2Proto = "Linux SLL"
-            layer2 = l2Decoder.decode(payload)
-            l2SrcAddr = layer2.get_addr()
-            l2DstAddr = None
-            l2Payload = payload[layer2.get_header_size():]
-            etherType = layer2.get_ether_type()
-        elif self.datalink == PCAPImporter.PROTOCOL201:
-            l2Proto = "Protocol 201"
-            hdr = payload.encode('hex')[0:8]
-            if hdr[6:] == "01":
-                l2SrcAddr = "Received"
-            else:
-                l2SrcAddr = "Sent"
-            l2DstAddr = None
-            l2Payload = payload[8:]
-            etherType = payload[4:6]
-
-        return (l2Proto, l2SrcAddr, l2DstAddr, l2Payload, etherType)
+        try:
+            return PCAPReader.decodeLayer2(datalink, payload)
+        except (ValueError, struct.error) as e:
+            raise NetzobImportException("PCAP", str(e), self.INVALID_LAYER2)
 
     def __decodeLayer3(self, etherType, l2Payload):
         """Internal method that parses the specified header and extracts
         layer3 related proprieties."""
-
-        if etherType == Packets.IP.ethertype:
-            l3Proto = "IP"
-            l3Decoder = Decoders.IPDecoder()
-            layer3 = l3Decoder.decode(l2Payload)
-            paddingSize = len(l2Payload) - layer3.get_ip_len()
-
-            l3SrcAddr = layer3.get_ip_src()
-            l3DstAddr = layer3.get_ip_dst()
-            l3Payload = l2Payload[layer3.get_header_size():]
-            if paddingSize > 0 and len(l3Payload) > paddingSize:
-                l3Payload = l3Payload[:len(l3Payload) - paddingSize]
-            ipProtocolNum = layer3.get_ip_p()
-            return (l3Proto, l3SrcAddr, l3DstAddr, l3Payload, ipProtocolNum)
-        else:
+        try:
+            return PCAPReader.decodeLayer3(etherType, l2Payload)
+        except (ValueError, struct.error):
             warnMessage = _("Cannot import one of the provided packets since "
                             + "its layer 3 is unsupported (Only IP is " +
                             "currently supported, packet ethernet " +
@@ -353,24 +452,9 @@ class PCAPImporter(object):
     def __decodeLayer4(self, ipProtocolNum, l3Payload):
         """Internal method that parses the specified header and extracts
         layer4 related proprieties."""
-
-        if ipProtocolNum == Packets.UDP.protocol:
-            l4Proto = "UDP"
-            l4Decoder = Decoders.UDPDecoder()
-            layer4 = l4Decoder.decode(l3Payload)
-            l4SrcPort = layer4.get_uh_sport()
-            l4DstPort = layer4.get_uh_dport()
-            l4Payload = layer4.get_data_as_string()
-            return (l4Proto, l4SrcPort, l4DstPort, l4Payload)
-        elif ipProtocolNum == Packets.TCP.protocol:
-            l4Proto = "TCP"
-            l4Decoder = Decoders.TCPDecoder()
-            layer4 = l4Decoder.decode(l3Payload)
-            l4SrcPort = layer4.get_th_sport()
-            l4DstPort = layer4.get_th_dport()
-            l4Payload = layer4.get_data_as_string()
-            return (l4Proto, l4SrcPort, l4DstPort, l4Payload)
-        else:
+        try:
+            return PCAPReader.decodeLayer4(ipProtocolNum, l3Payload)
+        except (ValueError, struct.error):
             warnMessage = _("Cannot import one of the provided packets since "
                             + "its layer 4 is unsupported (Only UDP and TCP " +
                             "are currently supported, packet IP protocol " +
@@ -410,7 +494,119 @@ class PCAPImporter(object):
         :rtype: a list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
 
-        # Verify the existence of input files
+        # Call the method that does the import job for each PCAP file
+        self.messages = SortedTypedList(AbstractMessage)
+        for message in self.iterMessages(filePathList, bpfFilter, importLayer,
+                                         nbPackets, mergePacketsInFlow):
+            self.messages.add(message)
+
+        return self.messages
+
+    @typeCheck(list, str, int, int, bool)
+    def readStore(self,
+                  filePathList,
+                  bpfFilter="",
+                  importLayer=5,
+                  nbPackets=0,
+                  mergePacketsInFlow=False):
+        """Read all messages from a list of PCAP files in a
+        :class:`MessageStore`. Parameters are the ones of
+        :meth:`readMessages`. Unless flows are merged, packets are directly
+        stored in the columns of the store without instantiating messages,
+        which allows large captures to be kept in memory.
+
+        >>> from netzob.all import *
+        >>> files = ["./test/resources/pcaps/test_import_udp.pcap", "./test/resources/pcaps/test_import_http.pcap"]
+        >>> store = PCAPImporter().readStore(files, importLayer=4)
+        >>> print(len(store))
+        76
+        >>> expected = PCAPImporter.readFiles(files, importLayer=4).values()
+        >>> [(m.date, m.data, m.source, m.destination) for m in store] == [(m.date, m.data, m.source, m.destination) for m in expected]
+        True
+
+        :return: the captured messages ordered by date
+        :rtype: :class:`netzob.Model.Vocabulary.Messages.MessageStore.MessageStore`
+        """
+        self.__checkParameters(filePathList, importLayer, nbPackets)
+
+        store = MessageStore(PCAPImporter.MESSAGE_CLASSES[importLayer])
+        if mergePacketsInFlow:
+            for message in self.__iterMessages(filePathList, bpfFilter,
+                                               importLayer, nbPackets,
+                                               mergePacketsInFlow):
+                store.appendMessage(message)
+        else:
+            for filePath in filePathList:
+                for (epoch, data, attributes) in self._iterDecodedRecords(
+                        filePath, bpfFilter, nbPackets, importLayer):
+                    store.append(data, epoch, attributes)
+        store.sort()
+        return store
+
+    @typeCheck(list, str, int, int, bool)
+    def iterMessages(self,
+                     filePathList,
+                     bpfFilter="",
+                     importLayer=5,
+                     nbPackets=0,
+                     mergePacketsInFlow=False):
+        """Iterate over the messages of a list of PCAP files. Contrary to
+        :meth:`readMessages`, messages are not stored by the importer: they
+        are decoded and yielded one at a time, following their order in
+        the captures, so that large captures can be processed with a
+        bounded memory.
+
+        >>> from netzob.all import *
+        >>> importer = PCAPImporter()
+        >>> messages = importer.iterMessages(["./test/resources/pcaps/test_import_udp.pcap"], nbPackets=4)
+        >>> for message in messages:
+        ...    print(repr(message.data))
+        b'CMDidentify#\\x07\\x00\\x00\\x00Roberto'
+        b'RESidentify#\\x00\\x00\\x00\\x00\\x00\\x00\\x00\\x00'
+        b'CMDinfo#\\x00\\x00\\x00\\x00'
+        b'RESinfo#\\x00\\x00\\x00\\x00\\x04\\x00\\x00\\x00info'
+
+        >>> messages = importer.iterMessages(["./test/resources/pcaps/test_import_http.pcap"], bpfFilter="tcp", importLayer=4)
+        >>> message = next(messages)
+        >>> print(message.l4Protocol, message.l4DestinationAddress)
+        TCP 80
+
+        Each generator keeps its own state, so the same importer can be
+        used by several imports at once.
+
+        >>> files = ["./test/resources/pcaps/test_import_udp.pcap"]
+        >>> layer1 = importer.iterMessages(files, importLayer=1)
+        >>> first = next(layer1)
+        >>> layer4 = importer.iterMessages(files, importLayer=4)
+        >>> print(next(layer4).__class__.__name__, len(importer.readMessages(files, importLayer=3)))
+        L4NetworkMessage 14
+        >>> classes = [m.__class__.__name__ for m in layer1]
+        >>> print(len(classes), set(classes))
+        13 {'L2NetworkMessage'}
+
+        :param filePathList: the PCAP files to read
+        :type filePathList: a list of :class:`str`
+        :param bpfFilter: a string representing a BPF filter.
+        :type bpfFilter: :class:`str`
+        :param importLayer: an integer representing the protocol layer to start importing.
+        :type importLayer: :class:`int`
+        :param nbPackets: the number of packets to import from each file (0 means all the packets)
+        :type nbPackets: :class:`int`
+        :param mergePacketsInFlow: if True, TCP streams are reassembled and consecutive packets with same source and destination are merged
+        :type mergePacketsInFlow: :class:`bool`
+        :return: an iterator over the captured messages
+        :rtype: an iterator of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+
+        self.__checkParameters(filePathList, importLayer, nbPackets)
+        return self.__iterMessages(filePathList, bpfFilter, importLayer,
+                                   nbPackets, mergePacketsInFlow)
+
+    def _checkFiles(self, filePathList):
+        """Verify the specified files can be read.
+
+        :raise: :class:`NetzobImportException` if a file cannot be read
+        """
         errorMessageList = []
         for filePath in filePathList:
             try:
@@ -429,31 +625,64 @@ class PCAPImporter(object):
         if errorMessageList != []:
             raise NetzobImportException("PCAP", "\n".join(errorMessageList))
 
+    def __checkParameters(self, filePathList, importLayer, nbPackets):
+        """Internal method that verifies the parameters of an import."""
+        self._checkFiles(filePathList)
+
         # Verify the expected import layer
         availableLayers = [1, 2, 3, 4, 5]
         if not importLayer in availableLayers:
             raise Exception(
                 "Only layers level {0} are available.".format(availableLayers))
-        self.importLayer = importLayer
 
-        # Call the method that does the import job for each PCAP file
-        self.messages = SortedTypedList(AbstractMessage)
+        if (nbPackets < 0):
+            raise ValueError(
+                "A positive (or null) value is required for the number of packets to read."
+            )
+
+    def __iterMessages(self, filePathList, bpfFilter, importLayer, nbPackets,
+                       mergePacketsInFlow):
+        state = _ImportState(importLayer, mergePacketsInFlow)
+
         for filePath in filePathList:
-            self.__readMessagesFromFile(filePath, bpfFilter, nbPackets)
-        
-        # if requested, we merge consecutive messages that share same source and destination
-        if mergePacketsInFlow:
-            mergedMessages = SortedTypedList(AbstractMessage)
-            previousMessage = None
-            for message in self.messages.values():
-                if previousMessage is not None and message.source == previousMessage.source and message.destination == previousMessage.destination:
-                    previousMessage.data += message.data
-                else:
-                    mergedMessages.add(message)
-                    previousMessage = message
-            self.messages = mergedMessages
-            
-        return self.messages
+            for message in self.__iterMessagesFromFile(state, filePath,
+                                                       bpfFilter, nbPackets):
+                yield message
+
+        # deliver the flows which are still open at the end of the captures
+        if state.flowMessage is not None:
+            yield self.__closeFlow(state)
+        if state.reassembler is not None:
+            for (epoch, metadata, data) in state.reassembler.flush():
+                yield L4NetworkMessage(data, epoch, *metadata)
+
+    def __mergeInFlow(self, state, message):
+        """Internal method that merges a message with the previous one if
+        they share the same source and destination.
+
+        :return: the previous message if its flow is complete, None otherwise
+        """
+        flowMessage = state.flowMessage
+        if flowMessage is not None and message.source == flowMessage.source and message.destination == flowMessage.destination:
+            state.flowData.append(message.data)
+            return None
+
+        completedMessage = None
+        if flowMessage is not None:
+            completedMessage = self.__closeFlow(state)
+        state.flowMessage = message
+        state.flowData = [message.data]
+        return completedMessage
+
+    def __closeFlow(self, state):
+        """Internal method that builds the message of the current flow."""
+        flowMessage = state.flowMessage
+        if len(state.flowData) > 1:
+            flowMessage.data = b"".join(state.flowData)
+        state.flowMessage = None
+        state.flowData = []
+        return flowMessage
+
 
     @staticmethod
     @typeCheck(list, str, int, int, bool)
@@ -528,6 +757,7 @@ class PCAPImporter(object):
         :type importLayer: :class:`int`
         """
 
-        decoder = Decoders.EthDecoder()
-        return decoder.decode(
+        if PCAPImporter.__detailsDecoder is None:
+            PCAPImporter.__detailsDecoder = Decoders.EthDecoder()
+        return PCAPImporter.__detailsDecoder.decode(
             TypeConverter.convert(message.data, HexaString, Raw))
@@ -0,0 +1,591 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+import mmap
+import socket
+import struct
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+
+
+@NetzobLogger
+class PCAPReader(object):
+    """A capture reader which does not depend on libpcap.
+
+    The capture file (pcap or pcapng) is memory-mapped and its records
+    are walked over the mapping: each record is returned as a tuple
+    (timestamp, link type, frame) where the frame is a memoryview on the
+    mapped file, so no copy of the packet is made until the caller needs
+    one.
+
+    >>> from netzob.all import *
+    >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcap") as reader:
+    ...     print(reader.datalink)
+    ...     for (timestamp, datalink, frame) in reader:
+    ...         (l2Proto, l2SrcAddr, l2DstAddr, l2Payload, etherType) = PCAPReader.decodeLayer2(datalink, frame)
+    ...         (l3Proto, l3SrcAddr, l3DstAddr, l3Payload, ipProtocolNum) = PCAPReader.decodeLayer3(etherType, l2Payload)
+    ...         (l4Proto, l4SrcPort, l4DstPort, l4Payload) = PCAPReader.decodeLayer4(ipProtocolNum, l3Payload)
+    ...         print(l3SrcAddr, l4SrcPort, l3DstAddr, l4DstPort, bytes(l4Payload[:12]))
+    ...         break
+    1
+    127.0.0.1 57831 127.0.0.1 4242 b'CMDidentify#'
+
+    The pcapng format is also supported.
+
+    >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcapng") as reader:
+    ...     records = [(timestamp, bytes(frame)) for (timestamp, datalink, frame) in reader]
+    >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcap") as reader:
+    ...     records == [(timestamp, bytes(frame)) for (timestamp, datalink, frame) in reader]
+    True
+
+    """
+
+    # Link types (see http://www.tcpdump.org/linktypes.html)
+    LINKTYPE_ETHERNET = 1
+    LINKTYPE_RAW = 101
+    LINKTYPE_LINUX_SLL = 113
+    LINKTYPE_PROTOCOL201 = 201
+
+    ETHERTYPE_IP = 0x0800
+    ETHERTYPE_IPV6 = 0x86DD
+    ETHERTYPE_VLAN = (0x8100, 0x88A8, 0x9100)
+
+    IP_PROTOCOL_TCP = 6
+    IP_PROTOCOL_UDP = 17
+
+    # IPv6 extension headers that can precede the transport layer
+    IPV6_EXTENSION_HEADERS = (0, 43, 60)
+    IPV6_FRAGMENT_HEADER = 44
+
+    PCAP_HEADER_SIZE = 24
+    PCAP_MAGIC_USEC = 0xa1b2c3d4
+    PCAP_MAGIC_NSEC = 0xa1b23c4d
+    PCAPNG_BLOCK_SHB = 0x0A0D0D0A
+    PCAPNG_BLOCK_IDB = 0x00000001
+    PCAPNG_BLOCK_PB = 0x00000002
+    PCAPNG_BLOCK_SPB = 0x00000003
+    PCAPNG_BLOCK_EPB = 0x00000006
+    PCAPNG_BYTE_ORDER_MAGIC = 0x1A2B3C4D
+    PCAPNG_OPTION_TSRESOL = 9
+
+    # Precompiled headers of the decoded protocols
+    ETHERNET_HEADER = struct.Struct("!6s6sH")
+    SLL_HEADER = struct.Struct("!HHH8sH")
+    IPV4_HEADER = struct.Struct("!BBHHHBBH4s4s")
+    IPV6_HEADER = struct.Struct("!IHBB16s16s")
+    IPV6_EXTENSION_HEADER = struct.Struct("!BB")
+    UDP_HEADER = struct.Struct("!HHHH")
+    TCP_HEADER = struct.Struct("!HHIIBB")
+
+    # Ethernet and IPv4 headers decoded at once by the fast path, followed
+    # by the ports of the transport layer
+    ETHERNET_IPV4_HEADER = struct.Struct("!6s6sHBBHHHBBH4s4s")
+    PORTS_HEADER = struct.Struct("!HH")
+    TRANSPORT_PROTOCOLS = {IP_PROTOCOL_TCP: "TCP", IP_PROTOCOL_UDP: "UDP"}
+
+    # Textual form of each byte value
+    HEX_BYTES = tuple("{0:02x}".format(b) for b in range(256))
+
+    # Textual forms of the addresses already formatted, indexed by their
+    # binary forms, so that the addresses of the messages share the same
+    # strings. The cache is emptied once it reaches its maximum size.
+    MAX_CACHED_ADDRESSES = 65536
+    __addresses = dict()
+
+    @typeCheck(str, int, int)
+    def __init__(self, filePath, start=None, end=None):
+        """Open and map the specified capture file.
+
+        :parameter filePath: the path of the capture (pcap or pcapng) to read
+        :type filePath: :class:`str`
+        :keyword start: for pcap files, the offset of the first record to read (as given by :meth:`splitRecords`)
+        :type start: :class:`int`
+        :keyword end: for pcap files, the offset where the reading stops
+        :type end: :class:`int`
+        :raise: ValueError if the file is not a valid capture
+        """
+        if filePath is None:
+            raise TypeError("filePath cannot be None")
+
+        self.filePath = filePath
+        self.__start = start
+        self.__end = end
+        self.__fd = open(filePath, 'rb')
+        try:
+            self.__map = mmap.mmap(
+                self.__fd.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            self.__fd.close()
+            raise ValueError("The file {0} is not a valid capture".format(
+                filePath))
+        self.__data = memoryview(self.__map)
+
+        try:
+            self.__readFileHeader()
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError("The file {0} is not a valid capture".format(
+                filePath))
+
+    def __readFileHeader(self):
+        """Identify the format of the capture and read its global header."""
+        (magic, ) = struct.unpack_from("<I", self.__data, 0)
+
+        if magic == PCAPReader.PCAPNG_BLOCK_SHB:
+            self.__isPcapng = True
+            self.__interfaces = []
+            self.__readSectionHeader(0)
+            # the link type of the capture is the one of its first interface
+            self.__datalink = None
+            for (blockType, offset, body) in self.__blocks():
+                if blockType == PCAPReader.PCAPNG_BLOCK_IDB:
+                    self.__datalink = self.__readInterface(body)[0]
+                    break
+            self.__interfaces = []
+            return
+
+        for endianness in ("<", ">"):
+            (magic, ) = struct.unpack_from(endianness + "I", self.__data, 0)
+            if magic in (PCAPReader.PCAP_MAGIC_USEC,
+                         PCAPReader.PCAP_MAGIC_NSEC):
+                break
+        else:
+            raise ValueError("Unknown capture format")
+
+        self.__isPcapng = False
+        self.__endianness = endianness
+        if magic == PCAPReader.PCAP_MAGIC_NSEC:
+            self.__ticksPerSecond = 1000000000
+        else:
+            self.__ticksPerSecond = 1000000
+        (self.__datalink, ) = struct.unpack_from(endianness + "I", self.__data,
+                                                 20)
+        self.__recordHeader = struct.Struct(endianness + "IIII")
+
+    def __readSectionHeader(self, offset):
+        """Read the byte order of a pcapng section starting at the specified offset."""
+        for endianness in ("<", ">"):
+            (byteOrderMagic, ) = struct.unpack_from(endianness + "I",
+                                                    self.__data, offset + 8)
+            if byteOrderMagic == PCAPReader.PCAPNG_BYTE_ORDER_MAGIC:
+                break
+        else:
+            raise ValueError("Invalid pcapng section header")
+        self.__endianness = endianness
+        self.__blockHeader = struct.Struct(endianness + "II")
+
+    def __readInterface(self, body):
+        """Returns the link type and the timestamp resolution (in ticks per
+        second) of an interface description block."""
+        endianness = self.__endianness
+        (linktype, ) = struct.unpack_from(endianness + "H", body, 0)
+        ticksPerSecond = 1000000
+
+        # walk the options of the interface
+        offset = 8
+        while offset + 4 <= len(body):
+            (code, length) = struct.unpack_from(endianness + "HH", body,
+                                                offset)
+            if code == 0:
+                break
+            if code == PCAPReader.PCAPNG_OPTION_TSRESOL and length >= 1:
+                value = body[offset + 4]
+                if value & 0x80:
+                    ticksPerSecond = 2**(value & 0x7f)
+                else:
+                    ticksPerSecond = 10**value
+            offset += 4 + ((length + 3) & ~3)
+
+        return (linktype, ticksPerSecond)
+
+    def __blocks(self):
+        """Iterate over the blocks of a pcapng capture."""
+        data = self.__data
+        size = len(data)
+        offset = 0
+        while offset + 12 <= size:
+            (blockType, blockLength) = self.__blockHeader.unpack_from(data,
+                                                                      offset)
+            if blockType == PCAPReader.PCAPNG_BLOCK_SHB:
+                self.__readSectionHeader(offset)
+                (blockType,
+                 blockLength) = self.__blockHeader.unpack_from(data, offset)
+                self.__interfaces = []
+            if blockLength < 12 or offset + blockLength > size:
+                self._logger.warn("Truncated block found in {0}".format(
+                    self.filePath))
+                return
+            yield (blockType, offset, data[offset + 8:offset + blockLength - 4])
+            offset += blockLength
+
+    def __iter__(self):
+        """Iterate over the records of the capture.
+
+        :return: an iterator of tuples (timestamp, link type, frame)
+        :rtype: an iterator of (:class:`float`, :class:`int`, :class:`memoryview`)
+        """
+        if self.__isPcapng:
+            return self.__iterPcapng()
+        return self.__iterPcap()
+
+    def __iterPcap(self):
+        data = self.__data
+        size = len(data)
+        header = self.__recordHeader
+        headerSize = header.size
+        ticksPerSecond = self.__ticksPerSecond
+        datalink = self.__datalink
+
+        offset = PCAPReader.PCAP_HEADER_SIZE
+        if self.__start is not None:
+            offset = max(offset, self.__start)
+        end = size
+        if self.__end is not None:
+            end = min(end, self.__end)
+
+        while offset + headerSize <= end:
+            (secs, fraction, capLen, origLen) = header.unpack_from(data,
+                                                                   offset)
+            offset += headerSize
+            if offset + capLen > size:
+                self._logger.warn("Truncated record found in {0}".format(
+                    self.filePath))
+                return
+            yield (secs + fraction / ticksPerSecond, datalink,
+                   data[offset:offset + capLen])
+            offset += capLen
+
+    def __iterPcapng(self):
+        interfaces = self.__interfaces = []
+        for (blockType, offset, body) in self.__blocks():
+            interfaces = self.__interfaces
+            if blockType == PCAPReader.PCAPNG_BLOCK_EPB:
+                (interfaceId, high, low, capLen) = struct.unpack_from(
+                    self.__endianness + "IIII", body, 0)
+                (linktype, ticksPerSecond) = interfaces[interfaceId]
+                yield (self.__timestamp((high << 32) | low, ticksPerSecond),
+                       linktype,
+                       body[20:20 + capLen])
+            elif blockType == PCAPReader.PCAPNG_BLOCK_IDB:
+                interfaces.append(self.__readInterface(body))
+            elif blockType == PCAPReader.PCAPNG_BLOCK_SPB:
+                (origLen, ) = struct.unpack_from(self.__endianness + "I",
+                                                 body, 0)
+                (linktype, ticksPerSecond) = interfaces[0]
+                yield (0.0, linktype, body[4:4 + min(origLen, len(body) - 4)])
+            elif blockType == PCAPReader.PCAPNG_BLOCK_PB:
+                (interfaceId, drops, high, low, capLen) = struct.unpack_from(
+                    self.__endianness + "HHIII", body, 0)
+                (linktype, ticksPerSecond) = interfaces[interfaceId]
+                yield (self.__timestamp((high << 32) | low, ticksPerSecond),
+                       linktype,
+                       body[20:20 + capLen])
+
+    @staticmethod
+    def __timestamp(ticks, ticksPerSecond):
+        (secs, fraction) = divmod(ticks, ticksPerSecond)
+        return secs + fraction / ticksPerSecond
+
+    @typeCheck(int)
+    def splitRecords(self, chunkSize):
+        """Split the records of a pcap file in parts of about chunkSize
+        bytes. Parts never split a record, so that each of them can be read
+        independently with the start and end parameters of the reader.
+        A pcapng capture is not split.
+
+        >>> from netzob.all import *
+        >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcap") as reader:
+        ...     parts = reader.splitRecords(400)
+        >>> parts
+        [(24, 482), (482, 889), (889, 1114)]
+        >>> nbRecords = 0
+        >>> for (start, end) in parts:
+        ...     with PCAPReader("./test/resources/pcaps/test_import_udp.pcap", start, end) as reader:
+        ...         nbRecords += len(list(reader))
+        >>> nbRecords
+        14
+
+        :parameter chunkSize: the approximative size (in bytes) of each part
+        :type chunkSize: :class:`int`
+        :return: a list of (start, end) offsets or [(None, None)] if the capture cannot be split
+        :rtype: a list of tuples (:class:`int`, :class:`int`)
+        """
+        if chunkSize is None or chunkSize <= 0:
+            raise ValueError("The chunk size must be greater than 0")
+        if self.__isPcapng:
+            return [(None, None)]
+
+        data = self.__data
+        size = len(data)
+        header = self.__recordHeader
+        headerSize = header.size
+
+        parts = []
+        start = offset = PCAPReader.PCAP_HEADER_SIZE
+        while offset + headerSize <= size:
+            (secs, fraction, capLen, origLen) = header.unpack_from(data,
+                                                                   offset)
+            offset = min(size, offset + headerSize + capLen)
+            if offset - start >= chunkSize:
+                parts.append((start, offset))
+                start = offset
+        if start < size:
+            parts.append((start, size))
+        return parts
+
+    def close(self):
+        """Release the mapping of the capture file."""
+        if self.__data is not None:
+            self.__data.release()
+            self.__data = None
+        try:
+            self.__map.close()
+        except BufferError:
+            # some frames are still referenced, the mapping is released
+            # once they are garbage collected
+            pass
+        self.__fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def datalink(self):
+        """The link type of the capture (for pcapng files, the link type
+        of the first interface).
+
+        :type: :class:`int`
+        """
+        return self.__datalink
+
+    @staticmethod
+    def formatMacAddress(address):
+        """Returns the textual form of a MAC address.
+
+        >>> from netzob.all import *
+        >>> PCAPReader.formatMacAddress(b"\\x00\\x1b\\x21\\x0a\\xfe\\x01")
+        '00:1b:21:0a:fe:01'
+        """
+        text = PCAPReader.__addresses.get(address)
+        if text is None:
+            text = ":".join([PCAPReader.HEX_BYTES[b] for b in address])
+            PCAPReader.__cacheAddress(address, text)
+        return text
+
+    @staticmethod
+    def formatIPAddress(address):
+        """Returns the textual form of an IPv4 or IPv6 address.
+
+        >>> from netzob.all import *
+        >>> PCAPReader.formatIPAddress(b"\\xc0\\xa8\\x00\\x01")
+        '192.168.0.1'
+        >>> PCAPReader.formatIPAddress(b"\\xfe\\x80" + b"\\x00" * 13 + b"\\x01")
+        'fe80::1'
+        """
+        text = PCAPReader.__addresses.get(address)
+        if text is None:
+            if len(address) == 4:
+                text = socket.inet_ntoa(address)
+            else:
+                text = socket.inet_ntop(socket.AF_INET6, address)
+            PCAPReader.__cacheAddress(address, text)
+        return text
+
+    @staticmethod
+    def __cacheAddress(address, text):
+        if len(PCAPReader.__addresses) >= PCAPReader.MAX_CACHED_ADDRESSES:
+            PCAPReader.__addresses.clear()
+        PCAPReader.__addresses[address] = text
+
+    @staticmethod
+    def decodeEthernetIPv4(frame):
+        """Decode at once the headers of an Ethernet frame carrying an
+        IPv4 packet with a TCP or UDP segment, which is the most common
+        case. It avoids the creation of the intermediate payloads of
+        :meth:`decodeLayer2`, :meth:`decodeLayer3` and :meth:`decodeLayer4`.
+
+        >>> from netzob.all import *
+        >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcap") as reader:
+        ...     (timestamp, datalink, frame) = next(iter(reader))
+        ...     decoded = PCAPReader.decodeEthernetIPv4(frame)
+        ...     print(decoded[:9], bytes(decoded[11]))
+        ('Ethernet', '00:00:00:00:00:00', '00:00:00:00:00:00', 'IP', '127.0.0.1', '127.0.0.1', 'UDP', 57831, 4242) b'CMDidentify#\\x07\\x00\\x00\\x00Roberto'
+
+        :return: a tuple (l2Proto, l2SrcAddr, l2DstAddr, l3Proto, l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort, l4DstPort, l2Payload, l3Payload, l4Payload), or None if the frame does not match this stack (it must then be decoded layer by layer)
+        """
+        try:
+            (dstAddr, srcAddr, etherType, versionIhl, tos, totalLength,
+             identification, fragment, ttl, protocol, checksum, ipSrcAddr,
+             ipDstAddr) = PCAPReader.ETHERNET_IPV4_HEADER.unpack_from(frame, 0)
+        except struct.error:
+            return None
+        l4Proto = PCAPReader.TRANSPORT_PROTOCOLS.get(protocol)
+        if etherType != PCAPReader.ETHERTYPE_IP or l4Proto is None:
+            return None
+
+        start = PCAPReader.ETHERNET_HEADER.size
+        offset = start + (versionIhl & 0x0f) * 4
+        end = len(frame)
+        if offset < start + totalLength < end:
+            end = start + totalLength
+        if protocol == PCAPReader.IP_PROTOCOL_UDP:
+            if end - offset < PCAPReader.UDP_HEADER.size:
+                return None
+            dataOffset = PCAPReader.UDP_HEADER.size
+        else:
+            if end - offset < PCAPReader.TCP_HEADER.size:
+                return None
+            dataOffset = (frame[offset + 12] >> 4) * 4
+        (srcPort, dstPort) = PCAPReader.PORTS_HEADER.unpack_from(frame,
+                                                                 offset)
+
+        addresses = PCAPReader.__addresses
+        l2SrcAddr = addresses.get(srcAddr) or PCAPReader.formatMacAddress(
+            srcAddr)
+        l2DstAddr = addresses.get(dstAddr) or PCAPReader.formatMacAddress(
+            dstAddr)
+        l3SrcAddr = addresses.get(ipSrcAddr) or PCAPReader.formatIPAddress(
+            ipSrcAddr)
+        l3DstAddr = addresses.get(ipDstAddr) or PCAPReader.formatIPAddress(
+            ipDstAddr)
+        return ("Ethernet", l2SrcAddr, l2DstAddr, "IP", l3SrcAddr, l3DstAddr,
+                l4Proto, srcPort, dstPort, frame[start:], frame[offset:end],
+                frame[offset + dataOffset:end])
+
+    @staticmethod
+    def decodeLayer2(datalink, frame):
+        """Decode the layer 2 header of a frame.
+
+        :return: a tuple (l2Proto, l2SrcAddr, l2DstAddr, l2Payload, etherType)
+        :raise: ValueError if the link type is not supported
+        """
+        if datalink == PCAPReader.LINKTYPE_ETHERNET:
+            (dstAddr, srcAddr,
+             etherType) = PCAPReader.ETHERNET_HEADER.unpack_from(frame, 0)
+            offset = PCAPReader.ETHERNET_HEADER.size
+            # skip the VLAN tags
+            while etherType in PCAPReader.ETHERTYPE_VLAN:
+                (etherType, ) = struct.unpack_from("!H", frame, offset + 2)
+                offset += 4
+            return ("Ethernet", PCAPReader.formatMacAddress(srcAddr),
+                    PCAPReader.formatMacAddress(dstAddr), frame[offset:],
+                    etherType)
+        elif datalink == PCAPReader.LINKTYPE_LINUX_SLL:
+            (packetType, arphdr, addrLen, addr,
+             etherType) = PCAPReader.SLL_HEADER.unpack_from(frame, 0)
+            return ("Linux SLL", addr, None,
+                    frame[PCAPReader.SLL_HEADER.size:], etherType)
+        elif datalink == PCAPReader.LINKTYPE_PROTOCOL201:
+            if frame[3] == 0x01:
+                srcAddr = "Received"
+            else:
+                srcAddr = "Sent"
+            (etherType, ) = struct.unpack_from("!H", frame, 4)
+            return ("Protocol 201", srcAddr, None, frame[8:], etherType)
+        else:
+            raise ValueError(
+                "Unsupported link type ({0})".format(datalink))
+
+    @staticmethod
+    def decodeLayer3(etherType, l2Payload):
+        """Decode the IPv4 or IPv6 header of a layer 2 payload. The padding
+        found after the IP packet is removed from the returned payload.
+
+        :return: a tuple (l3Proto, l3SrcAddr, l3DstAddr, l3Payload, ipProtocolNum)
+        :raise: ValueError if the network protocol is not supported
+        """
+        if etherType == PCAPReader.ETHERTYPE_IP:
+            (versionIhl, tos, totalLength, identification, fragment, ttl,
+             protocol, checksum, srcAddr,
+             dstAddr) = PCAPReader.IPV4_HEADER.unpack_from(l2Payload, 0)
+            headerSize = (versionIhl & 0x0f) * 4
+            end = len(l2Payload)
+            if headerSize < totalLength < end:
+                end = totalLength
+            return ("IP", PCAPReader.formatIPAddress(srcAddr),
+                    PCAPReader.formatIPAddress(dstAddr),
+                    l2Payload[headerSize:end], protocol)
+        elif etherType == PCAPReader.ETHERTYPE_IPV6:
+            (versionClassLabel, payloadLength, nextHeader, hopLimit, srcAddr,
+             dstAddr) = PCAPReader.IPV6_HEADER.unpack_from(l2Payload, 0)
+            offset = PCAPReader.IPV6_HEADER.size
+            end = min(len(l2Payload), offset + payloadLength)
+            while nextHeader in PCAPReader.IPV6_EXTENSION_HEADERS or nextHeader == PCAPReader.IPV6_FRAGMENT_HEADER:
+                (followingHeader,
+                 length) = PCAPReader.IPV6_EXTENSION_HEADER.unpack_from(
+                     l2Payload, offset)
+                if nextHeader == PCAPReader.IPV6_FRAGMENT_HEADER:
+                    offset += 8
+                else:
+                    offset += (length + 1) * 8
+                nextHeader = followingHeader
+            return ("IPv6", PCAPReader.formatIPAddress(srcAddr),
+                    PCAPReader.formatIPAddress(dstAddr),
+                    l2Payload[offset:end], nextHeader)
+        else:
+            raise ValueError(
+                "Unsupported layer 3 (ethernet type = {0})".format(etherType))
+
+    @staticmethod
+    def decodeLayer4(ipProtocolNum, l3Payload):
+        """Decode the UDP or TCP header of a layer 3 payload.
+
+        :return: a tuple (l4Proto, l4SrcPort, l4DstPort, l4Payload)
+        :raise: ValueError if the transport protocol is not supported
+        """
+        if ipProtocolNum == PCAPReader.IP_PROTOCOL_UDP:
+            (srcPort, dstPort, length,
+             checksum) = PCAPReader.UDP_HEADER.unpack_from(l3Payload, 0)
+            return ("UDP", srcPort, dstPort,
+                    l3Payload[PCAPReader.UDP_HEADER.size:])
+        elif ipProtocolNum == PCAPReader.IP_PROTOCOL_TCP:
+            (srcPort, dstPort, seq, ack, dataOffset,
+             flags) = PCAPReader.TCP_HEADER.unpack_from(l3Payload, 0)
+            return ("TCP", srcPort, dstPort, l3Payload[(dataOffset >> 4) * 4:])
+        else:
+            raise ValueError("Unsupported layer 4 (IP protocol number = {0})".
+                             format(ipProtocolNum))
@@ -0,0 +1,305 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+import multiprocessing
+import os
+import time
+from array import array
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+from netzob.Common.Utils.SortedTypedList import SortedTypedList
+from netzob.Import.PCAPImporter.PCAPImporter import PCAPImporter
+from netzob.Import.PCAPImporter.PCAPReader import PCAPReader
+from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+
+
+def _executeImport(arg, **kwargs):
+    """Wrapper used to import a capture (or a part of a capture) using a
+    pool of threads. It returns the decoded records as a batch of
+    columns (see :meth:`ParallelPCAPImporter._toBatch`).
+    """
+    (filePath, start, end, bpfFilter, importLayer, nbPackets,
+     mergePacketsInFlow) = arg
+    importer = PCAPImporter()
+    if mergePacketsInFlow:
+        messages = importer.iterMessages([filePath], bpfFilter, importLayer,
+                                         nbPackets, mergePacketsInFlow)
+        records = ParallelPCAPImporter._toRecords(messages, importLayer)
+    else:
+        records = importer._iterDecodedRecords(
+            filePath, bpfFilter, nbPackets, importLayer, start, end)
+    return ParallelPCAPImporter._toBatch(records)
+
+
+@NetzobLogger
+class ParallelPCAPImporter(object):
+    """Import messages from a list of PCAP files using a pool of threads.
+
+    Each file is decoded by a separate thread. Large pcap files are split
+    in parts (at record boundaries) which are also decoded separately.
+    Threads return their messages as compact batches of columns which are
+    merged following the date of the messages.
+
+    >>> from netzob.all import *
+    >>> from netzob.Import.PCAPImporter.ParallelPCAPImporter import ParallelPCAPImporter
+    >>> files = ["./test/resources/pcaps/test_import_udp.pcap", "./test/resources/pcaps/test_import_http.pcap"]
+    >>> importer = ParallelPCAPImporter(nbThread=2, chunkSize=4096)
+    >>> messages = importer.readMessages(files).values()
+    >>> print(len(messages))
+    76
+    >>> expected = PCAPImporter.readFiles(files).values()
+    >>> sorted((m.date, m.data, m.source, m.destination) for m in messages) == sorted((m.date, m.data, m.source, m.destination) for m in expected)
+    True
+    >>> all(messages[i].date <= messages[i + 1].date for i in range(len(messages) - 1))
+    True
+
+    The import layer, the number of packets, BPF filters and flows merging
+    are supported as with :class:`PCAPImporter`. Files are not split when
+    one of the two latter parameters is used and flows are not merged
+    across files.
+
+    >>> messages = ParallelPCAPImporter.readFiles(files, bpfFilter="udp", importLayer=4, nbThread=2).values()
+    >>> print(len(messages))
+    14
+    >>> print(messages[0].l4Protocol, messages[0].source, messages[0].destination)
+    UDP 127.0.0.1:57831 127.0.0.1:4242
+
+    Files which cannot be read are reported before any of them is imported.
+
+    >>> ParallelPCAPImporter.readFiles(["/nonexistent.pcap"])
+    Traceback (most recent call last):
+    ...
+    netzob.Common.NetzobException.NetzobImportException: Error while importing data from source PCAP: Error while trying to open the file /nonexistent.pcap.
+
+    """
+
+    # default size (in bytes) of the parts of the files decoded by each thread
+    DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, nbThread=None, chunkSize=DEFAULT_CHUNK_SIZE):
+        """Constructor.
+
+        :keyword nbThread: the maximum number of thread that will be used.
+        :type nbThread: :class:`int`
+        :keyword chunkSize: the size (in bytes) above which a pcap file is split in parts decoded by separate threads.
+        :type chunkSize: :class:`int`
+        """
+        self.nbThread = nbThread
+        self.chunkSize = chunkSize
+
+    @typeCheck(list, str, int, int, bool)
+    def readMessages(self,
+                     filePathList,
+                     bpfFilter="",
+                     importLayer=5,
+                     nbPackets=0,
+                     mergePacketsInFlow=False):
+        """Read all messages from a list of PCAP files.
+        Parameters are the ones of :meth:`PCAPImporter.readMessages`.
+
+        :return: the captured messages ordered by date
+        :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+        if filePathList is None:
+            raise TypeError("filePathList cannot be None")
+        if importLayer not in [1, 2, 3, 4, 5]:
+            raise ValueError("Only layers level 1 to 5 are available.")
+        if nbPackets < 0:
+            raise ValueError(
+                "A positive (or null) value is required for the number of packets to read."
+            )
+        PCAPImporter()._checkFiles(filePathList)
+
+        # Measure start time
+        start = time.time()
+
+        # Create the tasks
+        tasks = []
+        for filePath in filePathList:
+            parts = [(None, None)]
+            if bpfFilter == "" and nbPackets == 0 and not mergePacketsInFlow and os.path.getsize(
+                    filePath) > self.chunkSize:
+                with PCAPReader(filePath) as reader:
+                    parts = reader.splitRecords(self.chunkSize)
+            for (partStart, partEnd) in parts:
+                tasks.append((filePath, partStart, partEnd, bpfFilter,
+                              importLayer, nbPackets, mergePacketsInFlow))
+
+        # Create a pool of 'nbThead' threads (process)
+        pool = multiprocessing.Pool(self.nbThread)
+        try:
+            batches = pool.map(_executeImport, tasks)
+        finally:
+            pool.close()
+            pool.join()
+
+        messages = SortedTypedList(AbstractMessage)
+        messages.addAll(list(self.__iterBatches(batches, importLayer)))
+
+        self._logger.debug(
+            "Import of {0} messages from {1} parts took {2}s with {3} threads.".
+            format(len(messages), len(tasks), time.time() - start,
+                   self.nbThread))
+        return messages
+
+    @staticmethod
+    def _toRecords(messages, importLayer):
+        """Convert messages into tuples (epoch, data, attributes) as given
+        by :meth:`PCAPImporter._iterDecodedRecords`."""
+        for message in messages:
+            attributes = (message.l2Protocol, message.l2SourceAddress,
+                          message.l2DestinationAddress)
+            if importLayer > 2:
+                attributes += (message.l3Protocol, message.l3SourceAddress,
+                               message.l3DestinationAddress)
+            if importLayer > 3:
+                attributes += (message.l4Protocol, message.l4SourceAddress,
+                               message.l4DestinationAddress)
+            yield (message.date, message.data, attributes)
+
+    @staticmethod
+    def _toBatch(records):
+        """Store decoded records in columns: their dates, the
+        concatenation of their data with the end offset of each record,
+        and their network attributes which are given as indexes in a table
+        of the distinct attribute values.
+
+        :return: a tuple (dates, ends, data, attributeIndexes, attributeTable)
+        """
+        dates = array('d')
+        ends = array('Q')
+        chunks = []
+        attributeIndexes = array('I')
+        attributeTable = []
+        attributePositions = dict()
+
+        size = 0
+        for (epoch, data, attributes) in records:
+            position = attributePositions.get(attributes)
+            if position is None:
+                position = attributePositions[attributes] = len(
+                    attributeTable)
+                attributeTable.append(attributes)
+
+            size += len(data)
+            dates.append(epoch)
+            ends.append(size)
+            chunks.append(data)
+            attributeIndexes.append(position)
+
+        return (dates, ends, b"".join(chunks), attributeIndexes,
+                attributeTable)
+
+    def __iterBatches(self, batches, importLayer):
+        """Create the messages of the batches, in the order of the tasks.
+        They are ordered by date when added to the sorted list."""
+        messageClass = PCAPImporter.MESSAGE_CLASSES[importLayer]
+
+        for (dates, ends, data, attributeIndexes, attributeTable) in batches:
+            begin = 0
+            for i in range(len(dates)):
+                yield messageClass(data[begin:ends[i]], dates[i],
+                                   *attributeTable[attributeIndexes[i]])
+                begin = ends[i]
+
+    @staticmethod
+    @typeCheck(list, str, int, int, bool, int)
+    def readFiles(filePathList,
+                  bpfFilter="",
+                  importLayer=5,
+                  nbPackets=0,
+                  mergePacketsInFlow=False,
+                  nbThread=None):
+        """Read all messages from a list of PCAP files using a pool of
+        threads. Parameters are the ones of :meth:`PCAPImporter.readFiles`.
+
+        :keyword nbThread: the maximum number of thread that will be used.
+        :type nbThread: :class:`int`
+        :return: the captured messages ordered by date
+        :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+        importer = ParallelPCAPImporter(nbThread=nbThread)
+        return importer.readMessages(filePathList, bpfFilter, importLayer,
+                                     nbPackets, mergePacketsInFlow)
+
+    @property
+    def nbThread(self):
+        """The nbThread represents the maximum number of thread that will be started
+        in the same time to import the files.
+
+        If set to None, the number of thread will be automaticaly set to the number
+        of available cpu.
+
+        :type: :class:`int`
+        """
+        return self.__nbThread
+
+    @nbThread.setter
+    @typeCheck(int)
+    def nbThread(self, nbThread):
+        if nbThread is None:
+            nbThread = multiprocessing.cpu_count()
+
+        if nbThread <= 0:
+            raise ValueError(
+                "NbThread must be >0, use None to specify you don't know.")
+
+        self.__nbThread = nbThread
+
+    @property
+    def chunkSize(self):
+        """The size (in bytes) above which a pcap file is split in parts
+        decoded by separate threads.
+
+        :type: :class:`int`
+        """
+        return self.__chunkSize
+
+    @chunkSize.setter
+    @typeCheck(int)
+    def chunkSize(self, chunkSize):
+        if chunkSize is None:
+            raise TypeError("ChunkSize cannot be None")
+        if chunkSize <= 0:
+            raise ValueError("ChunkSize must be >0")
+        self.__chunkSize = chunkSize
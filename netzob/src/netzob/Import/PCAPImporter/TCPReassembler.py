@@ -0,0 +1,309 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+import struct
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger
+
+
+class TCPStream(object):
+    """The state of one direction of a TCP connection: the next expected
+    sequence number, the contiguous data received so far and the
+    segments received after a gap."""
+
+    def __init__(self, nextSeq):
+        self.nextSeq = nextSeq
+        self.buffer = bytearray()
+        self.epoch = None
+        self.metadata = None
+        # segments received ahead of nextSeq, indexed by sequence number
+        self.pending = dict()
+        self.pendingSize = 0
+        self.finished = False
+
+
+@NetzobLogger
+class TCPReassembler(object):
+    """Reassemble the application data exchanged over TCP connections.
+
+    Segments are given in their capture order. Each direction of a
+    connection (identified by its source and destination endpoints) is
+    reassembled following the sequence numbers: retransmitted data is
+    discarded and out of order segments are kept until the missing data
+    is received. The reassembled data of a direction is delivered as a
+    message when the sender sets the PSH or FIN flag, or when the other
+    side of the connection starts sending data. If some data never
+    appears in the capture, the gap is skipped when the message is
+    delivered.
+
+    Each delivered message is a tuple (epoch, metadata, data) where the
+    epoch and the metadata are the ones given with the first segment of
+    the message.
+
+    >>> import struct
+    >>> from netzob.all import *
+    >>> def segment(seq, flags, data=b""):
+    ...     return struct.pack("!HHIIBBHHH", 4242, 80, seq, 0, 5 << 4, flags, 0, 0, 0) + data
+    >>> client, server = ("10.0.0.1", 4242), ("10.0.0.2", 80)
+    >>> reassembler = TCPReassembler()
+    >>> reassembler.addSegment(0.0, client, server, segment(99, TCPReassembler.FLAG_SYN))
+    []
+    >>> reassembler.addSegment(0.1, client, server, segment(100, 0, b"GET / "))
+    []
+    >>> reassembler.addSegment(0.3, client, server, segment(110, TCPReassembler.FLAG_PSH, b"\\r\\n\\r\\n"))
+    []
+    >>> reassembler.addSegment(0.4, client, server, segment(100, 0, b"GET / "))
+    []
+    >>> reassembler.addSegment(0.2, client, server, segment(106, 0, b"HTTP"))
+    [(0.1, None, b'GET / HTTP\\r\\n\\r\\n')]
+    >>> reassembler.addSegment(0.5, server, client, segment(500, 0, b"HTTP/1.1 "))
+    []
+    >>> reassembler.addSegment(0.6, server, client, segment(513, 0, b"OK"))
+    []
+    >>> reassembler.flush()
+    [(0.5, None, b'HTTP/1.1 OK')]
+
+    """
+
+    FLAG_FIN = 0x01
+    FLAG_SYN = 0x02
+    FLAG_RST = 0x04
+    FLAG_PSH = 0x08
+
+    SEQ_MODULO = 1 << 32
+    SEQ_MASK = SEQ_MODULO - 1
+    SEQ_HALF = 1 << 31
+
+    # maximum number of bytes kept after a gap before the gap is skipped
+    MAX_PENDING_SIZE = 1 << 20
+
+    TCP_HEADER = struct.Struct("!HHIIBB")
+
+    def __init__(self):
+        # streams indexed by (source, destination)
+        self.__streams = dict()
+        # last direction which sent data on each connection
+        self.__lastSender = dict()
+
+    def addSegment(self, epoch, source, destination, segment, metadata=None):
+        """Process a TCP segment.
+
+        :parameter epoch: the capture date of the segment
+        :type epoch: :class:`float`
+        :parameter source: the source endpoint (address, port) of the segment
+        :type source: :class:`tuple`
+        :parameter destination: the destination endpoint (address, port) of the segment
+        :type destination: :class:`tuple`
+        :parameter segment: the TCP segment (header and payload)
+        :type segment: :class:`bytes` or :class:`memoryview`
+        :keyword metadata: data attached to the messages starting with this segment
+        :return: the messages completed by this segment
+        :rtype: a list of tuples (epoch, metadata, data)
+        """
+        (srcPort, dstPort, seq, ack, dataOffset,
+         flags) = TCPReassembler.TCP_HEADER.unpack_from(segment, 0)
+        data = segment[(dataOffset >> 4) * 4:]
+
+        messages = []
+        key = (source, destination)
+        reverseKey = (destination, source)
+        connection = min(key, reverseKey)
+        stream = self.__streams.get(key)
+
+        if flags & TCPReassembler.FLAG_SYN:
+            # a new connection starts
+            if stream is not None:
+                self.__flushStream(stream, messages)
+            seq = (seq + 1) & TCPReassembler.SEQ_MASK
+            stream = self.__streams[key] = TCPStream(seq)
+        elif stream is None:
+            # the beginning of the connection was not captured
+            stream = self.__streams[key] = TCPStream(seq)
+
+        if len(data) > 0 or flags & (TCPReassembler.FLAG_FIN |
+                                     TCPReassembler.FLAG_RST):
+            # the other side has finished to speak
+            if self.__lastSender.get(connection, key) != key:
+                reverseStream = self.__streams.get(reverseKey)
+                if reverseStream is not None:
+                    self.__flushStream(reverseStream, messages)
+            self.__lastSender[connection] = key
+
+        if flags & TCPReassembler.FLAG_RST:
+            self.__insert(stream, seq, data, 0, epoch, metadata, messages)
+            self.__flushStream(stream, messages)
+            self.__close(key)
+            return messages
+
+        self.__insert(stream, seq, data, flags, epoch, metadata, messages)
+
+        if stream.finished:
+            reverseStream = self.__streams.get(reverseKey)
+            if reverseStream is None or reverseStream.finished:
+                self.__close(key)
+        return messages
+
+    def flush(self):
+        """Deliver the data remaining in all the connections.
+
+        :return: the remaining messages ordered by date
+        :rtype: a list of tuples (epoch, metadata, data)
+        """
+        messages = []
+        for stream in self.__streams.values():
+            self.__flushStream(stream, messages)
+        self.__streams = dict()
+        self.__lastSender = dict()
+        messages.sort(key=lambda message: message[0])
+        return messages
+
+    def __close(self, key):
+        """Forget both directions of a connection."""
+        (source, destination) = key
+        self.__streams.pop(key, None)
+        self.__streams.pop((destination, source), None)
+        self.__lastSender.pop(min(key, (destination, source)), None)
+
+    def __insert(self, stream, seq, data, flags, epoch, metadata, messages):
+        """Insert a segment in a stream according to its sequence number."""
+        if self.__place(stream, seq, data, flags, epoch, metadata, messages):
+            self.__drain(stream, messages)
+
+    def __place(self, stream, seq, data, flags, epoch, metadata, messages):
+        """Append a segment to the stream if it is in order, or keep it
+        pending otherwise.
+
+        :return: True if the segment was appended
+        """
+        offset = (seq - stream.nextSeq) & TCPReassembler.SEQ_MASK
+        if offset >= TCPReassembler.SEQ_HALF:
+            # the segment starts before the expected data (retransmission)
+            overlap = TCPReassembler.SEQ_MODULO - offset
+            if overlap >= len(data) and not (
+                    overlap == len(data) and flags & TCPReassembler.FLAG_FIN
+            ):
+                return False
+            data = data[overlap:]
+            offset = 0
+
+        if offset > 0:
+            if len(data) == 0 and not flags & TCPReassembler.FLAG_FIN:
+                return False
+            previous = stream.pending.get(seq)
+            if previous is None or len(previous[0]) < len(data):
+                if previous is not None:
+                    stream.pendingSize -= len(previous[0])
+                stream.pending[seq] = (data, flags, epoch, metadata)
+                stream.pendingSize += len(data)
+            if stream.pendingSize > TCPReassembler.MAX_PENDING_SIZE:
+                self.__skipGaps(stream, messages)
+            return False
+
+        self.__append(stream, data, flags, epoch, metadata, messages)
+        return True
+
+    def __append(self, stream, data, flags, epoch, metadata, messages):
+        """Append in order data to a stream."""
+        if len(data) > 0:
+            if len(stream.buffer) == 0:
+                stream.epoch = epoch
+                stream.metadata = metadata
+            stream.buffer += data
+            stream.nextSeq = (stream.nextSeq + len(data)) & TCPReassembler.SEQ_MASK
+        if flags & TCPReassembler.FLAG_FIN:
+            stream.nextSeq = (stream.nextSeq + 1) & TCPReassembler.SEQ_MASK
+            stream.finished = True
+        if flags & (TCPReassembler.FLAG_PSH | TCPReassembler.FLAG_FIN):
+            self.__deliver(stream, messages)
+
+    def __drain(self, stream, messages):
+        """Append the pending segments which are now in order."""
+        pending = stream.pending
+        while len(pending) > 0:
+            seq = stream.nextSeq
+            if seq not in pending:
+                # look for a segment which overlaps the expected data
+                seq = self.__firstPendingSeq(stream)
+                offset = (seq - stream.nextSeq) & TCPReassembler.SEQ_MASK
+                if 0 < offset < TCPReassembler.SEQ_HALF:
+                    # a gap remains
+                    return
+            (data, flags, epoch, metadata) = pending.pop(seq)
+            stream.pendingSize -= len(data)
+            self.__place(stream, seq, data, flags, epoch, metadata, messages)
+
+    def __skipGaps(self, stream, messages):
+        """Append all the pending segments, considering the data missing
+        between them is lost."""
+        nextSeq = stream.nextSeq
+        segments = sorted(
+            stream.pending.items(),
+            key=lambda item: (item[0] - nextSeq + TCPReassembler.SEQ_HALF) & TCPReassembler.SEQ_MASK)
+        stream.pending = dict()
+        stream.pendingSize = 0
+
+        for (seq, (data, flags, epoch, metadata)) in segments:
+            offset = (seq - stream.nextSeq) & TCPReassembler.SEQ_MASK
+            if 0 < offset < TCPReassembler.SEQ_HALF:
+                self._logger.debug(
+                    "Skipping {0} missing bytes in a TCP stream".format(
+                        offset))
+                stream.nextSeq = seq
+            self.__place(stream, seq, data, flags, epoch, metadata, messages)
+
+    def __firstPendingSeq(self, stream):
+        nextSeq = stream.nextSeq
+        return min(
+            stream.pending,
+            key=lambda seq: (seq - nextSeq + TCPReassembler.SEQ_HALF) & TCPReassembler.SEQ_MASK)
+
+    def __flushStream(self, stream, messages):
+        """Deliver all the data received in a stream, skipping gaps."""
+        self.__skipGaps(stream, messages)
+        self.__deliver(stream, messages)
+
+    def __deliver(self, stream, messages):
+        if len(stream.buffer) > 0:
+            messages.append((stream.epoch, stream.metadata,
+                             bytes(stream.buffer)))
+            del stream.buffer[:]
@@ -29,20 +29,9 @@
 # List subpackages to import with the current one
 # see docs.python.org/2/tutorial/modules.html
 
-pcapy_available = False
-#impacket_available = False
-
-try:
-    import pcapy
-    pcapy_available = True
-except ImportError:
-    pass
-
-# try:
-#     import impacket
-#     impacket_available = True
-# except ImportError:
-#     pass
-
-if pcapy_available:  # and impacket_available:
-    from netzob.Import.PCAPImporter.PCAPImporter import PCAPImporter
+# The PCAPImporter relies on the built-in PCAPReader, pcapy is only
+# required to apply BPF filters.
+from netzob.Import.PCAPImporter.PCAPReader import PCAPReader
+from netzob.Import.PCAPImporter.TCPReassembler import TCPReassembler
+from netzob.Import.PCAPImporter.PCAPImporter import PCAPImporter
+from netzob.Import.PCAPImporter.PCAPCache import PCAPCache
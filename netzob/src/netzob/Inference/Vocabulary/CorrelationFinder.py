@@ -35,11 +35,8 @@ import zlib
 #+---------------------------------------------------------------------------+
 #| Related third party imports
 #+---------------------------------------------------------------------------+
-try:
-    import numpy
-    from minepy import MINE
-except:
-    pass
+# numpy and minepy are imported on first use (see execute()) since they
+# are optional and slow to import
 
 #+---------------------------------------------------------------------------+
 #| Local application imports
@@ -94,6 +91,7 @@ class CorrelationFinder(object):
 
         try:
             import numpy
+            import minepy
         except:
             # Fall back to classical relations
             import logging
@@ -115,6 +113,9 @@ class CorrelationFinder(object):
         :type symbol: :class:`netzob.Model.Vocabulary.AbstractField.AbstractField`
         """
 
+        import numpy
+        from minepy import MINE
+
         (attributeValues_headers,
          attributeValues) = self._generateAttributeValuesForSymbol(symbol)
         symbolResults = []
@@ -232,13 +233,13 @@ class CorrelationFinder(object):
         return result
 
     def _generateDataValues(self, cellsData):
-        result = []
-        for data in cellsData:
-            if len(data) > 0:
-                result.append(TypeConverter.convert(
-                    data[:8], Raw, Integer))  # We take only the first 8 octets
-            else:
-                result.append(0)
+        result = [0] * len(cellsData)
+        positions = [i for i, data in enumerate(cellsData) if len(data) > 0]
+        values = TypeConverter.convertMany(
+            [cellsData[i][:8] for i in positions], Raw,
+            Integer)  # We take only the first 8 octets
+        for i, value in zip(positions, values):
+            result[i] = value
         return result
 
     def _generateSizeValues(self, cellsData):
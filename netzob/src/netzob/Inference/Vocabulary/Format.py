@@ -100,7 +100,9 @@ class Format(object):
         This method returns nothing, it upgrades the field structure
         with the result of the splitting process.
 
-        Its a wrapper for :class:`netzob.Inference.Vocabulary.FieldSplitStatic.ParallelFieldSplitStatic.ParallelFieldSplitStatic`.
+        Its a wrapper for :class:`netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.FieldSplitStatic.FieldSplitStatic`.
+        Large symbols can be split over several threads with
+        :class:`netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.ParallelFieldSplitStatic.ParallelFieldSplitStatic`.
 
         >>> import binascii
         >>> from netzob.all import *
@@ -255,6 +257,42 @@ class Format(object):
 
         FieldSplitDelimiter.split(field, delimiter)
 
+    @staticmethod
+    @typeCheck(AbstractField, list)
+    def splitDelimiters(field, delimiters):
+        """Split a field (or symbol) with an ordered list of delimiters.
+        Each field created with a delimiter is split with the following
+        ones, in a single pass over the messages.
+
+        >>> from netzob.all import *
+        >>> samples = [b"id=1&lang=fr", b"id=2&lang=en&debug=1"]
+        >>> symbol = Symbol(messages=[RawMessage(sample) for sample in samples])
+        >>> Format.splitDelimiters(symbol, [ASCII("&"), ASCII("=")])
+        >>> print(symbol)
+        Field-0 | Field-sep-3d | Field-2 | Field-sep-26 | Field-0 | Field-sep-3d | Field-2 | Field-sep-26 | Field-0 | Field-sep-3d | Field-2
+        ------- | ------------ | ------- | ------------ | ------- | ------------ | ------- | ------------ | ------- | ------------ | -------
+        'id'    | '='          | '1'     | '&'          | 'lang'  | '='          | 'fr'    | ''           | ''      | ''           | ''     
+        'id'    | '='          | '2'     | '&'          | 'lang'  | '='          | 'en'    | '&'          | 'debug' | '='          | '1'    
+        ------- | ------------ | ------- | ------------ | ------- | ------------ | ------- | ------------ | ------- | ------------ | -------
+
+        :param field : the field to consider when spliting
+        :type: :class:`netzob.Model.Vocabulary.AbstractField.AbstractField`
+        :param delimiters : the ordered delimiters used to split messages of the field
+        :type: a list of :class:`netzob.Model.Vocabulary.Types.AbstractType.AbstractType`
+        """
+
+        if delimiters is None or len(delimiters) == 0:
+            raise TypeError("Delimiters cannot be None or empty")
+
+        if field is None:
+            raise TypeError("Field cannot be None")
+
+        if len(field.messages) < 1:
+            raise ValueError(
+                "The associated symbol does not contain any message.")
+
+        FieldSplitDelimiter.splitNested(field, delimiters)
+
     @staticmethod
     @typeCheck(AbstractField)
     def resetFormat(field):
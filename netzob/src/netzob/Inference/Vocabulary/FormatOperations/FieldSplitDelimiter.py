@@ -163,25 +163,121 @@ class FieldSplitDelimiter(object):
             raise ValueError(
                 "The associated symbol does not contain any message.")
 
-        # Find message substrings after applying delimiter
-        splittedMessages = []
+        FieldSplitDelimiter.__updateFields(field, [delimiter])
 
-        for cell in field.getValues(encoded=False, styled=False):
-            splittedMessage = cell.split(delimiter.value.tobytes())
-            splittedMessages.append(splittedMessage)
+    @staticmethod
+    @typeCheck(AbstractField, list)
+    def splitNested(field, delimiters):
+        """Split a field (or symbol) with an ordered list of delimiters.
+        Values are first split with the first delimiter that occurs in
+        them, and each created field is then split with the following
+        delimiters. The messages are tokenized once and the nested
+        fields are built directly, which is equivalent to calling
+        :meth:`split` on each created field without realigning the
+        messages between each call.
+
+        >>> from netzob.all import *
+        >>> samples = [b"GET /index?id=1&lang=fr HTTP/1.1\\r\\nHost: netzob.org\\r\\n", b"GET /search?q=zoby HTTP/1.0\\r\\nHost: www.netzob.org\\r\\n"]
+        >>> messages = [RawMessage(data=sample) for sample in samples]
+        >>> symbol = Symbol(messages=messages)
+        >>> Format.splitDelimiters(symbol, [ASCII("\\r\\n"), ASCII(" "), ASCII("?")])
+        >>> print(symbol)
+        Field-0 | Field-sep-20 | Field-0   | Field-sep-3f | Field-2        | Field-sep-20 | Field-4    | Field-sep-0d0a | Field-0 | Field-sep-20 | Field-2          | Field-sep-0d0a | Field-4
+        ------- | ------------ | --------- | ------------ | -------------- | ------------ | ---------- | -------------- | ------- | ------------ | ---------------- | -------------- | -------
+        'GET'   | ' '          | '/index'  | '?'          | 'id=1&lang=fr' | ' '          | 'HTTP/1.1' | '\\r\\n'         | 'Host:' | ' '          | 'netzob.org'     | '\\r\\n'         | ''     
+        'GET'   | ' '          | '/search' | '?'          | 'q=zoby'       | ' '          | 'HTTP/1.0' | '\\r\\n'         | 'Host:' | ' '          | 'www.netzob.org' | '\\r\\n'         | ''     
+        ------- | ------------ | --------- | ------------ | -------------- | ------------ | ---------- | -------------- | ------- | ------------ | ---------------- | -------------- | -------
+        >>> print([f.name for f in symbol.fields])
+        ['Field-0', 'Field-sep-0d0a', 'Field-2', 'Field-sep-0d0a', 'Field-4']
+        >>> print([f.name for f in symbol.fields[0].fields])
+        ['Field-0', 'Field-sep-20', 'Field-2', 'Field-sep-20', 'Field-4']
+
+        :param field : the field to consider when spliting
+        :type: :class:`netzob.Model.Vocabulary.AbstractField.AbstractField`
+        :param delimiters : the ordered delimiters used to split messages of the field
+        :type: a list of :class:`netzob.Model.Vocabulary.Types.AbstractType.AbstractType`
+        """
 
-        import itertools
-        # Inverse the array, so that columns contains observed values for each field
-        splittedMessages = list(itertools.zip_longest(*splittedMessages))
+        if delimiters is None or len(delimiters) == 0:
+            raise TypeError("Delimiters cannot be None or empty.")
 
-        # If the delimiter does not create splitted fields
-        if len(splittedMessages) <= 1:
+        for delimiter in delimiters:
+            if not isinstance(delimiter, AbstractType):
+                raise TypeError(
+                    "At least one specified delimiter is not an AbstractType.")
+
+        if field is None:
+            raise TypeError("Field cannot be None.")
+
+        if len(field.messages) < 1:
+            raise ValueError(
+                "The associated symbol does not contain any message.")
+
+        FieldSplitDelimiter.__updateFields(field, delimiters)
+
+    @staticmethod
+    def __updateFields(field, delimiters):
+        """Replaces the children of the field with the fields obtained by
+        splitting its values with the specified delimiters."""
+        encodingFunctions = list(field.encodingFunctions.values())
+        newFields = FieldSplitDelimiter.__splitValues(
+            field.getValues(encoded=False, styled=False), delimiters,
+            encodingFunctions)
+
+        # If the delimiters do not create splitted fields
+        if newFields is None:
             return
 
-        # Else, we add (2*len(splittedMessages)-1) fields
+        # Reset the field
+        from netzob.Inference.Vocabulary.Format import Format
+        Format.resetFormat(field)
+
+        # Create a field for each entry
+        field.fields = newFields
+
+    @staticmethod
+    def __tokenize(values, delimiter):
+        """Splits each value with the delimiter and returns the
+        observed tokens per column. A column holds None for values
+        having less tokens than the number of columns."""
+        columns = []
+        for iValue, value in enumerate(values):
+            tokens = value.split(delimiter)
+            if len(tokens) > len(columns):
+                for i in range(len(columns), len(tokens)):
+                    columns.append([None] * iValue)
+            for column, token in zip(columns, tokens):
+                column.append(token)
+            for column in columns[len(tokens):]:
+                column.append(None)
+        return columns
+
+    @staticmethod
+    def __splitValues(values, delimiters, encodingFunctions):
+        """Builds the fields obtained by splitting the values with the first
+        delimiter found in them, each data field being recursively split
+        with the following delimiters.
+
+        :return: the new fields or None if no delimiter split the values
+        """
+        for iDelimiter, delimiter in enumerate(delimiters):
+            # Inverse the array, so that columns contains observed values for each field
+            columns = FieldSplitDelimiter.__tokenize(
+                values, delimiter.value.tobytes())
+            if len(columns) > 1:
+                break
+        else:
+            return None
+        nextDelimiters = delimiters[iDelimiter + 1:]
+
+        str_delimiter = TypeConverter.convert(delimiter.value, BitArray,
+                                              HexaString).decode('utf-8')
+        fieldName = "Field-sep-{}".format(str_delimiter)
+
+        # Else, we add (2*len(columns)-1) fields
         newFields = []
         iField = -1
-        for i in range(len(splittedMessages)):
+        for column in columns:
             iField += 1
 
             fieldDomain = list()
@@ -190,8 +286,8 @@ class FieldSplitDelimiter(object):
             observedValues = set()
             has_inserted_empty_value = False
 
-            isEmptyField = True  # To avoid adding an empty field            
-            for v in splittedMessages[i]:
+            isEmptyField = True  # To avoid adding an empty field
+            for v in column:
                 if v != "" and v is not None:
                     isEmptyField = False
 
@@ -204,26 +300,26 @@ class FieldSplitDelimiter(object):
                         has_inserted_empty_value = True
 
             if not isEmptyField:
-                newField = Field(
-                    domain=DomainFactory.normalizeDomain(fieldDomain),
-                    name="Field-" + str(iField))
-                newField.encodingFunctions = list(
-                    field.encodingFunctions.values())
+                subFields = None
+                if len(nextDelimiters) > 0:
+                    subFields = FieldSplitDelimiter.__splitValues(
+                        [v if v is not None else b'' for v in column],
+                        nextDelimiters, encodingFunctions)
+
+                if subFields is None:
+                    newField = Field(
+                        domain=DomainFactory.normalizeDomain(fieldDomain),
+                        name="Field-" + str(iField))
+                else:
+                    newField = Field(name="Field-" + str(iField))
+                    newField.fields = subFields
+                newField.encodingFunctions = encodingFunctions
                 newFields.append(newField)
                 iField += 1
 
-            str_delimiter = TypeConverter.convert(delimiter.value, BitArray,
-                                                  HexaString).decode('utf-8')
-            fieldName = "Field-sep-{}".format(str_delimiter)
-
             newFields.append(
                 Field(domain=Alt([delimiter, Raw(nbBytes=0)]), name=fieldName))
 
         newFields.pop()
 
-        # Reset the field
-        from netzob.Inference.Vocabulary.Format import Format
-        Format.resetFormat(field)
-
-        # Create a field for each entry
-        field.fields = newFields
+        return newFields
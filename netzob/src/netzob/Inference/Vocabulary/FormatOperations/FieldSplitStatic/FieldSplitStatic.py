@@ -35,6 +35,12 @@
 #| Standard library imports
 #+---------------------------------------------------------------------------+
 
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+# numpy is imported on first use (see _computeStaticColumns()) since it is
+# slow to import
+
 #+---------------------------------------------------------------------------+
 #| Local application imports
 #+---------------------------------------------------------------------------+
@@ -43,10 +49,7 @@ from netzob.Model.Vocabulary.AbstractField import AbstractField
 from netzob.Model.Vocabulary.Types.AbstractType import AbstractType
 from netzob.Model.Vocabulary.Domain.DomainFactory import DomainFactory
 from netzob.Model.Vocabulary.Field import Field
-from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
-from netzob.Model.Vocabulary.Types.BitArray import BitArray
 from netzob.Model.Vocabulary.Types.Raw import Raw
-from netzob.Model.Vocabulary.Types.HexaString import HexaString
 
 
 @NetzobLogger
@@ -202,6 +205,9 @@ class FieldSplitStatic(object):
         AbstractType.UNITSIZE_32, AbstractType.UNITSIZE_64
     ]
 
+    # Number of values compared at once when searching static columns
+    BLOCK_SIZE = 4096
+
     def __init__(self,
                  unitSize=AbstractType.UNITSIZE_8,
                  mergeAdjacentStaticFields=True,
@@ -232,87 +238,145 @@ class FieldSplitStatic(object):
 
         if field is None:
             raise TypeError("The field cannot be None")
-        fieldValues = [
-            TypeConverter.convert(data, Raw, HexaString)
-            for data in field.getValues(encoded=False)
-        ]
+        fieldValues = field.getValues(encoded=False)
 
         if len(fieldValues) == 0:
             raise Exception("No value found in the field.")
 
-        # Retrieve longuest field value
-        maxLengthFieldValue = len(max(fieldValues, key=len))
-
-        # definies the step following specified unitsize
-        stepUnitsize = self.__computeStepForUnitsize()
+        # definies the step (in bytes) following specified unitsize
+        stepUnitsize = self._computeStepForUnitsize()
 
         # Vertical identification of variation
-        indexedValues = []
-        for i in range(0, maxLengthFieldValue, stepUnitsize):
-            currentIndexValue = []
-            for fieldValue in fieldValues:
-                if i < len(fieldValue):
-                    currentIndexValue.append(
-                        fieldValue[i:min(len(fieldValue), i + stepUnitsize)])
-                else:
-                    currentIndexValue.append(b'')
-            indexedValues.append(currentIndexValue)
-
-        # If requested, merges the adjacent static fields
-        if self.mergeAdjacentStaticFields:
-            result = []
-            staticSequences = []
-            for values in indexedValues:
-                if len(set(values)) == 1:
-                    # static
-                    staticSequences.append(values[0])
-                else:
-                    # dynamic
-                    if len(staticSequences) > 0:
-                        result.append([b''.join(staticSequences)])
-                        staticSequences = []
-                    result.append(values)
-            if len(staticSequences) > 0:
-                result.append([b''.join(staticSequences)])
-            indexedValues = result
-
-        # If requested, merges the adjacent dynamic fields
-        if self.mergeAdjacentDynamicFields:
-            result = []
-            dynamicSequences = []
-            for values in indexedValues:
-                if len(set(values)) > 1:
-                    # dynamic
-                    dynamicSequences.append(values)
-                else:
-                    # static
-                    if len(dynamicSequences) > 0:
-                        dynValues = zip(*dynamicSequences)
-                        tmp_result = []
-                        for d in dynValues:
-                            tmp_result.append(b''.join(
-                                [x if x is not None else b'' for x in d]))
-                        result.append(tmp_result)
-                        dynamicSequences = []
-                    result.append(values)
-            if len(dynamicSequences) > 0:
-                dynValues = zip(*dynamicSequences)
-                tmp_result = []
-                for d in dynValues:
-                    tmp_result.append(
-                        b''.join([x if x is not None else b'' for x in d]))
-                result.append(tmp_result)
-
-            indexedValues = result
+        staticColumns = FieldSplitStatic._computeStaticColumns(fieldValues,
+                                                               stepUnitsize)
+
+        segments = self._computeSegments(staticColumns)
+        segmentValues = FieldSplitStatic._computeSegmentValues(fieldValues,
+                                                               segments)
+
+        self._buildFields(field, segmentValues)
+
+    @staticmethod
+    def _computeStaticColumns(values, step):
+        """Computes for each column of `step` bytes if it holds the same
+        content in all the specified values. A column is static if all the
+        values have the same bytes (and the same number of bytes) in it.
+
+        >>> from netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.FieldSplitStatic import FieldSplitStatic
+        >>> FieldSplitStatic._computeStaticColumns([b"\\x00\\xff\\x01", b"\\x00\\xfe\\x01", b"\\x00\\xff\\x01\\x02"], 1)
+        [True, False, True, False]
+        >>> FieldSplitStatic._computeStaticColumns([b"\\x00\\xff\\x01", b"\\x00\\xfe\\x01", b"\\x00\\xff\\x01\\x02"], 2)
+        [False, False]
+
+        :param values: the values to compare
+        :type values: a list of :class:`bytes`
+        :param step: the size in bytes of a column
+        :type step: :class:`int`
+        :return: the static status of each column
+        :rtype: a list of :class:`bool`
+        """
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        lengths = [len(value) for value in values]
+        nbColumns = (max(lengths) + step - 1) // step
+
+        if numpy is None:
+            reference = values[0]
+            staticColumns = []
+            for start in range(0, nbColumns * step, step):
+                chunk = reference[start:start + step]
+                staticColumns.append(
+                    all(value[start:start + step] == chunk
+                        for value in values))
+            return staticColumns
+
+        width = nbColumns * step
+        lengths = numpy.array(lengths, dtype=numpy.int64)
+        columnOffsets = numpy.arange(0, width, step)
+
+        # a column must cover the same number of bytes in every value
+        columnLengths = numpy.clip(lengths[:, None] - columnOffsets, 0, step)
+        staticColumns = (columnLengths == columnLengths[0]).all(axis=0)
+
+        # compare every row of the (zero-padded) byte matrix with the first one
+        byteOffsets = numpy.arange(width)
+        reference = None
+        staticBytes = numpy.ones(width, dtype=bool)
+        for iBlock in range(0, len(values), FieldSplitStatic.BLOCK_SIZE):
+            blockLengths = lengths[iBlock:iBlock + FieldSplitStatic.BLOCK_SIZE]
+            block = numpy.zeros((len(blockLengths), width), dtype=numpy.uint8)
+            block[byteOffsets < blockLengths[:, None]] = numpy.frombuffer(
+                b''.join(values[iBlock:iBlock + FieldSplitStatic.BLOCK_SIZE]),
+                dtype=numpy.uint8)
+            if reference is None:
+                reference = block[0]
+            staticBytes &= (block == reference).all(axis=0)
+            if not staticBytes.any():
+                break
+
+        staticColumns &= staticBytes.reshape(nbColumns, step).all(axis=1)
+        return staticColumns.tolist()
+
+    def _computeSegments(self, staticColumns):
+        """Computes the portions of the values covered by each new field.
+        Adjacent columns are merged following the mergeAdjacentStaticFields
+        and mergeAdjacentDynamicFields attributes.
+
+        :param staticColumns: the static status of each column of the values
+        :type staticColumns: a list of :class:`bool`
+        :return: the segments given as (start byte, end byte, static)
+        :rtype: a list of :class:`tuple`
+        """
+        step = self._computeStepForUnitsize()
+
+        segments = []
+        for iColumn, static in enumerate(staticColumns):
+            if len(segments) > 0 and segments[-1][2] == static:
+                merge = self.mergeAdjacentStaticFields if static else self.mergeAdjacentDynamicFields
+                if merge:
+                    segments[-1][1] = (iColumn + 1) * step
+                    continue
+            segments.append([iColumn * step, (iColumn + 1) * step, static])
+
+        return [tuple(segment) for segment in segments]
+
+    @staticmethod
+    def _computeSegmentValues(values, segments):
+        """Computes the distinct values of each segment.
+
+        :param values: the values of the field
+        :type values: a list of :class:`bytes`
+        :param segments: the segments given as (start byte, end byte, static)
+        :type segments: a list of :class:`tuple`
+        :return: the distinct values of each segment
+        :rtype: a list of :class:`set`
+        """
+        segmentValues = []
+        for (start, end, static) in segments:
+            if static:
+                segmentValues.append(set([values[0][start:end]]))
+            else:
+                segmentValues.append(set(value[start:end] for value in values))
+        return segmentValues
+
+    def _buildFields(self, field, segmentValues):
+        """Replaces the children of the specified field with a field for
+        each segment.
+
+        :param field: the field to update
+        :type field: :class:`netzob.Model.Vocabulary.AbstractField.AbstractField`
+        :param segmentValues: the distinct values of each segment
+        :type segmentValues: a list of :class:`set`
+        """
 
         # Create a field for each entry
         newFields = []
-        for (i, val) in enumerate(indexedValues):
+        for (i, val) in enumerate(segmentValues):
             fName = "Field-{0}".format(i)
-            fDomain = DomainFactory.normalizeDomain([
-                Raw(TypeConverter.convert(v, HexaString, BitArray))
-                for v in set(val)
-            ])
+            fDomain = DomainFactory.normalizeDomain([Raw(v) for v in val])
             newFields.append(Field(domain=fDomain, name=fName))
 
         # attach encoding functions
@@ -321,23 +385,21 @@ class FieldSplitStatic(object):
 
         field.fields = newFields
 
-    def __computeStepForUnitsize(self):
-        """Computes the step following the specified unitsize.
+    def _computeStepForUnitsize(self):
+        """Computes the step (in bytes) following the specified unitsize.
 
         :return: the step
         :rtype: :class:`int`
         :raise: Exception if unitsize not supported
         """
-        if self.unitSize == AbstractType.UNITSIZE_4:
+        if self.unitSize == AbstractType.UNITSIZE_8:
             return 1
-        elif self.unitSize == AbstractType.UNITSIZE_8:
-            return 2
         elif self.unitSize == AbstractType.UNITSIZE_16:
-            return 4
+            return 2
         elif self.unitSize == AbstractType.UNITSIZE_32:
-            return 8
+            return 4
         elif self.unitSize == AbstractType.UNITSIZE_64:
-            return 16
+            return 8
 
         else:
             raise Exception("Unitsize not supported, can't compute the step")
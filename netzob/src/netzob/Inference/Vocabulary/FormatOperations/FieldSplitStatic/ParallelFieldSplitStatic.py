@@ -35,6 +35,7 @@
 #| Standard library imports
 #+---------------------------------------------------------------------------+
 import multiprocessing
+import time
 
 #+---------------------------------------------------------------------------+
 #| Local application imports
@@ -42,89 +43,186 @@ import multiprocessing
 from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Model.Vocabulary.Types.AbstractType import AbstractType
 from netzob.Model.Vocabulary.AbstractField import AbstractField
-from netzob.Common.Utils.DataAlignment.DataAlignment import DataAlignment
+from netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.FieldSplitStatic import FieldSplitStatic
 
 
-def _executeDataAlignment(arg, **kwargs):
-    """Wrapper used to parallelize the DataAlignment using
-    a pool of threads.
+def _executeStaticColumns(arg, **kwargs):
+    """Wrapper used to parallelize the identification of static
+    columns using a pool of threads. It returns the static status of
+    each column of the shard with the first value of the shard.
     """
-    data = arg[0]
-    field = arg[1]
-    alignedData = DataAlignment.align([data], field)
-    return (data, alignedData)
+    values = arg[0]
+    step = arg[1]
+    staticColumns = FieldSplitStatic._computeStaticColumns(values, step)
+    return (staticColumns, values[0])
+
+
+def _executeSegmentValues(arg, **kwargs):
+    """Wrapper used to parallelize the computation of the distinct
+    values of each segment using a pool of threads.
+    """
+    values = arg[0]
+    segments = arg[1]
+    return FieldSplitStatic._computeSegmentValues(values, segments)
 
 
 @NetzobLogger
 class ParallelFieldSplitStatic(object):
     """Allows to split the content of the specified field following
     its value variation over its messages.
+
+    Messages are sharded over a pool of threads. Each thread computes
+    which columns are static in its shard, and the partial results are
+    reduced to obtain the same field layout than :class:`FieldSplitStatic`.
+
+    >>> import binascii
+    >>> from netzob.all import *
+    >>> from netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.ParallelFieldSplitStatic import ParallelFieldSplitStatic
+    >>> samples = [b"00ff2f00000010", b"00001000000011", b"00fe1f00000012", b"00002000000013", b"00ff1f00000014", b"00ff1f00000015", b"00ff2f00000016", b"00fe1f00000017"]
+    >>> messages = [RawMessage(data=binascii.unhexlify(sample)) for sample in samples]
+    >>> symbol = Symbol(messages=messages)
+    >>> symbol.addEncodingFunction(TypeEncodingFunction(HexaString))
+    >>> ParallelFieldSplitStatic.split(symbol, nbThread=3)
+    >>> print(symbol)
+    Field-0 | Field-1 | Field-2  | Field-3
+    ------- | ------- | -------- | -------
+    '00'    | 'ff2f'  | '000000' | '10'   
+    '00'    | '0010'  | '000000' | '11'   
+    '00'    | 'fe1f'  | '000000' | '12'   
+    '00'    | '0020'  | '000000' | '13'   
+    '00'    | 'ff1f'  | '000000' | '14'   
+    '00'    | 'ff1f'  | '000000' | '15'   
+    '00'    | 'ff2f'  | '000000' | '16'   
+    '00'    | 'fe1f'  | '000000' | '17'   
+    ------- | ------- | -------- | -------
+
+    >>> ParallelFieldSplitStatic.split(symbol, unitSize=AbstractType.UNITSIZE_16, mergeAdjacentDynamicFields=False, nbThread=4)
+    >>> print(symbol)
+    Field-0 | Field-1 | Field-2 | Field-3
+    ------- | ------- | ------- | -------
+    '00ff'  | '2f00'  | '0000'  | '10'   
+    '0000'  | '1000'  | '0000'  | '11'   
+    '00fe'  | '1f00'  | '0000'  | '12'   
+    '0000'  | '2000'  | '0000'  | '13'   
+    '00ff'  | '1f00'  | '0000'  | '14'   
+    '00ff'  | '1f00'  | '0000'  | '15'   
+    '00ff'  | '2f00'  | '0000'  | '16'   
+    '00fe'  | '1f00'  | '0000'  | '17'   
+    ------- | ------- | ------- | -------
+
     """
 
-    def __init__(self, field, unitSize=AbstractType.UNITSIZE_4, nbThread=None):
+    def __init__(self,
+                 field,
+                 unitSize=AbstractType.UNITSIZE_8,
+                 mergeAdjacentStaticFields=True,
+                 mergeAdjacentDynamicFields=True,
+                 nbThread=None):
         """Constructor.
 
         :param field : the field to consider when spliting
         :type: :class:`netzob.Model.Vocabulary.AbstractField.AbstractField`
         :keyword unitSize: the required size of static element to create a static field
         :type unitSize: :class:`int`.
+        :keyword mergeAdjacentStaticFields: if set to true, adjacent static fields are merged in a single field
+        :type mergeAdjacentStaticFields: :class:`bool`
+        :keyword mergeAdjacentDynamicFields: if set to true, adjacent dynamic fields are merged in a single field
+        :type mergeAdjacentDynamicFields: :class:`bool`
         :keyword nbThread: the number of thread to use when spliting
         :type nbThread: :class:`int`.
         """
 
         self.field = field
-
-        self.unitSize = unitSize
+        self.splitter = FieldSplitStatic(unitSize, mergeAdjacentStaticFields,
+                                         mergeAdjacentDynamicFields)
         self.nbThread = nbThread
 
-    def __collectResults_cb(self, tupple_result):
-        """This callback is executed by each thread when it finishes
-        to align data. Every thread submit its results using these callback.
-        :param data: the data to align
-        :type data: :class:`str`
-        :param result: the result of an alignment
-        :type result: :class:`list`
-        :raise Exception: if the parameter is not valid
-        """
-        if tupple_result is None:
-            raise TypeError("parameter cannot be none")
-
-        for (data, result) in tupple_result:
-            if data is None:
-                raise TypeError("data cannot be None")
-
-            if result is None:
-                raise TypeError("result cannot be none")
-
-            self.asyncResult[data] = result
-
-    @typeCheck(list)
     def execute(self):
-        """Execute the parallel splitting
-        """
-        # # Create a list of data removed from duplicate entry
-        # noDuplicateData = list(set(data))
-
-        # # Measure start time
-        # start = time.time()
-
-        # # Create a pool of 'nbThead' threads (process)
-        # pool = multiprocessing.Pool(self.nbThread)
+        """Execute the parallel splitting. Children of the field will be
+        replaced with new fields.
 
-        # # Execute Data Alignment
-        # pool.map_async(_executeSplitStatic, data, callback=self.__collectResults_cb)
-
-        # # Waits all alignment tasks finish
-        # pool.close()
-        # pool.join()
-
-        # # Measure end time
-        # end = time.time()
+        :raise Exception: if something bad happens
+        """
+        fieldValues = self.field.getValues(encoded=False)
+
+        if len(fieldValues) == 0:
+            raise Exception("No value found in the field.")
+
+        step = self.splitter._computeStepForUnitsize()
+
+        # Measure start time
+        start = time.time()
+
+        # Shard the values between the threads
+        shardSize = (len(fieldValues) + self.nbThread - 1) // self.nbThread
+        shards = [
+            fieldValues[i:i + shardSize]
+            for i in range(0, len(fieldValues), shardSize)
+        ]
+
+        # Create a pool of 'nbThead' threads (process)
+        pool = multiprocessing.Pool(self.nbThread)
+
+        try:
+            # Identify the static columns of each shard
+            partialResults = pool.map(_executeStaticColumns,
+                                      [(shard, step) for shard in shards])
+            staticColumns = self.__reduceStaticColumns(partialResults, step)
+
+            # Collect the distinct values of each new field
+            segments = self.splitter._computeSegments(staticColumns)
+            partialValues = pool.map(_executeSegmentValues,
+                                     [(shard, segments) for shard in shards])
+        finally:
+            pool.close()
+            pool.join()
+
+        segmentValues = [set() for segment in segments]
+        for shardValues in partialValues:
+            for values, newValues in zip(segmentValues, shardValues):
+                values.update(newValues)
+
+        self.splitter._buildFields(self.field, segmentValues)
+
+        # Measure end time
+        end = time.time()
+
+        self._logger.debug(
+            "Static split of {0} values took {1}s with {2} threads.".format(
+                len(fieldValues), end - start, self.nbThread))
+
+    def __reduceStaticColumns(self, partialResults, step):
+        """Merges the static columns identified on each shard. A column is
+        static if it is static in every shard with the same content.
+
+        :param partialResults: the static columns and the first value of each shard
+        :type partialResults: a list of :class:`tuple`
+        :param step: the size in bytes of a column
+        :type step: :class:`int`
+        :return: the static status of each column
+        :rtype: a list of :class:`bool`
+        """
+        nbColumns = max(len(columns) for columns, reference in partialResults)
+        firstValue = partialResults[0][1]
+
+        staticColumns = []
+        for iColumn in range(nbColumns):
+            start = iColumn * step
+            chunk = firstValue[start:start + step]
+            staticColumns.append(
+                all(iColumn < len(columns) and columns[iColumn] and
+                    reference[start:start + step] == chunk
+                    for columns, reference in partialResults))
+        return staticColumns
 
     # Static method
 
     @staticmethod
-    def split(field, unitSize=None, nbThread=None):
+    def split(field,
+              unitSize=AbstractType.UNITSIZE_8,
+              mergeAdjacentStaticFields=True,
+              mergeAdjacentDynamicFields=True,
+              nbThread=None):
         """Split the portion of message in the current field
         following the value variation every unitSize
 
@@ -132,11 +230,24 @@ class ParallelFieldSplitStatic(object):
         :type: :class:`netzob.Model.Vocabulary.AbstractField.AbstractField`
         :keyword unitSize: the required size of static element to create a static field
         :type unitSize: :class:`int`.
+        :keyword mergeAdjacentStaticFields: if set to true, adjacent static fields are merged in a single field
+        :type mergeAdjacentStaticFields: :class:`bool`
+        :keyword mergeAdjacentDynamicFields: if set to true, adjacent dynamic fields are merged in a single field
+        :type mergeAdjacentDynamicFields: :class:`bool`
         :keyword nbThread: the number of thread to use when spliting
         :type nbThread: :class:`int`.
         """
-        pSplit = ParallelFieldSplitStatic(field, unitSize, nbThread)
-        return pSplit.execute()
+        if field is None:
+            raise TypeError("Field cannot be None.")
+
+        if len(field.messages) < 1:
+            raise ValueError(
+                "The associated symbol does not contain any message.")
+
+        pSplit = ParallelFieldSplitStatic(field, unitSize,
+                                          mergeAdjacentStaticFields,
+                                          mergeAdjacentDynamicFields, nbThread)
+        pSplit.execute()
 
     # Properties
 
@@ -174,8 +285,8 @@ class ParallelFieldSplitStatic(object):
         if nbThread is None:
             nbThread = multiprocessing.cpu_count()
 
-        if nbThread < 0:
+        if nbThread <= 0:
             raise ValueError(
-                "NbThread cannot be <0, use None to specify you don't know.")
+                "NbThread must be >0, use None to specify you don't know.")
 
         self.__nbThread = nbThread
@@ -34,6 +34,7 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
+from collections import Counter, OrderedDict
 
 # +---------------------------------------------------------------------------+
 # | Related third party imports                                               |
@@ -110,16 +111,19 @@ class FindKeyFields(object):
                     isCandidate = False
                     break
             if isCandidate:
-                results.append({"keyField": f})
+                results.append({"keyField": f, "column": i})
 
-        # Compute clusters according to each key field found
-        from netzob.Inference.Vocabulary.Format import Format
+        # Compute clusters according to each key field found. Clusters
+        # are only counted on the aligned column: the resulting symbols
+        # are built with Format.clusterByKeyField() once a key field is
+        # selected.
         for result in results:
-            tmpClusters = Format.clusterByKeyField(field, result["keyField"])
-            result["nbClusters"] = len(tmpClusters)
-            distrib = []  # Compute clusters distribution
-            for cluster in list(tmpClusters.values()):
-                distrib.append(len(cluster.messages))
-            result["distribution"] = distrib
+            column = columns[result.pop("column")]
+            counts = Counter(column)
+            result["nbClusters"] = len(counts)
+            # Clusters are given in their order of appearance in the messages
+            result["distribution"] = [
+                counts[value] for value in OrderedDict.fromkeys(column)
+            ]
 
         return results
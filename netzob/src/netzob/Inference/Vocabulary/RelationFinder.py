@@ -396,20 +396,25 @@ class RelationFinder(object):
         return result
 
     def _generateDataValues(self, cellsData):
-        result = []
-        for data in cellsData:
+        result = [0] * len(cellsData)
+
+        # cells are grouped by size to be converted column by column
+        cellsBySize = dict()
+        for i, data in enumerate(cellsData):
             if len(data) > 0:
                 data = data[:8]  # We take at most 8 bytes
-                unitSize = int(AbstractType.UNITSIZE_8) * len(data)
-                unitSize = int(pow(2, math.ceil(math.log(
-                    unitSize, 2))))  # Round to the nearest upper power of 2
-                result.append(
-                    Integer.encode(
-                        data,
-                        endianness=AbstractType.ENDIAN_BIG,
-                        unitSize=str(unitSize)))
-            else:
-                result.append(0)
+                cellsBySize.setdefault(len(data), []).append((i, data))
+
+        for size, cells in cellsBySize.items():
+            unitSize = int(AbstractType.UNITSIZE_8) * size
+            unitSize = int(pow(2, math.ceil(math.log(
+                unitSize, 2))))  # Round to the nearest upper power of 2
+            values = Integer.encodeMany(
+                [data for (i, data) in cells],
+                endianness=AbstractType.ENDIAN_BIG,
+                unitSize=str(unitSize))
+            for (i, data), value in zip(cells, values):
+                result[i] = value
         return result
 
     def _generateSizeValues(self, cellsData):
@@ -0,0 +1,356 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger, typeCheck
+
+
+@NetzobLogger
+class MessageIndex(object):
+    """An inverted index of the byte n-grams found in a list of messages.
+
+    The index is built once over a corpus of messages and can then be
+    queried many times: the occurrences of a byte sequence are computed by
+    intersecting the postings of its n-grams instead of scanning every
+    message. Each posting is a compact array of 64 bits entries which
+    encode both the position of the message in the indexed list and the
+    offset of the n-gram in this message.
+
+    >>> from netzob.all import *
+    >>> messages = [RawMessage(b"USER netzob\\r\\n"), RawMessage(b"PASS netzob\\r\\n"), RawMessage(b"USER root\\r\\n")]
+    >>> index = MessageIndex(messages)
+    >>> print(len(index))
+    3
+    >>> index.find(b"netzob")
+    [(0, 5), (1, 5)]
+    >>> index.find(b"USER")
+    [(0, 0), (2, 0)]
+    >>> index.find(b"\\r\\n")
+    [(0, 11), (1, 11), (2, 9)]
+    >>> index.find(b"zoby")
+    []
+
+    The index can be stored on disk and reloaded later for the same
+    list of messages. The stored index is identified by a digest of the
+    contents of the messages: if it does not match the given messages, or
+    if the file is truncated or corrupted, the index is rebuilt and stored
+    again.
+
+    >>> import os, shutil, tempfile
+    >>> directory = tempfile.mkdtemp()
+    >>> indexPath = os.path.join(directory, "capture.idx")
+    >>> index = MessageIndex(messages, filePath=indexPath)
+    >>> os.path.exists(indexPath)
+    True
+    >>> index = MessageIndex(messages, filePath=indexPath)
+    >>> index.find(b"root")
+    [(2, 5)]
+    >>> others = [RawMessage(b"xxxxxxxxxxxxx"), RawMessage(b"USER netzob\\r\\n"), RawMessage(b"PASS root\\r\\n")]
+    >>> index = MessageIndex(others, filePath=indexPath)
+    >>> index.find(b"root")
+    [(2, 5)]
+    >>> with open(indexPath, 'r+b') as fd:
+    ...     _ = fd.truncate(os.path.getsize(indexPath) - 3)
+    >>> index = MessageIndex(others, filePath=indexPath)
+    >>> index.find(b"USER")
+    [(1, 0)]
+    >>> shutil.rmtree(directory)
+
+    The postings are recomputed when the messages or the size of the
+    n-grams are modified.
+
+    >>> index.messages = messages
+    >>> index.find(b"netzob")
+    [(0, 5), (1, 5)]
+    >>> index.gramSize = 2
+    >>> index.find(b"netzob")
+    [(0, 5), (1, 5)]
+
+    """
+
+    FILE_MAGIC = b"NZBIDX02"
+
+    # header: magic, gram size, number of messages, digest of the messages, number of grams
+    FILE_HEADER = struct.Struct("<8sII32sI")
+
+    # each posting entry stores the message position in its 32 upper bits
+    # and the offset of the n-gram in the message in its 32 lower bits
+    OFFSET_BITS = 32
+    OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+    def __init__(self, messages, gramSize=3, filePath=None):
+        """Build the index over the specified messages.
+
+        :parameter messages: the messages to index
+        :type messages: a list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage`
+        :keyword gramSize: the size (in bytes) of the indexed n-grams
+        :type gramSize: :class:`int`
+        :keyword filePath: an optional path where the index is stored. If it already holds an index of the messages, it is loaded instead of being recomputed.
+        :type filePath: :class:`str`
+        :raise: TypeError or ValueError if parameters are not valid.
+        """
+        self.__postings = None
+        self.gramSize = gramSize
+        self.messages = messages
+
+        if filePath is not None and os.path.exists(filePath) and self.__load(filePath):
+            return
+
+        self.__build()
+        if filePath is not None:
+            self.save(filePath)
+
+    def __build(self):
+        """Compute the postings of all the n-grams found in the messages."""
+        n = self.gramSize
+        postings = dict()
+        for iMessage, content in enumerate(self.__contents):
+            base = iMessage << MessageIndex.OFFSET_BITS
+            for offset in range(len(content) - n + 1):
+                gram = content[offset:offset + n]
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = array('Q')
+                    postings[gram] = posting
+                posting.append(base | offset)
+        self.__postings = postings
+
+        self._logger.debug("{0} distinct {1}-grams indexed over {2} messages",
+                           len(postings), n, len(self.messages))
+
+    @typeCheck(str)
+    def save(self, filePath):
+        """Store the current index in the specified file.
+
+        :parameter filePath: the path of the file where the index is stored
+        :type filePath: :class:`str`
+        """
+        if filePath is None:
+            raise TypeError("File path cannot be None")
+
+        with open(filePath, 'wb') as fd:
+            fd.write(MessageIndex.FILE_HEADER.pack(
+                MessageIndex.FILE_MAGIC, self.gramSize, len(self.messages),
+                self.__digest(), len(self.__postings)))
+            # the postings are followed by their digest
+            checksum = hashlib.sha256()
+            for gram, posting in self.__postings.items():
+                if sys.byteorder != 'little':
+                    posting = array('Q', posting)
+                    posting.byteswap()
+                for chunk in (gram, struct.pack("<I", len(posting)),
+                              posting.tobytes()):
+                    checksum.update(chunk)
+                    fd.write(chunk)
+            fd.write(checksum.digest())
+
+    def __load(self, filePath):
+        """Load the index stored in the specified file.
+
+        :return: True if the stored index matches the current messages
+        :rtype: :class:`bool`
+        """
+        try:
+            with open(filePath, 'rb') as fd:
+                header = fd.read(MessageIndex.FILE_HEADER.size)
+                if len(header) != MessageIndex.FILE_HEADER.size:
+                    raise ValueError("truncated header")
+                magic, gramSize, nbMessages, digest, nbGrams = MessageIndex.FILE_HEADER.unpack(
+                    header)
+                if magic != MessageIndex.FILE_MAGIC or gramSize != self.gramSize or nbMessages != len(
+                        self.messages) or digest != self.__digest():
+                    self._logger.debug(
+                        "Index stored in {0} does not match the messages, it will be rebuilt",
+                        filePath)
+                    return False
+                body = fd.read()
+
+            checksumSize = hashlib.sha256().digest_size
+            if len(body) < checksumSize or hashlib.sha256(
+                    body[:-checksumSize]).digest() != body[-checksumSize:]:
+                raise ValueError("invalid checksum")
+
+            postings = dict()
+            position = 0
+            for i in range(nbGrams):
+                gram = body[position:position + gramSize]
+                nbEntries, = struct.unpack_from("<I", body,
+                                                position + gramSize)
+                position += gramSize + 4
+                posting = array('Q')
+                posting.frombytes(
+                    body[position:position + nbEntries * posting.itemsize])
+                position += nbEntries * posting.itemsize
+                if sys.byteorder != 'little':
+                    posting.byteswap()
+                postings[gram] = posting
+            if position != len(body) - checksumSize:
+                raise ValueError("unexpected size of the postings")
+        except (OSError, ValueError, struct.error) as e:
+            self._logger.debug(
+                "Index stored in {0} cannot be read ({1}), it will be rebuilt",
+                filePath, e)
+            return False
+
+        self.__postings = postings
+        return True
+
+    def __digest(self):
+        """Computes a digest which identifies the contents of the indexed
+        messages."""
+        digest = hashlib.sha256()
+        for content in self.__contents:
+            digest.update(struct.pack("<Q", len(content)))
+            digest.update(content)
+        return digest.digest()
+
+    def find(self, data):
+        """Search the specified bytes in the indexed messages.
+
+        :parameter data: the byte sequence to search after
+        :type data: :class:`bytes`
+        :return: the sorted list of occurrences given as (message position, byte offset)
+        :rtype: a list of tuples (:class:`int`, :class:`int`)
+        """
+        if data is None or len(data) == 0:
+            raise TypeError("Data to search cannot be None or empty")
+
+        n = self.gramSize
+        contents = self.__contents
+
+        if len(data) < n:
+            # the pattern is too short to be covered by an n-gram
+            occurrences = []
+            for iMessage, content in enumerate(contents):
+                offset = content.find(data)
+                while offset != -1:
+                    occurrences.append((iMessage, offset))
+                    offset = content.find(data, offset + 1)
+            return occurrences
+
+        # retrieve the posting of each n-gram of the pattern with its relative position
+        grams = []
+        for position in range(len(data) - n + 1):
+            posting = self.__postings.get(data[position:position + n])
+            if posting is None:
+                return []
+            grams.append((len(posting), position, posting))
+        grams.sort(key=lambda g: g[0])
+
+        # candidate starts are given by the rarest n-gram
+        _, position, posting = grams[0]
+        candidates = set(entry - position for entry in posting
+                         if entry & MessageIndex.OFFSET_MASK >= position)
+
+        # and reduced with the second rarest one
+        if len(grams) > 1 and len(candidates) > 1:
+            _, position, posting = grams[1]
+            candidates.intersection_update(entry - position
+                                           for entry in posting)
+
+        occurrences = []
+        for entry in sorted(candidates):
+            iMessage = entry >> MessageIndex.OFFSET_BITS
+            offset = entry & MessageIndex.OFFSET_MASK
+            if contents[iMessage][offset:offset + len(data)] == data:
+                occurrences.append((iMessage, offset))
+        return occurrences
+
+    def indexOf(self, message):
+        """Returns the position of the specified message in the index or None
+        if the message is not indexed."""
+        return self.__positions.get(id(message))
+
+    def __len__(self):
+        """Returns the number of indexed messages."""
+        return len(self.messages)
+
+    @property
+    def messages(self):
+        """The indexed messages.
+
+        :type: a list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage`
+        """
+        return self.__messages
+
+    @messages.setter
+    @typeCheck(list)
+    def messages(self, messages):
+        if messages is None:
+            raise TypeError("Messages cannot be None")
+        contents = []
+        for message in messages:
+            data = message.data
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            contents.append(bytes(data))
+        self.__messages = messages
+        self.__contents = contents
+        self.__positions = dict(
+            (id(message), i) for i, message in enumerate(messages))
+        if self.__postings is not None:
+            self.__build()
+
+    @property
+    def gramSize(self):
+        """The size in bytes of the indexed n-grams.
+
+        :type: :class:`int`
+        """
+        return self.__gramSize
+
+    @gramSize.setter
+    @typeCheck(int)
+    def gramSize(self, gramSize):
+        if gramSize is None:
+            raise TypeError("Gram size cannot be None")
+        if gramSize < 1:
+            raise ValueError("Gram size must be greater than 0")
+        self.__gramSize = gramSize
+        if self.__postings is not None:
+            self.__build()
@@ -35,6 +35,7 @@
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
 import itertools
+import logging
 import multiprocessing
 
 #+---------------------------------------------------------------------------+
@@ -98,7 +99,8 @@ class SearchEngine(object):
     """
 
     def __init__(self):
-        pass
+        # mutations of the searched data, indexed by the key of their type
+        self.__mutations = dict()
 
     @staticmethod
     @typeCheck(AbstractType, AbstractMessage, bool)
@@ -145,7 +147,8 @@ class SearchEngine(object):
                              messages,
                              addTags=True,
                              inParallel=True,
-                             dataLabels=None):
+                             dataLabels=None,
+                             index=None):
         """Search all the data specified in the given messages. Per default, this operation is executed in parallel.
 
         Example of a search operation executed in sequential
@@ -177,6 +180,18 @@ class SearchEngine(object):
         >>> print(results)
         25 occurence(s) found.
 
+        Example of a search operation executed over an index of the messages. The index
+        is built once and can be reused for every search on the same messages. Only byte-aligned
+        occurrences are retrieved through the index.
+
+        >>> index = MessageIndex(msgs)
+        >>> results = se.searchDataInMessages(sData, msgs, index=index)
+        >>> print(results)
+        25 occurence(s) found.
+        >>> results = se.searchDataInMessages([ASCII("Netzob")], msgs, index=index)
+        >>> print(results)
+        30 occurence(s) found.
+
         :parameter data: a list of data to search after. Each data must be provided with its netzob type.
         :type data: a list of :class:`netzob.Model.Vocabulary.Types.AbstractType.AbstractType`.
         :parameter messages: the messages in which the search will take place
@@ -187,6 +202,8 @@ class SearchEngine(object):
         :type addTags: :class:`bool`
         :keyword dataLabels: an optionnal dict to attach to each data a label to simplify search results identification
         :type dataLabels: dict
+        :keyword index: an optional index of the messages used instead of scanning them
+        :type index: :class:`netzob.Inference.Vocabulary.Search.MessageIndex.MessageIndex`
 
         :return: a list of search results detailling where and how occurrences where found. Occurences are also
         identified in the message through dedicated visualization functions automaticaly added to the message.
@@ -210,7 +227,11 @@ class SearchEngine(object):
         noDuplicateDatas = list(set(datas))
 
         results = SearchResults()
-        if not inParallel:
+        if index is not None:
+            results.extend(
+                self.__searchDataInIndex(noDuplicateDatas, messages, index,
+                                         dataLabels))
+        elif not inParallel:
             # Measure start time
             # start = time.time()
 
@@ -253,6 +274,74 @@ class SearchEngine(object):
 
         return results
 
+    def __searchDataInIndex(self, datas, messages, index, dataLabels=None):
+        """Search the given data in the messages using the postings of the
+        specified index. Mutations are computed once for all the messages and
+        messages that are not part of the index are scanned.
+
+        :return: the obtained results
+        :rtype: a list of :class:`netzob.Inference.Vocabulary.Search.SearchResult.SearchResult`
+        """
+
+        # compute the mutations of each data and retrieve their byte-aligned occurrences
+        occurrencesPerPattern = dict()
+        dataMutations = []
+        for d in datas:
+            mutations = []
+            for mutationType, mutation in self.__getMutations(
+                    AbstractType.normalize(d)):
+                pattern = None
+                if len(mutation) % 8 == 0:
+                    pattern = bitarray(mutation.to01()).tobytes()
+                    if pattern not in occurrencesPerPattern:
+                        occurrences = dict()
+                        for iMessage, offset in index.find(pattern):
+                            occurrences.setdefault(iMessage,
+                                                   []).append(offset)
+                        occurrencesPerPattern[pattern] = occurrences
+                mutations.append((mutationType, mutation, pattern))
+            dataMutations.append((d, mutations))
+
+        results = SearchResults()
+        for message in messages:
+            iMessage = index.indexOf(message)
+            if iMessage is None:
+                results.extend(
+                    self.searchDataInMessage(datas, message, False,
+                                             dataLabels))
+                continue
+
+            target = None
+            for d, mutations in dataMutations:
+                props = dict()
+                props['message'] = message
+                props['data'] = d
+                if dataLabels is not None and d in list(dataLabels.keys()):
+                    props['label'] = dataLabels[d]
+
+                for mutationType, mutation, pattern in mutations:
+                    if pattern is None:
+                        if target is None:
+                            target = TypeConverter.convert(message.data, Raw,
+                                                           BitArray)
+                        ranges = [(startIndex, startIndex + len(mutation))
+                                  for startIndex in target.search(mutation)]
+                    else:
+                        offsets = occurrencesPerPattern[pattern].get(
+                            iMessage, [])
+                        ranges = [(offset * 8, (offset + len(pattern)) * 8)
+                                  for offset in offsets]
+                    if len(ranges) > 0:
+                        if target is None:
+                            target = TypeConverter.convert(message.data, Raw,
+                                                           BitArray)
+                        searchTask = SearchTask(
+                            mutation, mutationType, properties=props)
+                        results.append(
+                            SearchResult(target, searchTask, ranges))
+
+        return results
+
     @typeCheck(list, AbstractMessage, bool)
     def searchDataInMessage(self, data, message, addTags=True,
                             dataLabels=None):
@@ -337,6 +426,7 @@ class SearchEngine(object):
         if searchCases is None:
             raise TypeError("There should be at least one search case.")
 
+        debug = self._logger.isEnabledFor(logging.DEBUG)
         results = SearchResults()
         for (target, searchTask) in searchCases:
             if target is None or not isinstance(
@@ -348,8 +438,10 @@ class SearchEngine(object):
 
             ranges = []
             for startIndex in target.search(searchTask.data):
-                self._logger.debug("Search found {}: {}>{}".format(
-                    searchTask.data, startIndex, len(searchTask.data)))
+                if debug:
+                    self._logger.debug("Search found {}: {}>{}",
+                                       searchTask.data, startIndex,
+                                       len(searchTask.data))
                 ranges.append((startIndex, startIndex + len(searchTask.data)))
 
             if len(ranges) > 0:
@@ -374,5 +466,16 @@ class SearchEngine(object):
 
         return [
             SearchTask(mutation, mutationType, properties=properties)
-            for mutationType, mutation in list(data.mutate().items())
+            for mutationType, mutation in self.__getMutations(data)
         ]
+
+    def __getMutations(self, data):
+        """Returns the mutations of the specified data as a list of tuples
+        (mutationType, mutation). They are computed once per data and
+        reused for every message the engine searches in.
+        """
+        mutations = self.__mutations.get(data.key)
+        if mutations is None:
+            mutations = self.__mutations[data.key] = list(
+                data.mutate().items())
+        return mutations
@@ -30,3 +30,4 @@
 # see docs.python.org/2/tutorial/modules.html
 
 from netzob.Inference.Vocabulary.Search.SearchEngine import SearchEngine
+from netzob.Inference.Vocabulary.Search.MessageIndex import MessageIndex
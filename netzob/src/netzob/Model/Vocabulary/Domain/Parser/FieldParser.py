@@ -201,8 +201,8 @@ class FieldParser():
         # check we have something to parse
         data = parsingPath.getDataAssignedToField(self.field)
 
-        self._logger.debug("Parses '{0}' with field '{1}' specifications".
-                           format(data, self.field.name))
+        self._logger.debug("Parses '{0}' with field '{1}' specifications",
+                           data, self.field.name)
 
         # we assign this data to the field's variable
         parsingPath.assignDataToVariable(data.copy(), self.field.domain)
@@ -221,8 +221,7 @@ class FieldParser():
                     yield resultParsingPath
                 except Exception as e:
                     self._logger.debug(
-                        "An error occurred while parsing variable : {}".format(
-                            e))
+                        "An error occurred while parsing variable : {}", e)
 
     @property
     def field(self):
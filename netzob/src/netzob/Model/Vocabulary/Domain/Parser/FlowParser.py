@@ -199,8 +199,8 @@ class FlowParser(object):
             raise Exception("Nothing to parse")
 
         for symbol in symbols:
-            self._logger.debug("Parsing '{}' with Symbol '{}'".format(
-                data_to_parse_bitarray, symbol.name))
+            self._logger.debug("Parsing '{}' with Symbol '{}'",
+                               data_to_parse_bitarray, symbol.name)
             flow_parsing_results = []
             try:
                 mp = MessageParser(memory=memory)
@@ -218,8 +218,8 @@ class FlowParser(object):
 
                     if len(remainings_bitarray) > 0:
                         self._logger.debug(
-                            "Try to parse the remaining data '{}' with another symbol".
-                            format(remainings_bitarray))
+                            "Try to parse the remaining data '{}' with another symbol",
+                            remainings_bitarray)
                         try:
                             child_flow_parsings = self._parseFlow_internal(
                                 remainings_bitarray, symbols,
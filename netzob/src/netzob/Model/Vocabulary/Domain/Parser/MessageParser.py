@@ -162,11 +162,12 @@ class MessageParser(object):
 
     """
 
-    def __init__(self, memory=None):
+    def __init__(self, memory=None, parsingCache=None):
         if memory is None:
             self.memory = Memory()
         else:
             self.memory = memory
+        self.parsingCache = parsingCache
 
     @typeCheck(AbstractMessage, Symbol)
     def parseMessage(self, message, symbol):
@@ -209,12 +210,14 @@ class MessageParser(object):
         
         """
 
-        self._logger.debug(
-            "New parsing method executed on {}".format(bitArrayToParse))
+        self._logger.debug("New parsing method executed on {}",
+                           bitArrayToParse)
 
         # building a new parsing path
-        currentParsingPath = ParsingPath(bitArrayToParse.copy(),
-                                         self.memory.duplicate())
+        currentParsingPath = ParsingPath(
+            bitArrayToParse.copy(),
+            self.memory.duplicate(),
+            parsingCache=self.parsingCache)
         currentParsingPath.assignDataToField(bitArrayToParse.copy(), fields[0])
 
         # field iterator
@@ -245,8 +248,8 @@ class MessageParser(object):
                                 i_current_field,
                                 must_consume_everything=True):
         self._logger.debug(
-            "_parseBitArrayWithField executed for field {} with path : {}".
-            format(i_current_field, parsingPath))
+            "_parseBitArrayWithField executed for field {} with path : {}",
+            i_current_field, parsingPath)
         currentField = fields[i_current_field]
 
         carnivorous_parsing = (i_current_field == len(fields) - 1)
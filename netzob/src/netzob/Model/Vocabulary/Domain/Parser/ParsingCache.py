@@ -0,0 +1,183 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+from collections import OrderedDict
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+
+
+@NetzobLogger
+class ParsingCache(object):
+    """A bounded cache of the results of :meth:`AbstractType.canParse`.
+
+    When many messages are parsed against the same fields, the same
+    types are often checked against the same data (constant headers,
+    keywords, ...). The cache memoizes the results given the
+    :attr:`parsingKey` of the type and the candidate data, and keeps at
+    most `maxSize` results: the least recently used ones are discarded
+    first. It is meant to be shared by the parsers of a single run, such
+    as an alignment (see :class:`DataAlignment`).
+
+    >>> from netzob.all import *
+    >>> from netzob.Model.Vocabulary.Domain.Parser.ParsingCache import ParsingCache
+    >>> cache = ParsingCache(maxSize=2)
+    >>> data = TypeConverter.convert("netzob", ASCII, BitArray)
+    >>> cache.canParse(ASCII(nbChars=(1, 10)), data)
+    True
+    >>> cache.canParse(ASCII(nbChars=(1, 10)), data)
+    True
+    >>> cache.canParse(ASCII(nbChars=(1, 3)), data)
+    False
+    >>> print(cache.hits, cache.misses, len(cache))
+    1 2 2
+    >>> print(cache.hitRate)
+    0.3333333333333333
+
+    Once full, the least recently used result is discarded.
+
+    >>> cache.canParse(Raw(), data)
+    True
+    >>> print(len(cache))
+    2
+    >>> cache.canParse(ASCII(nbChars=(1, 3)), data)
+    False
+    >>> cache.canParse(ASCII(nbChars=(1, 10)), data)
+    True
+    >>> print(cache)
+    ParsingCache (2/2 entries, 2 hits, 4 misses, hit rate 33.3%)
+
+    Data having the same bytes but a different endianness are distinct.
+
+    >>> from bitarray import bitarray
+    >>> cache.clear()
+    >>> bigEndian = bitarray('10000000', endian='big')
+    >>> littleEndian = bitarray('00000001', endian='little')
+    >>> bigEndian.tobytes() == littleEndian.tobytes()
+    True
+    >>> cache.canParse(Raw(), bigEndian), cache.canParse(Raw(), littleEndian)
+    (True, True)
+    >>> print(cache.hits, cache.misses)
+    0 2
+
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, maxSize=DEFAULT_MAX_SIZE):
+        """Constructor.
+
+        :keyword maxSize: the maximum number of results kept in the cache
+        :type maxSize: :class:`int`
+        """
+        self.maxSize = maxSize
+        self.clear()
+
+    def __str__(self):
+        return "ParsingCache ({0}/{1} entries, {2} hits, {3} misses, hit rate {4:.1%})".format(
+            len(self), self.maxSize, self.hits, self.misses, self.hitRate)
+
+    def __len__(self):
+        return len(self.__results)
+
+    def canParse(self, dataType, data):
+        """Returns the result of ``dataType.canParse(data)``, computing it
+        only if it is not already in the cache.
+
+        :parameter dataType: the type which parses the data
+        :type dataType: :class:`netzob.Model.Vocabulary.Types.AbstractType.AbstractType`
+        :parameter data: the candidate data
+        :type data: :class:`bitarray`
+        :rtype: :class:`bool`
+        """
+        # bitarray objects cannot be hashed, the length is required as
+        # tobytes() pads the last byte, and the endianness as it changes
+        # the order of the bits in the bytes
+        key = (dataType.parsingKey, data.endian(), len(data), data.tobytes())
+        results = self.__results
+        result = results.get(key)
+        if result is not None:
+            self.hits += 1
+            results.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = dataType.canParse(data)
+        results[key] = result
+        if len(results) > self.maxSize:
+            results.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Discard all the results and reset the statistics."""
+        self.__results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hitRate(self):
+        """The ratio of the calls to :meth:`canParse` which were answered
+        by the cache (0 if it was never called).
+
+        :type: :class:`float`
+        """
+        nbCalls = self.hits + self.misses
+        if nbCalls == 0:
+            return 0.0
+        return self.hits / nbCalls
+
+    @property
+    def maxSize(self):
+        """The maximum number of results kept in the cache.
+
+        :type: :class:`int`
+        """
+        return self.__maxSize
+
+    @maxSize.setter
+    @typeCheck(int)
+    def maxSize(self, maxSize):
+        if maxSize is None:
+            raise TypeError("MaxSize cannot be None")
+        if maxSize <= 0:
+            raise ValueError("MaxSize must be >0")
+        self.__maxSize = maxSize
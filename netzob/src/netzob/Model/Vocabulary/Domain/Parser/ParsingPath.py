@@ -58,13 +58,15 @@ class ParsingPath(GenericPath):
                  dataAssignedToVariable=None,
                  fieldsCallbacks=None,
                  ok=None,
-                 parsedData=None):
+                 parsedData=None,
+                 parsingCache=None):
         super(ParsingPath, self).__init__(
             memory,
             dataAssignedToField=dataAssignedToField,
             dataAssignedToVariable=dataAssignedToVariable,
             fieldsCallbacks=fieldsCallbacks)
         self.originalDataToParse = dataToParse.copy()
+        self.parsingCache = parsingCache
         if ok is None:
             self.__ok = True
         else:
@@ -106,7 +108,8 @@ class ParsingPath(GenericPath):
             dataAssignedToField=dField,
             dataAssignedToVariable=dVariable,
             fieldsCallbacks=fCall,
-            ok=self.ok())
+            ok=self.ok(),
+            parsingCache=self.parsingCache)
 
         return result
 
@@ -80,8 +80,8 @@ class VariableParserPath(object):
         variableParserResult = VariableParserResult(variable, parserResult,
                                                     consumedData, remainedData)
         if parserResult:
-            self._logger.debug("New parser result attached to path {0}: {1}".
-                               format(self, variableParserResult))
+            self._logger.debug("New parser result attached to path {0}: {1}",
+                               self, variableParserResult)
             self.remainingData = variableParserResult.remainedData
 
             if self.consumedData is None:
@@ -94,8 +94,7 @@ class VariableParserPath(object):
 
         self.variableParserResults.append(variableParserResult)
         self._logger.debug(
-            "After registering new VariablePathResult, Path is {0}".format(
-                self))
+            "After registering new VariablePathResult, Path is {0}", self)
 
     def __str__(self):
         return "Path {0} (consumedData={1}, remainingData={2}".format(
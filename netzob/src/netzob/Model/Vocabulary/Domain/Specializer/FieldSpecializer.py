@@ -128,7 +128,7 @@ class FieldSpecializer(object):
         if specializingPath is None:
             specializingPath = SpecializingPath(memory=Memory())
 
-        self._logger.debug("Specialize field {0}".format(self.field.name))
+        self._logger.debug("Specialize field {0}", self.field.name)
 
         # does an arbitrary value is specified ?
         if self.arbitraryValue is not None:
@@ -203,8 +203,7 @@ class FieldSpecializer(object):
                 resultSpecializingPath.addResult(self.field.domain,
                                                  assignedData)
 
-            self._logger.debug(
-                "FieldSpecializer Result: {0}".format(assignedData))
+            self._logger.debug("FieldSpecializer Result: {0}", assignedData)
             resultSpecializingPath.addResultToField(self.field, assignedData)
 
         return resultSpecializingPaths
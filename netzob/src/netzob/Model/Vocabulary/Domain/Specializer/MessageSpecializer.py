@@ -35,6 +35,7 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
+import logging
 from bitarray import bitarray
 
 # +---------------------------------------------------------------------------+
@@ -111,15 +112,17 @@ class MessageSpecializer(object):
         if symbol is None:
             raise Exception("Specified symbol is None")
 
-        self._logger.debug("Specifies symbol '{0}'.".format(symbol.name))
+        self._logger.debug("Specifies symbol '{0}'.", symbol.name)
 
         self._update_presets(symbol)
 
         # this variable host all the specialization path
         specializingPaths = [SpecializingPath(memory=self.memory)]
 
+        debug = self._logger.isEnabledFor(logging.DEBUG)
         for field in symbol.fields:
-            self._logger.debug("Specializing field {0}".format(field.name))
+            if debug:
+                self._logger.debug("Specializing field {0}", field.name)
 
             fieldDomain = field.domain
             if fieldDomain is None:
@@ -179,9 +182,11 @@ class MessageSpecializer(object):
 
         retainedPath.generatedContent = generatedContent
 
-        self._logger.debug("Specialized message: {0}".format(
-            TypeConverter.convert(retainedPath.generatedContent, BitArray,
-                                  ASCII)))
+        if debug:
+            self._logger.debug(
+                "Specialized message: {0}",
+                TypeConverter.convert(retainedPath.generatedContent, BitArray,
+                                      ASCII))
         self.memory = retainedPath.memory
 
         return retainedPath
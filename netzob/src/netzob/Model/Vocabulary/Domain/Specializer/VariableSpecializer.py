@@ -67,7 +67,7 @@ class VariableSpecializer():
         variableSpecializingPaths = self.variable.specialize(specializingPath)
 
         self._logger.debug(
-            "Specializing variable '{0}' generated '{1}' valid paths".format(
-                self.variable, len(variableSpecializingPaths)))
+            "Specializing variable '{0}' generated '{1}' valid paths",
+            self.variable, len(variableSpecializingPaths))
 
         return variableSpecializingPaths
@@ -355,17 +355,14 @@ class Data(AbstractVariableLeaf):
 
         content = parsingPath.getDataAssignedToVariable(self)
 
-        self._logger.debug(
-            "DomainCMP {0} with {1}".format(content, self.dataType))
+        self._logger.debug("DomainCMP {0} with {1}", content, self.dataType)
 
-        (minSize, maxSize) = self.dataType.size
-        if maxSize is None:
-            maxSize = len(content)
+        minSize = self.dataType.size[0]
 
         if len(content) < minSize:
             self._logger.debug(
-                "Length of the content is too short ({0}), expect data of at least {1} bits".
-                format(len(content), minSize))
+                "Length of the content is too short ({0}), expect data of at least {1} bits",
+                len(content), minSize)
         else:
 
             # if carnivorous:
@@ -398,15 +395,23 @@ class Data(AbstractVariableLeaf):
             #         newParsingPath.addResult(self, content[:size].copy())
             #         yield newParsingPath
 
-            for size in range(min(maxSize, len(content)), minSize - 1, -1):
+            for size in self.dataType.parsingSizes(len(content)):
                 # size == 0 : deals with 'optional' data
-                if size == 0 or self.dataType.canParse(content[:size]):
+                if size == 0 or self.__canParse(parsingPath, content[:size]):
                     # we create a new parsing path and returns it
                     newParsingPath = parsingPath.duplicate()
 
                     newParsingPath.addResult(self, content[:size].copy())
                     yield newParsingPath
 
+    def __canParse(self, parsingPath, data):
+        """Checks if the data type can parse the data, using the parsing
+        cache attached to the path if any."""
+        parsingCache = parsingPath.parsingCache
+        if parsingCache is None:
+            return self.dataType.canParse(data)
+        return parsingCache.canParse(self.dataType, data)
+
     @typeCheck(ParsingPath)
     def valueCMP(self, parsingPath, acceptCallBack=True, carnivorous=False):
         if parsingPath is None:
@@ -437,8 +442,8 @@ class Data(AbstractVariableLeaf):
             parsingPath.addResult(self, expectedValue.copy())
             results.append(parsingPath)
         else:
-            self._logger.debug("{0} cannot be parsed with variable {1}".format(
-                content, self.id))
+            self._logger.debug("{0} cannot be parsed with variable {1}",
+                               content, self.id)
         return results
 
     @typeCheck(ParsingPath)
@@ -449,26 +454,23 @@ class Data(AbstractVariableLeaf):
 
         content = parsingPath.getDataAssignedToVariable(self)
 
-        self._logger.debug("Learn {0} with {1}".format(content, self.dataType))
-
-        (minSize, maxSize) = self.dataType.size
-        if maxSize is None:
-            maxSize = len(content)
+        self._logger.debug("Learn {0} with {1}", content, self.dataType)
 
+        minSize = self.dataType.size[0]
 
         if len(content) < minSize:
             self._logger.debug(
-                "Length of the content is too short ({0}), expect data of at least {1} bits".
-                format(len(content), minSize))
+                "Length of the content is too short ({0}), expect data of at least {1} bits",
+                len(content), minSize)
         else:
 
             #        if carnivorous:
             #            minSize = len(content)
             #            maxSize = len(content)
 
-            for size in range(min(maxSize, len(content)), minSize - 1, -1):
+            for size in self.dataType.parsingSizes(len(content)):
                 # size == 0 : deals with 'optional' data
-                if size == 0 or self.dataType.canParse(content[:size]):
+                if size == 0 or self.__canParse(parsingPath, content[:size]):
                     # we create a new parsing path and returns it
                     newParsingPath = parsingPath.duplicate()
                     newParsingPath.addResult(self, content[:size].copy())
@@ -503,7 +505,7 @@ class Data(AbstractVariableLeaf):
         It creates a VariableSpecializerResult in the provided path that
         contains a generated value that follows the definition of the Data
         """
-        self._logger.debug("Regenerate Variable {0}".format(self))
+        self._logger.debug("Regenerate Variable {0}", self)
 
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
@@ -521,7 +523,7 @@ class Data(AbstractVariableLeaf):
         It memorizes the value present in the path of the variable
         """
 
-        self._logger.debug("RegenerateAndMemorize Variable {0}".format(self))
+        self._logger.debug("RegenerateAndMemorize Variable {0}", self)
 
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
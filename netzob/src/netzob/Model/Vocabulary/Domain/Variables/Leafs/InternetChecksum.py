@@ -35,7 +35,8 @@
 #+---------------------------------------------------------------------------+
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
-import random
+import logging
+
 #+---------------------------------------------------------------------------+
 #| Related third party imports                                               |
 #+---------------------------------------------------------------------------+
@@ -134,8 +135,8 @@ class InternetChecksum(AbstractRelationVariableLeaf):
 
         content = parsingPath.getDataAssignedToVariable(self)
         possibleValue = content[:sizeOfPossibleValue[1]]
-        self._logger.debug("Possible value of Internet Checksum field: {0}".
-                           format(possibleValue))
+        self._logger.debug("Possible value of Internet Checksum field: {0}",
+                           possibleValue)
 
         expectedValue = self._computeExpectedValue(parsingPath)
         if expectedValue is None:
@@ -164,8 +165,8 @@ class InternetChecksum(AbstractRelationVariableLeaf):
 
         results = []
         self._logger.debug(
-            "domainCMP executed on {0} by an Internet Checksum domain".format(
-                parsingPath))
+            "domainCMP executed on {0} by an Internet Checksum domain",
+            parsingPath)
 
         minSize, maxSize = self.dataType.size
         if minSize != maxSize:
@@ -214,7 +215,9 @@ class InternetChecksum(AbstractRelationVariableLeaf):
         hasValue = True
         for field in self.fieldDependencies:
             if field.domain is not self and not parsingPath.isDataAvailableForVariable(field.domain):
-                self._logger.debug("The following field domain has no value: '{0}'".format(field.domain))
+                self._logger.debug(
+                    "The following field domain has no value: '{0}'",
+                    field.domain)
                 hasValue = False
 
         if not hasValue:
@@ -225,7 +228,7 @@ class InternetChecksum(AbstractRelationVariableLeaf):
             fieldValues = []
             for field in self.fieldDependencies:
                 if field.domain is self:
-                    fieldSize = random.randint(field.domain.dataType.size[0], field.domain.dataType.size[1])
+                    fieldSize = AbstractType.randomGenerator().randint(field.domain.dataType.size[0], field.domain.dataType.size[1])
                     fieldValue = TypeConverter.convert(b"\x00" * int(fieldSize / 8), Raw, BitArray)
                 else:
                     fieldValue = parsingPath.getDataAssignedToVariable(field.domain)
@@ -262,7 +265,7 @@ class InternetChecksum(AbstractRelationVariableLeaf):
         It creates a VariableSpecializerResult in the provided path that
         contains a generated value that follows the definition of the Data
         """
-        self._logger.debug("Regenerate Internet Checksum {0}".format(self))
+        self._logger.debug("Regenerate Internet Checksum {0}", self)
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
 
@@ -271,8 +274,8 @@ class InternetChecksum(AbstractRelationVariableLeaf):
             variableSpecializerPath.addResult(self, newValue.copy())
         except Exception as e:
             self._logger.debug(
-                "Cannot specialize since no value is available for the Internet checksum dependencies, we create a callback function in case it can be computed later: {0}".
-                format(e))
+                "Cannot specialize since no value is available for the Internet checksum dependencies, we create a callback function in case it can be computed later: {0}",
+                e)
             pendingValue = TypeConverter.convert("PENDING VALUE", ASCII,
                                                  BitArray)
             variableSpecializerPath.addResult(self, pendingValue)
@@ -287,8 +290,10 @@ class InternetChecksum(AbstractRelationVariableLeaf):
         return [variableSpecializerPath]
 
     def __checksum(self, msg):
-        self._logger.debug("Computing checksum of {0}, {1}".format(
-            TypeConverter.convert(msg, Raw, HexaString), len(msg)))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Computing checksum of {0}, {1}",
+                               TypeConverter.convert(msg, Raw, HexaString),
+                               len(msg))
 
         def carry_around_add(a, b):
             c = a + b
@@ -167,9 +167,8 @@ class Value(AbstractRelationVariableLeaf):
 
         # we verify we have access to the expected value
         expectedValue = self._computeExpectedValue(parsingPath)
-        
-        self._logger.debug(
-            "Expected value to parse: {0}".format(expectedValue))
+
+        self._logger.debug("Expected value to parse: {0}", expectedValue)
 
         if expectedValue is None:
 
@@ -191,8 +190,7 @@ class Value(AbstractRelationVariableLeaf):
                 results.append(newParsingPath)
         else:
             if content[:len(expectedValue)] == expectedValue:
-                self._logger.debug(
-                    "add result: {0}".format(expectedValue.copy()))
+                self._logger.debug("add result: {0}", expectedValue)
                 parsingPath.addResult(self, expectedValue.copy())
                 results.append(parsingPath)
 
@@ -240,7 +238,7 @@ class Value(AbstractRelationVariableLeaf):
         It creates a VariableSpecializerResult in the provided path that
         contains a generated value that follows the definition of the Data
         """
-        self._logger.debug("Regenerate value {0}".format(self))
+        self._logger.debug("Regenerate value {0}", self)
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
 
@@ -250,8 +248,8 @@ class Value(AbstractRelationVariableLeaf):
             variableSpecializerPath.addResult(self, newValue)
         except Exception as e:
             self._logger.debug(
-                "Cannot specialize since no value is available for the value dependencies, we create a callback function in case it can be computed later: {0}".
-                format(e))
+                "Cannot specialize since no value is available for the value dependencies, we create a callback function in case it can be computed later: {0}",
+                e)
 
             pendingValue = TypeConverter.convert("PENDING VALUE", ASCII,
                                                  BitArray)
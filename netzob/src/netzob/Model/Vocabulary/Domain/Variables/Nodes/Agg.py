@@ -120,8 +120,8 @@ class Agg(AbstractVariableNode):
         """Parse the content with the definition domain of the aggregate.
         """
         dataToParse = parsingPath.getDataAssignedToVariable(self).copy()
-        self._logger.debug("Parse '{0}' as {1} with parser path '{2}'".format(
-            dataToParse, self, parsingPath))
+        self._logger.debug("Parse '{0}' as {1} with parser path '{2}'",
+                           dataToParse, self, parsingPath)
 
         # initialy, there is a unique path to test (the provided one)
         parsingPath.assignDataToVariable(dataToParse.copy(), self.children[0])
@@ -138,8 +138,8 @@ class Agg(AbstractVariableNode):
             newParsingPaths = []
 
             for parsingPath in parsingPaths:
-                self._logger.debug(
-                    "Parse {0} with {1}".format(current_child.id, parsingPath))
+                self._logger.debug("Parse {0} with {1}", current_child.id,
+                                   parsingPath)
                 value_before_parsing = parsingPath.getDataAssignedToVariable(
                     current_child).copy()
                 childParsingPaths = current_child.parse(
@@ -157,16 +157,16 @@ class Agg(AbstractVariableNode):
 
                         # at least one child path managed to parse, we save the valid paths it produced
                         self._logger.debug(
-                            "Children {0} succesfuly applied with the parsingPath {1}".
-                            format(current_child, parsingPath))
+                            "Children {0} succesfuly applied with the parsingPath {1}",
+                            current_child, parsingPath)
                         newParsingPaths.append(childParsingPath)
 
             parsingPaths = newParsingPaths
 
             if len(parsingPaths) == 0:
                 self._logger.debug(
-                    "Children {0} didn't apply to any of the parser path we have, we stop Agg parser".
-                    format(current_child))
+                    "Children {0} didn't apply to any of the parser path we have, we stop Agg parser",
+                    current_child)
                 return []  # return no valid paths
 
         # ok we managed to parse all the children, and it produced some valid parser paths. We return them
@@ -194,12 +194,12 @@ class Agg(AbstractVariableNode):
         for child in self.children:
             newSpecializingPaths = []
 
-            self._logger.debug("Specializing AGG child with {0} paths".format(
-                len(specializingPaths)))
+            self._logger.debug("Specializing AGG child with {0} paths",
+                               len(specializingPaths))
 
             for specializingPath in specializingPaths:
-                self._logger.debug(
-                    "Spcialize {0} with {1}".format(child, specializingPath))
+                self._logger.debug("Spcialize {0} with {1}", child,
+                                   specializingPath)
 
                 childSpecializingPaths = child.specialize(specializingPath)
 
@@ -210,13 +210,13 @@ class Agg(AbstractVariableNode):
 
             specializingPaths = newSpecializingPaths
 
-        self._logger.debug("Specializing AGG child has produced {0} paths".
-                           format(len(specializingPaths)))
+        self._logger.debug("Specializing AGG child has produced {0} paths",
+                           len(specializingPaths))
 
         if len(specializingPaths) == 0:
             self._logger.debug(
-                "Children {0} didn't apply to any of the specializer path we have, we stop Agg specializer".
-                format(child))
+                "Children {0} didn't apply to any of the specializer path we have, we stop Agg specializer",
+                child)
             return []  # return no valid paths
 
         for specializingPath in specializingPaths:
@@ -34,7 +34,6 @@
 #+---------------------------------------------------------------------------+
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
-import random
 
 #+---------------------------------------------------------------------------+
 #| Related third party imports                                               |
@@ -47,6 +46,7 @@ from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Model.Vocabulary.Domain.Variables.Nodes.AbstractVariableNode import AbstractVariableNode
 from netzob.Model.Vocabulary.Domain.Parser.ParsingPath import ParsingPath
 from netzob.Model.Vocabulary.Domain.Specializer.SpecializingPath import SpecializingPath
+from netzob.Model.Vocabulary.Types.AbstractType import AbstractType
 
 
 @NetzobLogger
@@ -115,7 +115,7 @@ class Alt(AbstractVariableNode):
             raise Exception("Cannot parse data if ALT has no children")
 
         dataToParse = parsingPath.getDataAssignedToVariable(self)
-        self._logger.debug("Parse '{0}' with '{1}'".format(dataToParse, self))
+        self._logger.debug("Parse '{0}' with '{1}'", dataToParse, self)
 
         parserPaths = [parsingPath]
         parsingPath.assignDataToVariable(dataToParse.copy(), self.children[0])
@@ -130,8 +130,8 @@ class Alt(AbstractVariableNode):
         # parse each child according to its definition
         for i_child, child in enumerate(self.children):
             parsingPath = parserPaths[i_child]
-            self._logger.debug("ALT Parse of {0}/{1} with {2}".format(
-                i_child + 1, len(self.children), parsingPath))
+            self._logger.debug("ALT Parse of {0}/{1} with {2}", i_child + 1,
+                               len(self.children), parsingPath)
 
             childParsingPaths = child.parse(parsingPath)
             for childParsingPath in childParsingPaths:
@@ -156,16 +156,17 @@ class Alt(AbstractVariableNode):
         # parse each child according to its definition
         for i_child, child in enumerate(self.children):
             newSpecializingPath = specializingPath.duplicate()
-            self._logger.debug("ALT Specialize of {0}/{1} with {2}".format(
-                i_child + 1, len(self.children), newSpecializingPath))
+            self._logger.debug(
+                "ALT Specialize of {0}/{1} with {2}", i_child + 1,
+                len(self.children), newSpecializingPath)
 
             childSpecializingPaths = child.specialize(newSpecializingPath)
             if len(childSpecializingPaths) == 0:
-                self._logger.debug("Path {0} on child {1} didn't succeed.".
-                                   format(newSpecializingPath, child))
+                self._logger.debug("Path {0} on child {1} didn't succeed.",
+                                   newSpecializingPath, child)
             else:
-                self._logger.debug("Path {0} on child {1} succeed.".format(
-                    newSpecializingPath, child))
+                self._logger.debug("Path {0} on child {1} succeed.",
+                                   newSpecializingPath, child)
                 for childSpecializingPath in childSpecializingPaths:
                     childSpecializingPath.addResult(
                         self,
@@ -174,9 +175,9 @@ class Alt(AbstractVariableNode):
                 specializingPaths.extend(childSpecializingPaths)
 
         if len(specializingPaths) == 0:
-            self._logger.debug(
-                "No children of {0} successfuly specialized".format(self))
+            self._logger.debug("No children of {0} successfuly specialized",
+                               self)
 
         # lets shuffle this ( :) ) >>> by default we only consider the first valid parsing path.
-        random.shuffle(specializingPaths)
+        AbstractType.randomGenerator().shuffle(specializingPaths)
         return specializingPaths
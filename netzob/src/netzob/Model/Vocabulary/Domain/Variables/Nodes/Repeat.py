@@ -34,7 +34,6 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
-import random
 from bitarray import bitarray
 
 # +---------------------------------------------------------------------------+
@@ -48,6 +47,7 @@ from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Model.Vocabulary.Domain.Variables.Nodes.AbstractVariableNode import AbstractVariableNode
 from netzob.Model.Vocabulary.Domain.Parser.ParsingPath import ParsingPath
 from netzob.Model.Vocabulary.Domain.Specializer.SpecializingPath import SpecializingPath
+from netzob.Model.Vocabulary.Types.AbstractType import AbstractType
 
 
 @NetzobLogger
@@ -233,7 +233,7 @@ class Repeat(AbstractVariableNode):
             specializingPaths.extend(newSpecializingPaths)
 
         # lets shuffle this ( :) ) >>> by default we only consider the first valid parsing path.
-        random.shuffle(specializingPaths)
+        AbstractType.randomGenerator().shuffle(specializingPaths)
 
         return specializingPaths
 
@@ -53,7 +53,26 @@ from netzob.Model.Vocabulary.Functions.VisualizationFunction import Visualizatio
 
 @NetzobLogger
 class AbstractMessage(SortableObject):
-    """Every message must inherits from this class"""
+    """Every message must inherits from this class.
+
+    Messages are created in large numbers when captures are imported.
+    Their attributes are thus stored in slots, their id is only generated
+    when first needed and their metadata, semantic tags and visualization
+    functions are only created when first accessed.
+
+    >>> from netzob.all import *
+    >>> msg = RawMessage(b"hello")
+    >>> hasattr(msg, "__dict__")
+    False
+    >>> msg.id == msg.id
+    True
+    >>> msg.semanticTags
+    OrderedDict()
+    """
+
+    __slots__ = ("__data", "__session", "__id", "__messageType", "__date",
+                 "__source", "__destination", "__visualizationFunctions",
+                 "__metadata", "__semanticTags")
 
     def __init__(self,
                  data,
@@ -81,20 +100,27 @@ class AbstractMessage(SortableObject):
         """
         if data is None:
             data = ''
-        self.data = data
-        self.session = session
-        if _id is None:
-            _id = uuid.uuid4()
-        self.id = _id
+        self.__data = data
+        self.__session = session
+        self.__id = None
+        if _id is not None:
+            self.id = _id
         if date is None:
             date = time.mktime(time.gmtime())
         self.__messageType = messageType
         self.__date = date
         self.__source = source
         self.__destination = destination
-        self.__visualizationFunctions = TypedList(VisualizationFunction)
-        self.__metadata = OrderedDict()
-        self.__semanticTags = OrderedDict()
+        # the containers are created on first access
+        self.__visualizationFunctions = None
+        self.__metadata = None
+        self.__semanticTags = None
+
+    def __reduce_ex__(self, protocol):
+        # copies of the message share its id, hence it is generated first
+        if self.__id is None:
+            self.__id = uuid.uuid4()
+        return super(AbstractMessage, self).__reduce_ex__(protocol)
 
     @typeCheck(AbstractField)
     def isValidForField(self, field):
@@ -144,7 +170,7 @@ class AbstractMessage(SortableObject):
 
         if not self.isValueForMetadataValid(name, value):
             raise ValueError("The value of metadata {0} is not valid.")
-        self.__metadata[name] = value
+        self.metadata[name] = value
 
     def isValueForMetadataValid(self, name, value):
         """Computes if the specified value is compatible for the provided name of metadata
@@ -163,8 +189,8 @@ class AbstractMessage(SortableObject):
     def clearVisualizationFunctions(self):
         """Remove all the visualization functions attached to the current element"""
 
-        while (len(self.__visualizationFunctions) > 0):
-            self.__visualizationFunctions.pop()
+        while (len(self.visualizationFunctions) > 0):
+            self.visualizationFunctions.pop()
 
     def priority(self):
         """Return the value that will be used to represent the current message when sorted
@@ -226,10 +252,12 @@ class AbstractMessage(SortableObject):
 
     @property
     def id(self):
-        """The unique identified of the message
+        """The unique identified of the message, generated on first access.
 
         :type: UUID
         """
+        if self.__id is None:
+            self.__id = uuid.uuid4()
         return self.__id
 
     @id.setter
@@ -303,6 +331,8 @@ class AbstractMessage(SortableObject):
 
         :type: a dict<str, Object>
         """
+        if self.__metadata is None:
+            self.__metadata = OrderedDict()
         return self.__metadata
 
     @metadata.setter
@@ -322,7 +352,8 @@ class AbstractMessage(SortableObject):
 
         .. warning:: Setting this value with a list copies its members and not the list itself.
         """
-
+        if self.__visualizationFunctions is None:
+            self.__visualizationFunctions = TypedList(VisualizationFunction)
         return self.__visualizationFunctions
 
     @visualizationFunctions.setter
@@ -389,6 +420,8 @@ class AbstractMessage(SortableObject):
 
         :type: :class:`dict` with keys is int (position) and values is a list of str
         """
+        if self.__semanticTags is None:
+            self.__semanticTags = OrderedDict()
         return self.__semanticTags
 
     @semanticTags.setter
@@ -397,7 +430,15 @@ class AbstractMessage(SortableObject):
         if semanticTags is None:
             self.__semanticTags = OrderedDict()
 
-        # check
+        AbstractMessage._checkSemanticTags(semanticTags)
+        self.__semanticTags = semanticTags
+
+    @staticmethod
+    def _checkSemanticTags(semanticTags):
+        """Verify the semantic tags are a dict of positions to lists of tags.
+
+        :raise: TypeError if the semantic tags are not valid
+        """
         for key, value in list(semanticTags.items()):
             if not isinstance(key, int):
                 raise TypeError("At least one key is not a valid int position")
@@ -410,5 +451,3 @@ class AbstractMessage(SortableObject):
                     raise TypeError(
                         "At least one value of the provided dict is not a list of string"
                     )
-
-        self.__semanticTags = semanticTags
@@ -55,6 +55,8 @@ class L2NetworkMessage(RawMessage):
 
     """
 
+    __slots__ = ("__l2Protocol", "__l2SourceAddress", "__l2DestinationAddress")
+
     def __init__(self,
                  data,
                  date=None,
@@ -67,9 +69,9 @@ class L2NetworkMessage(RawMessage):
             source=l2SourceAddress,
             destination=l2DestinationAddress,
             messageType="Network")
-        self.l2Protocol = str(l2Protocol)
-        self.l2SourceAddress = str(l2SourceAddress)
-        self.l2DestinationAddress = str(l2DestinationAddress)
+        self.__l2Protocol = str(l2Protocol)
+        self.__l2SourceAddress = str(l2SourceAddress)
+        self.__l2DestinationAddress = str(l2DestinationAddress)
 
     @property
     def l2Protocol(self):
@@ -54,6 +54,8 @@ class L3NetworkMessage(L2NetworkMessage):
 
     """
 
+    __slots__ = ("__l3Protocol", "__l3SourceAddress", "__l3DestinationAddress")
+
     def __init__(self,
                  data,
                  date=None,
@@ -65,9 +67,9 @@ class L3NetworkMessage(L2NetworkMessage):
                  l3DestinationAddress=None):
         super(L3NetworkMessage, self).__init__(
             data, date, l2Protocol, l2SourceAddress, l2DestinationAddress)
-        self.l3Protocol = str(l3Protocol)
-        self.l3SourceAddress = str(l3SourceAddress)
-        self.l3DestinationAddress = str(l3DestinationAddress)
+        self.__l3Protocol = str(l3Protocol)
+        self.__l3SourceAddress = str(l3SourceAddress)
+        self.__l3DestinationAddress = str(l3DestinationAddress)
 
     @property
     def l3Protocol(self):
@@ -115,7 +117,7 @@ class L3NetworkMessage(L2NetworkMessage):
 
         :type: str
         """
-        return self.__l3SourceAddress
+        return self.l3SourceAddress
 
     @property
     def destination(self):
@@ -124,4 +126,4 @@ class L3NetworkMessage(L2NetworkMessage):
 
         :type: str
         """
-        return self.__l3DestinationAddress
+        return self.l3DestinationAddress
@@ -0,0 +1,807 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import mmap
+import struct
+import sys
+import time
+import uuid
+import weakref
+from array import array
+from collections import OrderedDict
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+from netzob.Common.Utils.TypedList import TypedList
+from netzob.Model.Vocabulary.Functions.VisualizationFunction import VisualizationFunction
+from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Model.Vocabulary.Messages.RawMessage import RawMessage
+from netzob.Model.Vocabulary.Messages.L2NetworkMessage import L2NetworkMessage
+from netzob.Model.Vocabulary.Messages.L3NetworkMessage import L3NetworkMessage
+from netzob.Model.Vocabulary.Messages.L4NetworkMessage import L4NetworkMessage
+
+
+class StoredAttribute(object):
+    """Descriptor of a message attribute which is read from the columns
+    of the :class:`MessageStore` of the message, unless it was modified."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        state = view._state
+        if state is not None and self.name in state:
+            return state[self.name]
+        return view._store._read(self.name, view._index)
+
+    def __set__(self, view, value):
+        view._store._write(view._index, self.name, value)
+
+
+def _detachedMessage(message):
+    """Return the message a view was pickled as (see
+    :meth:`MessageView.__reduce__`)."""
+    return message
+
+
+class MessageView(object):
+    """A message whose content is stored in a :class:`MessageStore`.
+
+    A view only refers to its store and to its position in it. The
+    modified attributes of the message are kept by the store, in a dict
+    which is created on the first write, so that all the views of a
+    message share them.
+    """
+
+    MESSAGE_TYPE = "Unknown"
+
+    def __init__(self, store, index):
+        self._store = store
+        self._index = index
+
+    @property
+    def _state(self):
+        return self._store._state(self._index)
+
+    def _write(self, name, value):
+        self._store._write(self._index, name, value)
+
+    def __reduce__(self):
+        # a view is pickled (and copied) as a message detached from its store
+        return (_detachedMessage, (self._store._detach(self._index), ))
+
+    def __reduce_ex__(self, protocol):
+        return self.__reduce__()
+
+    data = StoredAttribute("data")
+    date = StoredAttribute("date")
+
+    @property
+    def id(self):
+        """The unique identified of the message, created on first access.
+
+        :type: UUID
+        """
+        return self._store._id(self._index)
+
+    @id.setter
+    @typeCheck(uuid.UUID)
+    def id(self, _id):
+        if _id is None:
+            raise TypeError("Id cannot be None")
+        self._store._setId(self._index, _id)
+
+    @property
+    def session(self):
+        """The session from which message comes from.
+
+        :type: :class:`netzob.Model.Vocabulary.Session.Session`
+        """
+        state = self._state
+        if state is None:
+            return None
+        return state.get("session")
+
+    @session.setter
+    def session(self, session):
+        self._write("session", session)
+
+    @property
+    def messageType(self):
+        """The type of the message (e.g. network, file, ...)
+
+        :type: :class:`str`
+        """
+        state = self._state
+        if state is None:
+            return self.MESSAGE_TYPE
+        return state.get("messageType", self.MESSAGE_TYPE)
+
+    @messageType.setter
+    @typeCheck(str)
+    def messageType(self, messageType):
+        if messageType is None:
+            raise TypeError("Message type cannot be None")
+        self._write("messageType", messageType)
+
+    @property
+    def metadata(self):
+        """The metadata or properties of the message.
+
+        :type: a dict<str, Object>
+        """
+        return self._store._container("metadata", self._index, OrderedDict)
+
+    @metadata.setter
+    @typeCheck(dict)
+    def metadata(self, metadata):
+        if metadata is None:
+            raise TypeError("Metadata cannot be None")
+        for k in list(metadata.keys()):
+            self.setMetadata(k, metadata[k])
+
+    @property
+    def semanticTags(self):
+        """Position of identified semantic tags found in the current data.
+
+        :type: :class:`dict` with keys is int (position) and values is a list of str
+        """
+        return self._store._container("semanticTags", self._index,
+                                      OrderedDict)
+
+    @semanticTags.setter
+    @typeCheck(dict)
+    def semanticTags(self, semanticTags):
+        if semanticTags is None:
+            semanticTags = OrderedDict()
+        AbstractMessage._checkSemanticTags(semanticTags)
+        self._store._setContainer("semanticTags", self._index, semanticTags)
+
+    @property
+    def visualizationFunctions(self):
+        """Sorted list of visualization function to attach on message.
+
+        :type: a list of :class:`netzob.Model.Vocabulary.Functions.VisualizationFunction`
+        """
+        return self._store._container(
+            "visualizationFunctions", self._index,
+            lambda: TypedList(VisualizationFunction))
+
+    @visualizationFunctions.setter
+    def visualizationFunctions(self, visualizationFunctions):
+        self.clearVisualizationFunctions()
+        self.visualizationFunctions.extend(visualizationFunctions)
+
+
+class RawMessageView(MessageView, RawMessage):
+    """View of a :class:`RawMessage` stored in a :class:`MessageStore`."""
+
+    MESSAGE_TYPE = "Raw"
+
+    source = StoredAttribute("source")
+    destination = StoredAttribute("destination")
+
+
+class L2NetworkMessageView(MessageView, L2NetworkMessage):
+    """View of a :class:`L2NetworkMessage` stored in a :class:`MessageStore`."""
+
+    MESSAGE_TYPE = "Network"
+
+    l2Protocol = StoredAttribute("l2Protocol")
+    l2SourceAddress = StoredAttribute("l2SourceAddress")
+    l2DestinationAddress = StoredAttribute("l2DestinationAddress")
+    source = StoredAttribute("l2SourceAddress")
+    destination = StoredAttribute("l2DestinationAddress")
+
+
+class L3NetworkMessageView(MessageView, L3NetworkMessage):
+    """View of a :class:`L3NetworkMessage` stored in a :class:`MessageStore`."""
+
+    MESSAGE_TYPE = "Network"
+
+    l2Protocol = StoredAttribute("l2Protocol")
+    l2SourceAddress = StoredAttribute("l2SourceAddress")
+    l2DestinationAddress = StoredAttribute("l2DestinationAddress")
+    l3Protocol = StoredAttribute("l3Protocol")
+    l3SourceAddress = StoredAttribute("l3SourceAddress")
+    l3DestinationAddress = StoredAttribute("l3DestinationAddress")
+
+
+class L4NetworkMessageView(MessageView, L4NetworkMessage):
+    """View of a :class:`L4NetworkMessage` stored in a :class:`MessageStore`."""
+
+    MESSAGE_TYPE = "Network"
+
+    l2Protocol = StoredAttribute("l2Protocol")
+    l2SourceAddress = StoredAttribute("l2SourceAddress")
+    l2DestinationAddress = StoredAttribute("l2DestinationAddress")
+    l3Protocol = StoredAttribute("l3Protocol")
+    l3SourceAddress = StoredAttribute("l3SourceAddress")
+    l3DestinationAddress = StoredAttribute("l3DestinationAddress")
+    l4Protocol = StoredAttribute("l4Protocol")
+    l4SourceAddress = StoredAttribute("l4SourceAddress")
+    l4DestinationAddress = StoredAttribute("l4DestinationAddress")
+
+
+@NetzobLogger
+class MessageStore(object):
+    """A compact store of messages sharing the same class.
+
+    The payloads of all the messages are concatenated in a single buffer
+    and located with an array of offsets. Dates are kept in an array of
+    floats and each address or protocol attribute of the messages is kept
+    in an array of indexes to a table of their distinct (interned) values.
+    Messages are thus stored with a few dozens of bytes in addition to
+    their payload.
+
+    Accessing a message returns a lightweight view, which can be used as
+    any other message of the same class. A single view of each message
+    is alive at a time. The ids of the messages are kept in a column
+    created on first use, and their containers (metadata, semantic tags,
+    ...) are only created when first used.
+
+    >>> from netzob.all import *
+    >>> store = MessageStore(L4NetworkMessage)
+    >>> store.append(b"CMDidentify", 1.5, ("Ethernet", "00:01", "00:02", "IP", "10.0.0.1", "10.0.0.2", "UDP", 4242, 53))
+    >>> store.append(b"RESidentify", 1.2, ("Ethernet", "00:02", "00:01", "IP", "10.0.0.2", "10.0.0.1", "UDP", 53, 4242))
+    >>> print(len(store))
+    2
+    >>> message = store[0]
+    >>> print(message.data, message.date, message.source, message.destination)
+    b'CMDidentify' 1.5 10.0.0.1:4242 10.0.0.2:53
+    >>> isinstance(message, L4NetworkMessage)
+    True
+    >>> print(store[1].l4Protocol, store[1].l4SourceAddress)
+    UDP 53
+
+    Modifications of a view are kept by the store.
+
+    >>> message.metadata["command"] = "identify"
+    >>> store[0].metadata
+    OrderedDict([('command', 'identify')])
+    >>> store[1].data = b"RESidentify#"
+    >>> print(store[1].data)
+    b'RESidentify#'
+
+    All the views of a message share its modifications.
+
+    >>> v1 = store[0]
+    >>> v2 = store[0]
+    >>> v1 is v2
+    True
+    >>> v2.data = b"CMDidentify#"
+    >>> v1.id == store[0].id
+    True
+    >>> print(store[0].data)
+    b'CMDidentify#'
+    >>> store[0].data = b"CMDidentify"
+
+    Messages can be reordered following their dates and added to a
+    symbol.
+
+    >>> store.sort()
+    >>> [m.data for m in store]
+    [b'RESidentify#', b'CMDidentify']
+    >>> store[1].metadata
+    OrderedDict([('command', 'identify')])
+    >>> symbol = Symbol(messages=store.values())
+    >>> print(len(symbol.messages))
+    2
+
+    A store can be saved in a binary file and loaded back. The loaded
+    store is memory-mapped on the file, so its messages are available
+    without decoding them again.
+
+    >>> import os, shutil, tempfile
+    >>> directory = tempfile.mkdtemp()
+    >>> storePath = os.path.join(directory, "messages.store")
+    >>> store.save(storePath)
+    >>> loadedStore = MessageStore.load(storePath)
+    >>> [(m.date, m.source, m.destination) for m in loadedStore] == [(m.date, m.source, m.destination) for m in store]
+    True
+
+    Only the columns are saved, the modifications of the views are not.
+
+    >>> print(loadedStore[0].data, loadedStore[1].data)
+    b'RESidentify' b'CMDidentify'
+    >>> print(loadedStore.messageClass.__name__)
+    L4NetworkMessage
+    >>> shutil.rmtree(directory)
+
+    Views are pickled and copied as messages which do not depend on the
+    store, so they can also be searched in parallel.
+
+    >>> import pickle
+    >>> message = pickle.loads(pickle.dumps(store[1]))
+    >>> print(message.__class__.__name__, message.data, message.source, message.id == store[1].id)
+    L4NetworkMessage b'CMDidentify' 10.0.0.1:4242 True
+    >>> message.metadata
+    OrderedDict([('command', 'identify')])
+    >>> results = SearchEngine().searchDataInMessages([ASCII("CMD")], store.values(), inParallel=True)
+    >>> print(len(results))
+    1
+
+    Existing messages can also be stored.
+
+    >>> store = MessageStore()
+    >>> store.appendMessage(RawMessage(b"hello", date=10.0, source="client", destination="server"))
+    >>> print(store[0])
+    \033[0;32m[10.0 \033[0;m\033[1;32mclient\033[1;m\033[0;32m->\033[0;m\033[1;32mserver\033[1;m\033[0;32m]\033[0;m 'hello'
+
+    Reading the ids of the messages does not modify them.
+
+    >>> ids = [m.id for m in store]
+    >>> ids == [m.id for m in store]
+    True
+    >>> store._state(0) is None
+    True
+
+    """
+
+    # stored attributes and view class of the supported message classes
+    ATTRIBUTES = OrderedDict([
+        (RawMessage, ("source", "destination")),
+        (L2NetworkMessage, ("l2Protocol", "l2SourceAddress",
+                            "l2DestinationAddress")),
+        (L3NetworkMessage, ("l2Protocol", "l2SourceAddress",
+                            "l2DestinationAddress", "l3Protocol",
+                            "l3SourceAddress", "l3DestinationAddress")),
+        (L4NetworkMessage, ("l2Protocol", "l2SourceAddress",
+                            "l2DestinationAddress", "l3Protocol",
+                            "l3SourceAddress", "l3DestinationAddress",
+                            "l4Protocol", "l4SourceAddress",
+                            "l4DestinationAddress")),
+    ])
+
+    FILE_MAGIC = b"NZBSTORE"
+    FILE_VERSION = 1
+
+    # header: magic, version, index of the message class, number of
+    # messages, size of the data, number of distinct attribute values
+    FILE_HEADER = struct.Struct("<8sIIQQQ")
+
+    # each attribute value is stored as a type tag and the size of its encoding
+    VALUE_HEADER = struct.Struct("<cI")
+
+    VIEW_CLASSES = {
+        RawMessage: RawMessageView,
+        L2NetworkMessage: L2NetworkMessageView,
+        L3NetworkMessage: L3NetworkMessageView,
+        L4NetworkMessage: L4NetworkMessageView,
+    }
+
+    def __init__(self, messageClass=RawMessage):
+        """Constructor.
+
+        :keyword messageClass: the class of the stored messages
+        :type messageClass: :class:`RawMessage`, :class:`L2NetworkMessage`, :class:`L3NetworkMessage` or :class:`L4NetworkMessage`
+        :raise: TypeError if the class of messages is not supported.
+        """
+        if messageClass not in MessageStore.ATTRIBUTES:
+            raise TypeError(
+                "Messages of class {0} cannot be stored, supported classes are: {1}".
+                format(messageClass.__name__, ", ".join(
+                    c.__name__ for c in MessageStore.ATTRIBUTES)))
+        self.__messageClass = messageClass
+        self.__viewClass = MessageStore.VIEW_CLASSES[messageClass]
+        self.__attributes = MessageStore.ATTRIBUTES[messageClass]
+
+        self.__data = bytearray()
+        self.__ends = array('Q')
+        self.__dates = array('d')
+        self.__columns = dict(
+            (name, array('I')) for name in self.__attributes)
+
+        # table of the distinct attribute values
+        self.__values = []
+        self.__valueIndexes = dict()
+
+        # modified attributes and containers of the messages, by index
+        self.__states = dict()
+        self.__containers = dict()
+
+        # ids of the messages, created on first access
+        self.__ids = None
+
+        # views which are currently alive, by index
+        self.__views = weakref.WeakValueDictionary()
+
+    def append(self, data, date=None, attributes=()):
+        """Store a new message.
+
+        :parameter data: the content of the message
+        :type data: :class:`bytes`
+        :keyword date: the timestamp of the message (the current time if None)
+        :type date: :class:`float`
+        :keyword attributes: the values of the stored attributes of the message (see :attr:`attributes`)
+        :type attributes: :class:`tuple`
+        """
+        if len(attributes) != len(self.__attributes):
+            raise ValueError("{0} attributes are expected: {1}".format(
+                len(self.__attributes), ", ".join(self.__attributes)))
+        if date is None:
+            date = time.mktime(time.gmtime())
+        self.__ensureWritable()
+
+        self.__data += data
+        self.__ends.append(len(self.__data))
+        self.__dates.append(date)
+        if self.__ids is not None:
+            self.__ids.append(None)
+
+        valueIndexes = self.__valueIndexes
+        for name, value in zip(self.__attributes, attributes):
+            key = (value.__class__, value)
+            position = valueIndexes.get(key)
+            if position is None:
+                position = valueIndexes[key] = len(self.__values)
+                self.__values.append(value)
+            self.__columns[name].append(position)
+
+    def appendMessage(self, message):
+        """Store the content, the date and the attributes of the
+        specified message.
+
+        :parameter message: the message to store
+        :type message: an instance of the class of the stored messages
+        """
+        if not isinstance(message, self.__messageClass):
+            raise TypeError(
+                "Invalid type for argument, expecting: {0}, received : {1}".
+                format(self.__messageClass.__name__,
+                       message.__class__.__name__))
+        self.append(message.data, message.date,
+                    tuple(getattr(message, name)
+                          for name in self.__attributes))
+
+    def sort(self):
+        """Reorder the stored messages following their dates. Messages
+        having the same date keep their relative order."""
+        self.__ensureWritable()
+        dates = self.__dates
+        order = sorted(range(len(dates)), key=dates.__getitem__)
+
+        data = bytearray()
+        ends = array('Q')
+        for i in order:
+            begin = self.__ends[i - 1] if i > 0 else 0
+            data += self.__data[begin:self.__ends[i]]
+            ends.append(len(data))
+        self.__data = data
+        self.__ends = ends
+        self.__dates = array('d', (dates[i] for i in order))
+        for name, column in list(self.__columns.items()):
+            self.__columns[name] = array('I', (column[i] for i in order))
+
+        if self.__ids is not None:
+            self.__ids = [self.__ids[i] for i in order]
+
+        positions = dict((i, position) for position, i in enumerate(order))
+        self.__states = dict((positions[i], state)
+                             for i, state in self.__states.items())
+        for name, containers in list(self.__containers.items()):
+            self.__containers[name] = dict(
+                (positions[i], container)
+                for i, container in containers.items())
+        views = weakref.WeakValueDictionary()
+        for view in list(self.__views.values()):
+            view._index = positions[view._index]
+            views[view._index] = view
+        self.__views = views
+
+    @typeCheck(str)
+    def save(self, filePath):
+        """Store the columns of the messages in the specified file.
+        Attributes modified through the views of the messages are not
+        saved.
+
+        :parameter filePath: the path of the file where the store is saved
+        :type filePath: :class:`str`
+        :raise: TypeError if an attribute value cannot be saved
+        """
+        if filePath is None:
+            raise TypeError("File path cannot be None")
+
+        values = []
+        for value in self.__values:
+            if value is None:
+                values.append((b"N", b""))
+            elif isinstance(value, int):
+                values.append((b"I", str(value).encode("ascii")))
+            elif isinstance(value, str):
+                values.append((b"S", value.encode("utf-8")))
+            else:
+                raise TypeError(
+                    "Attribute values of type {0} cannot be saved".format(
+                        value.__class__.__name__))
+
+        classIndex = list(MessageStore.ATTRIBUTES).index(self.__messageClass)
+        with open(filePath, 'wb') as fd:
+            fd.write(MessageStore.FILE_HEADER.pack(
+                MessageStore.FILE_MAGIC, MessageStore.FILE_VERSION,
+                classIndex, len(self), len(self.__data), len(values)))
+            for (tag, encoded) in values:
+                fd.write(MessageStore.VALUE_HEADER.pack(tag, len(encoded)))
+                fd.write(encoded)
+            MessageStore.__pad(fd)
+
+            columns = [self.__dates, self.__ends] + [
+                self.__columns[name] for name in self.__attributes
+            ]
+            for column in columns:
+                if sys.byteorder != 'little':
+                    column = array(column.typecode, column)
+                    column.byteswap()
+                fd.write(memoryview(column).cast('B'))
+                MessageStore.__pad(fd)
+            fd.write(self.__data)
+
+    @staticmethod
+    def __pad(fd):
+        """Align the next section of a saved store on 8 bytes."""
+        fd.write(b"\x00" * (-fd.tell() % 8))
+
+    @staticmethod
+    @typeCheck(str)
+    def load(filePath):
+        """Load a store saved in the specified file. The file is
+        memory-mapped and the columns of the store are read from the
+        mapping until the store is modified.
+
+        The columns are checked when the store is loaded, so that a
+        corrupted file is rejected before its messages are read.
+
+        >>> from netzob.all import *
+        >>> import os, shutil, struct, tempfile
+        >>> store = MessageStore()
+        >>> store.append(b"hello", 1.0, ("client", "server"))
+        >>> store.append(b"world", 2.0, ("server", "client"))
+        >>> directory = tempfile.mkdtemp()
+        >>> storePath = os.path.join(directory, "messages.store")
+        >>> store.save(storePath)
+        >>> content = bytearray(open(storePath, "rb").read())
+        >>> position = content.index(struct.pack("<QQ", 5, 10))
+        >>> content[position:position + 16] = struct.pack("<QQ", 10, 5)
+        >>> with open(storePath, "wb") as fd:
+        ...     _ = fd.write(content)
+        >>> try:
+        ...     MessageStore.load(storePath)
+        ... except ValueError:
+        ...     print("invalid store")
+        invalid store
+        >>> shutil.rmtree(directory)
+
+        :parameter filePath: the path of the file where the store was saved
+        :type filePath: :class:`str`
+        :return: the loaded store
+        :rtype: :class:`MessageStore`
+        :raise: ValueError if the file is not a valid store
+        """
+        if filePath is None:
+            raise TypeError("File path cannot be None")
+
+        with open(filePath, 'rb') as fd:
+            try:
+                fileMap = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError("The file {0} is not a valid store".format(
+                    filePath))
+        try:
+            return MessageStore.__loadFromMap(memoryview(fileMap))
+        except (ValueError, IndexError, TypeError, struct.error):
+            raise ValueError("The file {0} is not a valid store".format(
+                filePath))
+
+    @staticmethod
+    def __loadFromMap(fileData):
+        (magic, version, classIndex, nbMessages, dataSize,
+         nbValues) = MessageStore.FILE_HEADER.unpack_from(fileData, 0)
+        if magic != MessageStore.FILE_MAGIC or version != MessageStore.FILE_VERSION:
+            raise ValueError("Invalid header")
+
+        store = MessageStore(list(MessageStore.ATTRIBUTES)[classIndex])
+        offset = MessageStore.FILE_HEADER.size
+        for i in range(nbValues):
+            (tag, size) = MessageStore.VALUE_HEADER.unpack_from(fileData,
+                                                               offset)
+            offset += MessageStore.VALUE_HEADER.size
+            encoded = bytes(fileData[offset:offset + size])
+            offset += size
+            if tag == b"N":
+                value = None
+            elif tag == b"I":
+                value = int(encoded)
+            elif tag == b"S":
+                value = encoded.decode("utf-8")
+            else:
+                raise ValueError("Invalid attribute value")
+            store.__valueIndexes[(value.__class__, value)] = len(
+                store.__values)
+            store.__values.append(value)
+        offset += -offset % 8
+
+        def section(typecode):
+            nonlocal offset
+            size = nbMessages * array(typecode).itemsize
+            raw = fileData[offset:offset + size]
+            if len(raw) != size:
+                raise ValueError("Truncated store")
+            offset += size + (-size % 8)
+            if sys.byteorder != 'little':
+                column = array(typecode, raw.tobytes())
+                column.byteswap()
+                return column
+            return raw.cast(typecode)
+
+        store.__dates = section('d')
+        store.__ends = section('Q')
+        for name in store.__attributes:
+            store.__columns[name] = section('I')
+        store.__data = fileData[offset:offset + dataSize]
+        if len(store.__data) != dataSize:
+            raise ValueError("Truncated store")
+
+        # the messages must be located in the data and their attributes
+        # in the table of values
+        ends = store.__ends
+        if (ends[-1] if nbMessages > 0 else 0) != dataSize:
+            raise ValueError("Invalid offsets")
+        if any(begin > end for begin, end in zip(ends, ends[1:])):
+            raise ValueError("Invalid offsets")
+        for column in store.__columns.values():
+            if nbMessages > 0 and max(column) >= nbValues:
+                raise ValueError("Invalid attribute value")
+        return store
+
+    def __ensureWritable(self):
+        """Copy the columns read from a mapped file before they are
+        modified."""
+        if not isinstance(self.__data, memoryview):
+            return
+        self.__data = bytearray(self.__data)
+        self.__dates = array('d', self.__dates)
+        self.__ends = array('Q', self.__ends)
+        for name, column in list(self.__columns.items()):
+            self.__columns[name] = array('I', column)
+
+    def values(self):
+        """Return the views of all the stored messages.
+
+        :rtype: a list of :class:`MessageView`
+        """
+        return [self[i] for i in range(len(self))]
+
+    def _read(self, name, index):
+        """Return the stored value of an attribute of a message."""
+        if name == "data":
+            begin = self.__ends[index - 1] if index > 0 else 0
+            return bytes(self.__data[begin:self.__ends[index]])
+        if name == "date":
+            return self.__dates[index]
+        return self.__values[self.__columns[name][index]]
+
+    def _state(self, index):
+        """Return the modified attributes of a message, or None."""
+        return self.__states.get(index)
+
+    def _write(self, index, name, value):
+        """Modify an attribute of a message."""
+        state = self.__states.get(index)
+        if state is None:
+            state = self.__states[index] = dict()
+        state[name] = value
+
+    def _id(self, index):
+        """Return the id of a message, which is created on first access."""
+        if self.__ids is None:
+            self.__ids = [None] * len(self)
+        _id = self.__ids[index]
+        if _id is None:
+            _id = self.__ids[index] = uuid.uuid4()
+        return _id
+
+    def _detach(self, index):
+        """Return a message of the class of the stored messages, which
+        does not depend on the store, with the same data, date, stored
+        attributes, id, metadata and semantic tags as a message."""
+        view = self[index]
+        message = self.__messageClass(
+            view.data, view.date,
+            *[getattr(view, name) for name in self.__attributes])
+        message.id = view.id
+        if view.session is not None:
+            message.session = view.session
+        for name in ("metadata", "semanticTags"):
+            container = self.__containers.get(name, dict()).get(index)
+            if container:
+                setattr(message, name, container)
+        return message
+
+    def _setId(self, index, _id):
+        """Modify the id of a message."""
+        if self.__ids is None:
+            self.__ids = [None] * len(self)
+        self.__ids[index] = _id
+
+    def _container(self, name, index, factory):
+        """Return a container of a message (such as its metadata), which
+        is created on first access."""
+        containers = self.__containers.setdefault(name, dict())
+        container = containers.get(index)
+        if container is None:
+            container = containers[index] = factory()
+        return container
+
+    def _setContainer(self, name, index, container):
+        """Replace a container of a message."""
+        self.__containers.setdefault(name, dict())[index] = container
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Message index out of range")
+        view = self.__views.get(index)
+        if view is None:
+            view = self.__views[index] = self.__viewClass(self, index)
+        return view
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        return len(self.__dates)
+
+    @property
+    def messageClass(self):
+        """The class of the stored messages.
+
+        :type: :class:`type`
+        """
+        return self.__messageClass
+
+    @property
+    def attributes(self):
+        """The names of the attributes stored for each message, in the
+        order expected by :meth:`append`.
+
+        :type: :class:`tuple` of :class:`str`
+        """
+        return self.__attributes
@@ -34,7 +34,6 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
-import random
 import string
 import collections
 
@@ -49,6 +48,19 @@ from bitarray import bitarray
 from netzob.Model.Vocabulary.Types.AbstractType import AbstractType
 from netzob.Common.Utils.Decorators import NetzobLogger, typeCheck
 
+# The characters of the generated ASCII: random bytes are mapped on them
+# with a translation table, the bytes above the largest multiple of their
+# number are deleted so that every character is equally likely.
+_GENERATED_CHARS = (string.ascii_letters + string.digits).encode('utf-8')
+_GENERATED_CHARS_TABLE = bytes(
+    _GENERATED_CHARS[i % len(_GENERATED_CHARS)] for i in range(256))
+_GENERATED_CHARS_DELETED = bytes(range(256 - 256 % len(_GENERATED_CHARS), 256))
+
+# Translation table of the bytes to the printable characters given by
+# ASCII.encode(), other bytes are replaced by '.'
+_PRINTABLE_TABLE = bytes(
+    i if 0x20 <= i <= 0x7e else ord('.') for i in range(256))
+
 
 @NetzobLogger
 class ASCII(AbstractType):
@@ -85,6 +97,9 @@ class ASCII(AbstractType):
 
     """
 
+    # ascii data is made of 8 bits characters
+    BIT_GRANULARITY = 8
+
     def __init__(self,
                  value=None,
                  nbChars=(None, None),
@@ -149,6 +164,7 @@ class ASCII(AbstractType):
         """
         from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
         from netzob.Model.Vocabulary.Types.BitArray import BitArray
+        from netzob.Model.Vocabulary.Types.Raw import Raw
 
         minSize, maxSize = self.nbChars
         if maxSize is None:
@@ -156,12 +172,14 @@ class ASCII(AbstractType):
         if minSize is None:
             minSize = 0
 
-        generatedSize = random.randint(minSize, maxSize)
-        randomContent = ''.join([
-            random.choice(string.ascii_letters + string.digits)
-            for i in range(generatedSize)
-        ])
-        return TypeConverter.convert(randomContent, ASCII, BitArray)
+        generatedSize = AbstractType.randomGenerator().randint(
+            minSize, maxSize)
+        randomContent = b""
+        while len(randomContent) < generatedSize:
+            randomContent += AbstractType.randomBytes(
+                generatedSize - len(randomContent)).translate(
+                    _GENERATED_CHARS_TABLE, _GENERATED_CHARS_DELETED)
+        return TypeConverter.convert(randomContent, Raw, BitArray)
 
     @typeCheck(str)
     def mutate(self, prefixDescription=None):
@@ -202,6 +220,10 @@ class ASCII(AbstractType):
         else:
             val = self.value
 
+        if len(val) % 8 == 0:
+            return self.__mutateBytes(
+                val.tobytes().translate(_PRINTABLE_TABLE), prefixDescription)
+
         strValue = TypeConverter.convert(val, BitArray, ASCII)
 
         mutations = collections.OrderedDict()
@@ -228,6 +250,40 @@ class ASCII(AbstractType):
 
         return results
 
+    def __mutateBytes(self, rawValue, prefixDescription):
+        """Computes the mutations of a byte-aligned value with bytes
+        operations. The value is made of printable characters only, so its
+        case variants are the ones of the decoded string, and the bytes of
+        the little endian variants are read in reverse bit order."""
+        mutations = collections.OrderedDict()
+
+        mutations["{0}ascii".format(prefixDescription)] = rawValue
+        mutations["{0}ascii(inversed)".format(
+            prefixDescription)] = rawValue[::-1]
+        upperValue = rawValue.upper()
+        if rawValue != upperValue:
+            mutations["{0}ascii(upper)".format(prefixDescription)] = upperValue
+            mutations["{0}ascii(inversed-upper)".format(
+                prefixDescription)] = upperValue[::-1]
+        lowerValue = rawValue.lower()
+        if rawValue != lowerValue:
+            mutations["{0}ascii(lower)".format(prefixDescription)] = lowerValue
+            mutations["{0}ascii(inversed-lower)".format(
+                prefixDescription)] = lowerValue[::-1]
+
+        results = collections.OrderedDict()
+        for mutationName, mutationValue in mutations.items():
+            bigEndianValue = bitarray(endian=AbstractType.ENDIAN_BIG)
+            bigEndianValue.frombytes(mutationValue)
+            results["{0}-bits(bigEndian)".format(
+                mutationName)] = bigEndianValue
+            littleEndianValue = bitarray(endian=AbstractType.ENDIAN_LITTLE)
+            littleEndianValue.frombytes(mutationValue)
+            results["{0}-bits(littleEndian)".format(
+                mutationName)] = littleEndianValue
+
+        return results
+
     def canParse(self,
                  data,
                  unitSize=AbstractType.defaultUnitSize(),
@@ -289,6 +345,10 @@ class ASCII(AbstractType):
 
         return True
 
+    @property
+    def parsingKey(self):
+        return self.key + (self.nbChars, )
+
     @property
     def nbChars(self):
         return self.__nbChars
@@ -36,6 +36,7 @@
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
 import abc
+import os
 import uuid
 from bitarray import bitarray
 import random
@@ -81,11 +82,22 @@ class AbstractType(object, metaclass=abc.ABCMeta):
     UNITSIZE_32 = '32'
     UNITSIZE_64 = '64'
 
+    # The sizes (in bits) of the data a type can parse are multiples of this
+    # granularity (except the empty data)
+    BIT_GRANULARITY = 1
+
     # This value will be used if generate() method is called
     # without any upper size limit
     # 65535*8 is completly arbitrary and equals to 2^16 - 1 octets
     MAXIMUM_GENERATED_DATA_SIZE = 65535 * 8
 
+    # The generator of the random data produced by the types (see seed())
+    __random = random.Random()
+
+    # Whether a seed was set: random bytes are otherwise read from the
+    # randomness source of the OS
+    __seeded = False
+
     @staticmethod
     def supportedTypes():
         """Official list of supported types"""
@@ -133,6 +145,87 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         """Official sign supported"""
         return [AbstractType.SIGN_SIGNED, AbstractType.SIGN_UNSIGNED]
 
+    @staticmethod
+    def seed(seed=None):
+        """Initializes the generator of the random data produced by the
+        types. Using the same seed makes the generation (and so the
+        specialization of symbols) reproducible. If the seed is None, the
+        generator is reseeded from the current time or an OS specific
+        randomness source, and random bytes are read again from the OS
+        randomness source.
+
+        >>> from netzob.all import *
+        >>> AbstractType.seed(42)
+        >>> data = Raw(nbBytes=(4, 8)).generate()
+        >>> AbstractType.seed(42)
+        >>> Raw(nbBytes=(4, 8)).generate() == data
+        True
+        >>> symbol = Symbol(fields=[Field(Alt(["a", "b"])), Field(ASCII(nbChars=(2, 8)))])
+        >>> AbstractType.seed(42)
+        >>> messages = [symbol.specialize() for i in range(5)]
+        >>> AbstractType.seed(42)
+        >>> [symbol.specialize() for i in range(5)] == messages
+        True
+        >>> AbstractType.seed()
+
+        :keyword seed: the seed of the generator
+        :type seed: :class:`int`
+        """
+        AbstractType.__random.seed(seed)
+        AbstractType.__seeded = seed is not None
+
+    @staticmethod
+    def randomGenerator():
+        """Return the generator of the random data produced by the types
+
+        :return: the random generator
+        :rtype: :class:`random.Random`
+        """
+        return AbstractType.__random
+
+    @staticmethod
+    def randomBytes(nbBytes):
+        """Return the specified number of random bytes. They are read
+        from the OS randomness source unless a seed was set with
+        :meth:`seed`, in which case they are drawn at once from the random
+        generator.
+
+        >>> from netzob.all import *
+        >>> len(AbstractType.randomBytes(16))
+        16
+        >>> AbstractType.randomBytes(0)
+        b''
+
+        :parameter nbBytes: the number of bytes to generate
+        :type nbBytes: :class:`int`
+        :rtype: :class:`bytes`
+        """
+        if nbBytes <= 0:
+            return b""
+        if not AbstractType.__seeded:
+            return os.urandom(nbBytes)
+        return AbstractType.__random.getrandbits(8 * nbBytes).to_bytes(
+            nbBytes, 'big')
+
+    @staticmethod
+    def randomBits(nbBits, endianness=ENDIAN_BIG):
+        """Return a bitarray of the specified number of random bits.
+
+        >>> from netzob.all import *
+        >>> len(AbstractType.randomBits(13))
+        13
+
+        :parameter nbBits: the number of bits to generate
+        :type nbBits: :class:`int`
+        :keyword endianness: the endianness of the bitarray
+        :type endianness: :class:`str`
+        :rtype: :class:`bitarray`
+        """
+        result = bitarray(endian=endianness)
+        result.frombytes(AbstractType.randomBytes((nbBits + 7) // 8))
+        del result[nbBits:]
+        return result
+
     @staticmethod
     def defaultUnitSize():
         """Return the default unit size
@@ -184,6 +277,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         :type sign: str
         """
 
+        self.__key = None
         self.id = uuid.uuid4()
         self.typeName = typeName
         self.value = value
@@ -218,16 +312,93 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         else:
             return str(self.value)
 
-    def __key(self):
-        # Note: as bitarray objects cannot be hashed in Python3 (because bitarray objects are mutable), we cast a bitarray object in a tuple (which is immutable)
-        return (self.typeName, tuple(self.value), self.size, self.unitSize,
-                self.endianness, self.sign)
+    @property
+    def key(self):
+        """A hashable key made of the name, the value, the size, the
+        unitSize, the endianness and the sign of the type. Two types are
+        equal if they have the same key. It is computed once and updated
+        when one of these attributes is modified, so it can be used to
+        memoize computations made on a type.
+
+        >>> from netzob.all import *
+        >>> a = ASCII("netzob")
+        >>> a.key == ASCII("netzob").key
+        True
+        >>> a.key == ASCII("zoby").key
+        False
+        >>> ASCII(nbChars=4) == ASCII(nbChars=4)
+        True
+
+        :type: :class:`tuple`
+        """
+        key = self.__key
+        if key is None:
+            # Note: as bitarray objects cannot be hashed in Python3 (because bitarray objects are mutable), we use their string representation
+            value = self.value.to01() if self.value is not None else None
+            key = self.__key = (self.typeName, value, self.size,
+                                self.unitSize, self.endianness, self.sign)
+        return key
+
+    @property
+    def parsingKey(self):
+        """A hashable key which identifies the data the type can parse:
+        two types with the same parsing key return the same result when
+        :meth:`canParse` is called on the same data. It extends
+        :attr:`key` with the constraints specific to each type.
+
+        >>> from netzob.all import *
+        >>> IPv4().parsingKey == IPv4().parsingKey
+        True
+        >>> IPv4().parsingKey == IPv4(network="10.0.0.0/8").parsingKey
+        False
+
+        :type: :class:`tuple`
+        """
+        return self.key
 
     def __eq__(x, y):
-        return x.__key() == y.__key()
+        return x.key == y.key
 
     def __hash__(self):
-        return hash(self.__key())
+        return hash(self.key)
+
+    @property
+    def isFixedSize(self):
+        """True if all the values of the type have the same size.
+
+        >>> from netzob.all import *
+        >>> Integer(unitSize=AbstractType.UNITSIZE_16).isFixedSize
+        True
+        >>> Raw(nbBytes=(2, 8)).isFixedSize
+        False
+
+        :type: :class:`bool`
+        """
+        (minSize, maxSize) = self.size
+        return minSize == maxSize
+
+    def parsingSizes(self, length):
+        """Returns the sizes (in bits) of the data the type could parse at
+        the beginning of a content of the specified length, from the
+        largest to the smallest. Only the sizes multiple of the
+        :attr:`BIT_GRANULARITY` of the type are given.
+
+        >>> from netzob.all import *
+        >>> list(Raw(nbBytes=(1, 3)).parsingSizes(20))
+        [16, 8]
+        >>> list(BitArray(nbBits=(2, 4)).parsingSizes(20))
+        [4, 3, 2]
+
+        :parameter length: the length (in bits) of the content to parse
+        :type length: :class:`int`
+        :rtype: :class:`range`
+        """
+        (minSize, maxSize) = self.size
+        if maxSize is None or maxSize > length:
+            maxSize = length
+        granularity = self.BIT_GRANULARITY
+        maxSize -= maxSize % granularity
+        return range(maxSize, minSize - 1, -granularity)
 
     @typeCheck(type)
     def convertValue(self,
@@ -301,9 +472,9 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         if maxSize is None:
             maxSize = AbstractType.MAXIMUM_GENERATED_DATA_SIZE
 
-        generatedSize = random.randint(minSize, maxSize)
-        randomContent = [random.randint(0, 1) for i in range(0, generatedSize)]
-        return bitarray(randomContent, endian=self.endianness)
+        generatedSize = AbstractType.randomGenerator().randint(
+            minSize, maxSize)
+        return AbstractType.randomBits(generatedSize, self.endianness)
 
     @typeCheck(str)
     def mutate(self, prefixDescription=None):
@@ -406,6 +577,57 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         raise NotImplementedError(
             "Internal Error: 'encode' method not implemented")
 
+    @classmethod
+    def decodeMany(cls,
+                   values,
+                   unitSize=UNITSIZE_8,
+                   endianness=ENDIAN_BIG,
+                   sign=SIGN_SIGNED):
+        """This method converts a list of data encoded in the current type
+        in python raw format. Types may override it to process the whole
+        list at once.
+
+        >>> from netzob.all import *
+        >>> HexaString.decodeMany(["6e6574", "7a6f62"])
+        [b'net', b'zob']
+
+        :param values: the data encoded in current type which will be decoded in raw
+        :type values: a list of the current type
+        :return: the list of data encoded in python raw
+        :rtype: a list of python raw
+        :raise: TypeError if parameters are not valid.
+        """
+        return [
+            cls.decode(
+                value, unitSize=unitSize, endianness=endianness, sign=sign)
+            for value in values
+        ]
+
+    @classmethod
+    def encodeMany(cls,
+                   values,
+                   unitSize=UNITSIZE_8,
+                   endianness=ENDIAN_BIG,
+                   sign=SIGN_SIGNED):
+        """This method converts a list of python raw data to the current
+        type. Types may override it to process the whole list at once.
+
+        >>> from netzob.all import *
+        >>> HexaString.encodeMany([b"net", b"zob"])
+        [b'6e6574', b'7a6f62']
+
+        :param values: the data encoded in python raw which will be encoded in current type
+        :type values: a list of python raw
+        :return: the list of data encoded in the current type
+        :rtype: a list of the current type
+        :raise: TypeError if parameters are not valid.
+        """
+        return [
+            cls.encode(
+                value, unitSize=unitSize, endianness=endianness, sign=sign)
+            for value in values
+        ]
+
     @abc.abstractmethod
     def canParse(self, data):
         """This method computes if the specified data can be parsed
@@ -433,6 +655,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
     @typeCheck(bitarray)
     def value(self, value):
         self.__value = value
+        self.__key = None
 
     @property
     def size(self):
@@ -493,6 +716,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
                         AbstractType.MAXIMUM_GENERATED_DATA_SIZE))
 
             self.__size = (minSize, maxSize)
+            self.__key = None
         else:
             raise TypeError(
                 "Size must be defined by a tuple an int or with None")
@@ -604,6 +828,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         if typeName is None:
             raise TypeError("typeName cannot be None")
         self.__typeName = typeName
+        self.__key = None
 
     @property
     def unitSize(self):
@@ -625,6 +850,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
                 "Specified UnitSize is not supported, please refer to the list in AbstractType.supportedUnitSize()."
             )
         self.__unitSize = unitSize
+        self.__key = None
 
     @property
     def endianness(self):
@@ -648,6 +874,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
             )
 
         self.__endianness = endianness
+        self.__key = None
 
         if self.value is not None and self.value.endian() != self.__endianness:
             self.value = bitarray(self.value, endian=self.__endianness)
@@ -672,3 +899,4 @@ class AbstractType(object, metaclass=abc.ABCMeta):
                 "Specified Sign is not supported, please refer to the list in AbstractType.supportedSign()."
             )
         self.__sign = sign
+        self.__key = None
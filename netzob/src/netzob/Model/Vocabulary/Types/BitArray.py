@@ -34,7 +34,6 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
-import random
 
 # +---------------------------------------------------------------------------+
 # | Related third party imports                                               |
@@ -124,9 +123,9 @@ class BitArray(AbstractType):
         if maxSize is None:
             maxSize = AbstractType.MAXIMUM_GENERATED_DATA_SIZE
 
-        generatedSize = random.randint(minSize, maxSize)
-        randomContent = [random.randint(0, 1) for i in range(0, generatedSize)]
-        return bitarray(randomContent, endian=self.endianness)
+        generatedSize = AbstractType.randomGenerator().randint(
+            minSize, maxSize)
+        return AbstractType.randomBits(generatedSize, self.endianness)
 
     @staticmethod
     @typeCheck(bitarray)
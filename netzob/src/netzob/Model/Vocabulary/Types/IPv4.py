@@ -35,7 +35,6 @@
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
 import struct
-import random
 
 # +---------------------------------------------------------------------------+
 # | Related third party imports                                               |
@@ -136,7 +135,7 @@ class IPv4(AbstractType):
         if self.value is not None:
             return self.value
         elif self.network is not None:
-            ip = random.choice(self.network)
+            ip = AbstractType.randomGenerator().choice(self.network)
             return TypeConverter.convert(
                 ip.packed,
                 Raw,
@@ -150,13 +149,16 @@ class IPv4(AbstractType):
         else:
             not_valid = [10, 127, 169, 172, 192]
 
-            first = random.randrange(1, 256)
+            randomGenerator = AbstractType.randomGenerator()
+            first = randomGenerator.randrange(1, 256)
             while first in not_valid:
-                first = random.randrange(1, 256)
+                first = randomGenerator.randrange(1, 256)
 
             strip = ".".join([
-                str(first), str(random.randrange(1, 256)),
-                str(random.randrange(1, 256)), str(random.randrange(1, 256))
+                str(first),
+                str(randomGenerator.randrange(1, 256)),
+                str(randomGenerator.randrange(1, 256)),
+                str(randomGenerator.randrange(1, 256))
             ])
 
             ip = IPv4.encode(strip)
@@ -281,6 +283,11 @@ class IPv4(AbstractType):
             return False
         return False
 
+    @property
+    def parsingKey(self):
+        network = str(self.network) if self.network is not None else None
+        return self.key + (network, )
+
     @property
     def network(self):
         """A constraint over the network the parsed data belongs to this network or not."""
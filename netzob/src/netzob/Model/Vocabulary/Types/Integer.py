@@ -91,6 +91,9 @@ class Integer(AbstractType):
 
     """
 
+    # precompiled structs indexed by (unitSize, endianness, sign)
+    __codecs = dict()
+
     def __init__(self,
                  value=None,
                  interval=None,
@@ -237,9 +240,7 @@ class Integer(AbstractType):
         if data is None:
             raise TypeError("data cannot be None")
 
-        f = Integer.computeFormat(unitSize, endianness, sign)
-
-        return struct.pack(f, int(data))
+        return Integer.getCodec(unitSize, endianness, sign).pack(int(data))
 
     @staticmethod
     def encode(data,
@@ -293,54 +294,131 @@ class Integer(AbstractType):
         if data is None:
             raise TypeError("data cannot be None")
 
-        perWordFormat = Integer.computeFormat(unitSize, endianness, sign)
+        codec = Integer.getCodec(unitSize, endianness, sign)
+        wordSize = codec.size
+
+        # data made of a single word is decoded in one call
+        if len(data) == wordSize:
+            return codec.unpack(data)[0]
 
-        nbWords = int(len(data) * 8 / int(unitSize))
+        nbWords = len(data) // wordSize
 
-        # Check whether the input data matches unitSize. If not take 
+        # Check whether the input data matches unitSize. If not take
         # precautions to able to pad it with null bytes later.
         padding_nullbytes = 0
-        rest = (len(data) * 8) % int(unitSize)
+        rest = len(data) % wordSize
         if rest != 0:
             nbWords += 1
-            padding_nullbytes = (int(unitSize) - rest) / 8
+            padding_nullbytes = wordSize - rest
 
         finalValue = 0
 
-        iWord = 0
-        start = 0
-        end = nbWords
-        inc = 1
-        if endianness == AbstractType.ENDIAN_BIG:
-            end = 0
-            start = nbWords
-            inc = -1
-
-        for i in range(start, end, inc):
+        for iWord in range(nbWords):
             # Extract the portion that represents the current word
-            startPos = int(iWord * int(unitSize) / 8)
-            endPos = int(iWord * int(unitSize) / 8 + int(unitSize) / 8)
-
-            wordData = data[startPos:endPos]
+            wordData = data[iWord * wordSize:(iWord + 1) * wordSize]
 
-            # Pad with null bytes to statisfy the unitSize.
-            if padding_nullbytes > 0 and i == (end - inc):
+            # Pad the last word with null bytes to statisfy the unitSize.
+            if padding_nullbytes > 0 and iWord == nbWords - 1:
                 if endianness == AbstractType.ENDIAN_BIG:
-                    wordData = b'\x00' * int(padding_nullbytes) + wordData
-                elif endianness == AbstractType.ENDIAN_LITTLE:
-                    wordData += b'\x00' * int(padding_nullbytes)
+                    wordData = b'\x00' * padding_nullbytes + wordData
                 else:
-                    raise ValueError(
-                        "Invalid endianness value: {0}".format(endianness))
+                    wordData += b'\x00' * padding_nullbytes
 
-            unpackedWord = struct.unpack(perWordFormat, wordData)[0]
-            unpackedWord = unpackedWord << int(unitSize) * iWord
+            unpackedWord = codec.unpack(wordData)[0]
+            finalValue += unpackedWord << (8 * wordSize * iWord)
 
-            finalValue = finalValue + unpackedWord
+        return finalValue
 
-            iWord += 1
+    @classmethod
+    def decodeMany(cls,
+                   values,
+                   unitSize=AbstractType.defaultUnitSize(),
+                   endianness=AbstractType.defaultEndianness(),
+                   sign=AbstractType.defaultSign()):
+        """This method converts a list of integers in python raw format.
+        All the integers are packed in a single call.
 
-        return finalValue
+        >>> from netzob.all import *
+        >>> Integer.decodeMany([1, 2, 258], unitSize=AbstractType.UNITSIZE_16)
+        [b'\\x00\\x01', b'\\x00\\x02', b'\\x01\\x02']
+
+        :param values: the integers which will be decoded in raw
+        :type values: a list of :class:`int`
+        :return: the list of data encoded in python raw
+        :rtype: a list of python raw
+        :raise: TypeError if parameters are not valid.
+        """
+        values = list(values)
+        if any(value is None for value in values):
+            raise TypeError("data cannot be None")
+        values = [int(value) for value in values]
+        size = Integer.getCodec(unitSize, endianness, sign).size
+        f = Integer.computeFormat(unitSize, endianness, sign)
+        packed = struct.pack(f[0] + str(len(values)) + f[1:], *values)
+        return [packed[i:i + size] for i in range(0, len(packed), size)]
+
+    @classmethod
+    def encodeMany(cls,
+                   values,
+                   unitSize=AbstractType.defaultUnitSize(),
+                   endianness=AbstractType.defaultEndianness(),
+                   sign=AbstractType.defaultSign()):
+        """This method converts a list of python raw data to integers.
+        If all the data have the size of a word, they are unpacked in a
+        single call.
+
+        >>> from netzob.all import *
+        >>> Integer.encodeMany([b'\\x00\\x01', b'\\x01\\x02'], unitSize=AbstractType.UNITSIZE_16)
+        [1, 258]
+        >>> Integer.encodeMany([b'\\x01', b'\\x01\\x02'], unitSize=AbstractType.UNITSIZE_16)
+        [1, 258]
+
+        :param values: the data encoded in python raw which will be encoded in integers
+        :type values: a list of python raw
+        :return: the list of integers
+        :rtype: a list of :class:`int`
+        :raise: TypeError if parameters are not valid.
+        """
+        values = list(values)
+        codec = Integer.getCodec(unitSize, endianness, sign)
+        for value in values:
+            if value is None:
+                raise TypeError("data cannot be None")
+            if len(value) != codec.size:
+                return [
+                    Integer.encode(
+                        value,
+                        unitSize=unitSize,
+                        endianness=endianness,
+                        sign=sign) for value in values
+                ]
+        return [
+            value for (value, ) in codec.iter_unpack(b"".join(values))
+        ]
+
+    @staticmethod
+    def getCodec(unitSize, endianness, sign):
+        """Returns the precompiled :class:`struct.Struct` which packs and
+        unpacks a word of the specified unit size, endianness and sign.
+
+        >>> from netzob.all import *
+        >>> codec = Integer.getCodec(AbstractType.UNITSIZE_32, AbstractType.ENDIAN_LITTLE, AbstractType.SIGN_UNSIGNED)
+        >>> print(codec.size)
+        4
+        >>> codec.unpack(b"\\x01\\x00\\x00\\x00")
+        (1,)
+        >>> codec is Integer.getCodec(AbstractType.UNITSIZE_32, AbstractType.ENDIAN_LITTLE, AbstractType.SIGN_UNSIGNED)
+        True
+
+        :raise: ValueError if parameters are not valid.
+        """
+        key = (unitSize, endianness, sign)
+        codec = Integer.__codecs.get(key)
+        if codec is None:
+            codec = struct.Struct(
+                Integer.computeFormat(unitSize, endianness, sign))
+            Integer.__codecs[key] = codec
+        return codec
 
     @staticmethod
     def computeFormat(unitSize, endianness, sign):
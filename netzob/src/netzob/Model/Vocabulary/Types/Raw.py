@@ -34,8 +34,6 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
-import random
-import os
 from bitarray import bitarray
 
 # +---------------------------------------------------------------------------+
@@ -76,6 +74,9 @@ class Raw(AbstractType):
 
     """
 
+    # raw data is made of bytes
+    BIT_GRANULARITY = 8
+
     def __init__(self,
                  value=None,
                  nbBytes=None,
@@ -183,14 +184,18 @@ class Raw(AbstractType):
         if minSize is None:
             minSize = 0
 
-        generatedSize = random.randint(minSize, maxSize)
+        randomGenerator = AbstractType.randomGenerator()
+        generatedSize = randomGenerator.randint(minSize, maxSize)
 
         generatedValue = None
         if self.alphabet is None:
-            generatedValue = os.urandom(int(generatedSize / 8))
+            generatedValue = AbstractType.randomBytes(int(generatedSize / 8))
         else:
-            generatedValue = "".join([random.choice(self.alphabet) for _ in range(int(generatedSize / 8))])
-            
+            generatedValue = "".join([
+                randomGenerator.choice(self.alphabet)
+                for _ in range(int(generatedSize / 8))
+            ])
+
         return TypeConverter.convert(generatedValue, Raw, BitArray)
 
     @staticmethod
@@ -244,3 +249,8 @@ class Raw(AbstractType):
                     return False
 
         return True
+
+    @property
+    def parsingKey(self):
+        alphabet = tuple(self.alphabet) if self.alphabet is not None else None
+        return self.key + (alphabet, )
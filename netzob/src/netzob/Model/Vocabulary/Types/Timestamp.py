@@ -99,6 +99,9 @@ class Timestamp(AbstractType):
    
     """
 
+    # timestamps are made of bytes
+    BIT_GRANULARITY = 8
+
     EPOCH_WINDOWS = datetime(1601, 1, 1)
     EPOCH_MUMPS = datetime(1840, 12, 31)
     EPOCH_VMS = datetime(1858, 11, 17)
@@ -295,6 +298,10 @@ class Timestamp(AbstractType):
 
         return parsedTimestamp.strftime("%c")
 
+    @property
+    def parsingKey(self):
+        return self.key + (self.epoch, self.unity)
+
     @property
     def epoch(self):
         """Initial date expressed in UTC from which timestamp is measured"""
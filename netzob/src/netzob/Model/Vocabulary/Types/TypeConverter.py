@@ -28,22 +28,42 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
+import binascii
 
 # +---------------------------------------------------------------------------+
 # | Related third party imports                                               |
 # +---------------------------------------------------------------------------+
+from bitarray import bitarray
 
 # +---------------------------------------------------------------------------+
 # | Local application imports                                                 |
 # +---------------------------------------------------------------------------+
 from netzob.Model.Vocabulary.Types.AbstractType import AbstractType
 from netzob.Model.Vocabulary.Types.Raw import Raw
+from netzob.Model.Vocabulary.Types.BitArray import BitArray
+from netzob.Model.Vocabulary.Types.HexaString import HexaString
+from netzob.Model.Vocabulary.Types.Integer import Integer
 
 
 class TypeConverter(object):
     """A type converter class which provide the convert method.
+
+    Conversions are made by a converter function looked up once for
+    each combination of source type, destination type and encoding
+    parameters. Direct converters are registered for the most common
+    pairs of types, other conversions go through a raw representation
+    of the data.
     """
 
+    # factories of direct converters, indexed by (sourceType, destinationType)
+    __directConverters = dict()
+
+    # converters indexed by the types and the encoding parameters
+    __converters = dict()
+
+    # set of the supported types, computed on first use
+    __supportedTypes = None
+
     @staticmethod
     def supportedTypes():
         """Official list of supported types
@@ -53,10 +73,88 @@ class TypeConverter(object):
         return AbstractType.supportedTypes()
 
     @staticmethod
-    def __directEncoding():
-        return {
-            # (ASCII,bitarray):TypeConverter.__encodeASCIIToBitarray,
-        }
+    def registerConverter(sourceType, destinationType, factory):
+        """Register a direct converter between two types.
+
+        The factory is called with the source and destination encoding
+        parameters (src_unitSize, src_endianness, src_sign, dst_unitSize,
+        dst_endianness, dst_sign) and returns the function which
+        converts a data, or None if it cannot handle these parameters.
+
+        :param sourceType: the data source type
+        :type sourceType: :class:`type`
+        :param destinationType: the destination type
+        :type destinationType: :class:`type`
+        :param factory: the function which builds the converters
+        :type factory: :class:`function`
+        """
+        TypeConverter.__directConverters[(sourceType,
+                                          destinationType)] = factory
+        TypeConverter.__converters.clear()
+
+    @staticmethod
+    def __getConverter(key):
+        """Build the converter associated with the specified key and keep
+        it for the next conversions."""
+        (sourceType, destinationType, src_unitSize, src_endianness,
+         src_sign, dst_unitSize, dst_endianness, dst_sign) = key
+
+        # is the two formats supported ?
+        if TypeConverter.__supportedTypes is None:
+            TypeConverter.__supportedTypes = frozenset(
+                AbstractType.supportedTypes())
+        if sourceType not in TypeConverter.__supportedTypes:
+            raise TypeError(
+                "The source type ({0}) is not supported".format(sourceType))
+        if destinationType not in TypeConverter.__supportedTypes:
+            raise TypeError("The destination type ({0}) is not supported".
+                            format(destinationType))
+
+        converter = None
+
+        # Do we have a specific source to destination encoding function
+        factory = TypeConverter.__directConverters.get((sourceType,
+                                                        destinationType))
+        if factory is not None:
+            converter = factory(src_unitSize, src_endianness, src_sign,
+                                dst_unitSize, dst_endianness, dst_sign)
+
+        if converter is None:
+            converter = TypeConverter.__throughRaw(
+                sourceType, destinationType, src_unitSize, src_endianness,
+                src_sign, dst_unitSize, dst_endianness, dst_sign)
+
+        TypeConverter.__converters[key] = converter
+        return converter
+
+    @staticmethod
+    def __throughRaw(sourceType, destinationType, src_unitSize,
+                     src_endianness, src_sign, dst_unitSize, dst_endianness,
+                     dst_sign):
+        """Build a converter which decodes the data from the source type
+        to raw and then encodes it in the destination type."""
+
+        def toRaw(data):
+            return sourceType.decode(
+                data,
+                unitSize=src_unitSize,
+                endianness=src_endianness,
+                sign=src_sign)
+
+        def fromRaw(binData):
+            return destinationType.encode(
+                binData,
+                unitSize=dst_unitSize,
+                endianness=dst_endianness,
+                sign=dst_sign)
+
+        if sourceType is Raw and destinationType is Raw:
+            return lambda data: data
+        if sourceType is Raw:
+            return fromRaw
+        if destinationType is Raw:
+            return toRaw
+        return lambda data: fromRaw(toRaw(data))
 
     @staticmethod
     def convert(data,
@@ -107,6 +205,19 @@ class TypeConverter(object):
         >>> TypeConverter.convert(167815360, Integer, IPv4, src_unitSize=AbstractType.UNITSIZE_32, src_sign=AbstractType.SIGN_UNSIGNED)
         IPAddress('10.0.168.192')
 
+        Frequent conversions, such as the ones between raw data, bit
+        arrays, hexastrings and integers, are made directly
+
+        >>> bits = TypeConverter.convert("0fa0", HexaString, BitArray)
+        >>> print(bits)
+        bitarray('0000111110100000')
+        >>> TypeConverter.convert(bits, BitArray, HexaString)
+        b'0fa0'
+        >>> TypeConverter.convert(bits, BitArray, Integer, dst_unitSize=AbstractType.UNITSIZE_16)
+        4000
+        >>> TypeConverter.convert(b"\\x0f\\xa0", Raw, Integer, dst_unitSize=AbstractType.UNITSIZE_16, dst_endianness=AbstractType.ENDIAN_LITTLE, dst_sign=AbstractType.SIGN_UNSIGNED)
+        40975
+
         :param sourceType: the data source type
         :type sourceType: :class:`type`
         :param destinationType: the destination type
@@ -127,42 +238,187 @@ class TypeConverter(object):
         :raise: TypeError if parameter not valid
 
         """
-        # is the two formats supported ?
-        if sourceType not in TypeConverter.supportedTypes():
-            raise TypeError(
-                "The source type ({0}) is not supported".format(sourceType))
-        if destinationType not in TypeConverter.supportedTypes():
-            raise TypeError("The destination type ({0}) is not supported".
-                            format(destinationType))
         if data is None:
             raise TypeError("Data cannot be None")
 
-        # Do we have a specific source to destination encoding function
-        if (sourceType, destinationType
-            ) in list(TypeConverter.__directEncoding().keys()):
-            func = TypeConverter.__directEncoding()[(sourceType,
-                                                     destinationType)]
-            return func(data, src_unitSize, src_endianness, src_sign,
-                        dst_unitSize, dst_endianness, dst_sign)
-        else:
-            # Convert from source to raw
-            if sourceType is not Raw:
-                binData = sourceType.decode(
-                    data,
-                    unitSize=src_unitSize,
-                    endianness=src_endianness,
-                    sign=src_sign)
-            else:
-                binData = data
-
-            # Convert from raw to Destination
-            if destinationType is not Raw:
-                outputData = destinationType.encode(
-                    binData,
-                    unitSize=dst_unitSize,
-                    endianness=dst_endianness,
-                    sign=dst_sign)
-            else:
-                outputData = binData
-
-            return outputData
+        key = (sourceType, destinationType, src_unitSize, src_endianness,
+               src_sign, dst_unitSize, dst_endianness, dst_sign)
+        converter = TypeConverter.__converters.get(key)
+        if converter is None:
+            converter = TypeConverter.__getConverter(key)
+        return converter(data)
+
+    @staticmethod
+    def convertMany(values,
+                    sourceType,
+                    destinationType,
+                    src_unitSize=AbstractType.defaultUnitSize(),
+                    src_endianness=AbstractType.defaultEndianness(),
+                    src_sign=AbstractType.defaultSign(),
+                    dst_unitSize=AbstractType.defaultUnitSize(),
+                    dst_endianness=AbstractType.defaultEndianness(),
+                    dst_sign=AbstractType.defaultSign()):
+        """Encode a list of data provided as a sourceType to a
+        destinationType. Parameters are the ones of :meth:`convert`.
+
+        The whole list is processed at once with the batch methods of the
+        types (see :meth:`AbstractType.decodeMany` and
+        :meth:`AbstractType.encodeMany`), which is faster than converting
+        the data one by one.
+
+        >>> from netzob.all import *
+        >>> column = [b"\\x00\\x01", b"\\x00\\x02", b"\\x01\\x00"]
+        >>> TypeConverter.convertMany(column, Raw, Integer, dst_unitSize=AbstractType.UNITSIZE_16)
+        [1, 2, 256]
+        >>> bits = TypeConverter.convertMany(column, Raw, BitArray)
+        >>> print(bits[2])
+        bitarray('0000000100000000')
+        >>> TypeConverter.convertMany(bits, BitArray, Raw) == column
+        True
+        >>> TypeConverter.convertMany(["zoby", "netzob"], ASCII, HexaString)
+        [b'7a6f6279', b'6e65747a6f62']
+
+        :param values: the data to convert
+        :type values: a list of data encoded in the source type
+        :return: the list of converted data
+        :rtype: a list of data encoded in the destination type
+        :raise: TypeError if parameter not valid
+        """
+        values = list(values)
+        if any(value is None for value in values):
+            raise TypeError("Data cannot be None")
+
+        key = (sourceType, destinationType, src_unitSize, src_endianness,
+               src_sign, dst_unitSize, dst_endianness, dst_sign)
+        converter = TypeConverter.__converters.get(key)
+        if converter is None:
+            converter = TypeConverter.__getConverter(key)
+
+        if sourceType is not Raw and destinationType is not Raw and (
+                sourceType,
+                destinationType) in TypeConverter.__directConverters:
+            return [converter(value) for value in values]
+
+        # Convert the whole list from source to raw and from raw to destination
+        if sourceType is not Raw:
+            values = sourceType.decodeMany(
+                values,
+                unitSize=src_unitSize,
+                endianness=src_endianness,
+                sign=src_sign)
+        if destinationType is not Raw:
+            values = destinationType.encodeMany(
+                values,
+                unitSize=dst_unitSize,
+                endianness=dst_endianness,
+                sign=dst_sign)
+        return values
+
+
+def _bitarrayEndian(endianness):
+    if endianness == AbstractType.ENDIAN_BIG:
+        return 'big'
+    elif endianness == AbstractType.ENDIAN_LITTLE:
+        return 'little'
+    return None
+
+
+def _integerStruct(unitSize, endianness, sign):
+    try:
+        return Integer.getCodec(unitSize, endianness, sign)
+    except ValueError:
+        return None
+
+
+def _rawToBitArray(src_unitSize, src_endianness, src_sign, dst_unitSize,
+                   dst_endianness, dst_sign):
+    endian = _bitarrayEndian(dst_endianness)
+    if endian is None:
+        return None
+
+    def convert(data):
+        if isinstance(data, str):
+            data = bytes(data, "utf-8")
+        b = bitarray(endian=endian)
+        b.frombytes(data)
+        return b
+
+    return convert
+
+
+def _bitArrayToRaw(src_unitSize, src_endianness, src_sign, dst_unitSize,
+                   dst_endianness, dst_sign):
+    return lambda data: data.tobytes()
+
+
+def _bitArrayToHexaString(src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign):
+    return lambda data: binascii.hexlify(data.tobytes())
+
+
+def _hexaStringToBitArray(src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign):
+    toBitArray = _rawToBitArray(src_unitSize, src_endianness, src_sign,
+                                dst_unitSize, dst_endianness, dst_sign)
+    if toBitArray is None:
+        return None
+    return lambda data: toBitArray(HexaString.decode(data))
+
+
+def _integerToRaw(src_unitSize, src_endianness, src_sign, dst_unitSize,
+                  dst_endianness, dst_sign):
+    codec = _integerStruct(src_unitSize, src_endianness, src_sign)
+    if codec is None:
+        return None
+    pack = codec.pack
+    return lambda data: pack(int(data))
+
+
+def _rawToInteger(src_unitSize, src_endianness, src_sign, dst_unitSize,
+                  dst_endianness, dst_sign):
+    codec = _integerStruct(dst_unitSize, dst_endianness, dst_sign)
+    if codec is None:
+        return None
+    (unpack, size) = (codec.unpack, codec.size)
+
+    def convert(data):
+        # data made of a single word is decoded in one call
+        if len(data) == size:
+            return unpack(data)[0]
+        return Integer.encode(
+            data,
+            unitSize=dst_unitSize,
+            endianness=dst_endianness,
+            sign=dst_sign)
+
+    return convert
+
+
+def _integerToBitArray(src_unitSize, src_endianness, src_sign, dst_unitSize,
+                       dst_endianness, dst_sign):
+    toRaw = _integerToRaw(src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign)
+    toBitArray = _rawToBitArray(src_unitSize, src_endianness, src_sign,
+                                dst_unitSize, dst_endianness, dst_sign)
+    if toRaw is None or toBitArray is None:
+        return None
+    return lambda data: toBitArray(toRaw(data))
+
+
+def _bitArrayToInteger(src_unitSize, src_endianness, src_sign, dst_unitSize,
+                       dst_endianness, dst_sign):
+    toInteger = _rawToInteger(src_unitSize, src_endianness, src_sign,
+                              dst_unitSize, dst_endianness, dst_sign)
+    if toInteger is None:
+        return None
+    return lambda data: toInteger(data.tobytes())
+
+
+TypeConverter.registerConverter(Raw, BitArray, _rawToBitArray)
+TypeConverter.registerConverter(BitArray, Raw, _bitArrayToRaw)
+TypeConverter.registerConverter(BitArray, HexaString, _bitArrayToHexaString)
+TypeConverter.registerConverter(HexaString, BitArray, _hexaStringToBitArray)
+TypeConverter.registerConverter(Integer, Raw, _integerToRaw)
+TypeConverter.registerConverter(Raw, Integer, _rawToInteger)
+TypeConverter.registerConverter(Integer, BitArray, _integerToBitArray)
+TypeConverter.registerConverter(BitArray, Integer, _bitArrayToInteger)
@@ -38,7 +38,6 @@ import socket
 from bitarray import bitarray
 import struct
 from fcntl import ioctl
-import arpreq
 import subprocess
 import time
 import binascii
@@ -208,6 +207,8 @@ class RawEthernetClient(AbstractChannel):
         # Ethernet header
 
         # Retrieve remote MAC address
+        # (arpreq is only imported when a raw ethernet channel is used)
+        import arpreq
         dstMacAddr = arpreq.arpreq(self.remoteIP)
         if dstMacAddr is not None:
             dstMacAddr = dstMacAddr.replace(':', '')
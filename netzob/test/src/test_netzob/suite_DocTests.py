@@ -45,12 +45,14 @@ from netzob.Model.Vocabulary.Messages import AbstractMessage
 from netzob.Inference.Vocabulary.FormatOperations import FieldReseter
 from netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.FieldSplitStatic import FieldSplitStatic
 from netzob.Inference.Vocabulary.FormatOperations.FieldSplitStatic.ParallelFieldSplitStatic import ParallelFieldSplitStatic
+from netzob.Import.PCAPImporter.ParallelPCAPImporter import ParallelPCAPImporter
 from netzob.Inference.Vocabulary.FormatOperations import ClusterByKeyField
 from netzob.Inference.Vocabulary.FormatOperations import ClusterByApplicativeData
 from netzob.Inference.Vocabulary.FormatOperations import ClusterByAlignment
 from netzob.Inference.Vocabulary.FormatOperations import ClusterBySize
 from netzob.Inference.Vocabulary.FormatOperations import FindKeyFields
 from netzob.Common.Utils import SortedTypedList
+from netzob.Common.Utils import Decorators
 from netzob.Common.Utils import MessageCells
 
 from netzob.Inference.Vocabulary.Search import SearchTask
@@ -65,6 +67,7 @@ from netzob.Model.Vocabulary.Domain.Specializer.VariableSpecializer import Varia
 from netzob.Model.Vocabulary.Domain.Variables.SVAS import SVAS
 
 from netzob.Model.Vocabulary.Domain.Parser.MessageParser import MessageParser
+from netzob.Model.Vocabulary.Domain.Parser.ParsingCache import ParsingCache
 from netzob.Model.Vocabulary.Domain.Specializer.MessageSpecializer import MessageSpecializer
 from netzob.Model.Vocabulary.Domain.Parser.FlowParser import FlowParser
 
@@ -121,6 +124,7 @@ def getSuite():
         L2NetworkMessage.__module__,
         L3NetworkMessage.__module__,
         L4NetworkMessage.__module__,
+        MessageStore.__module__,
         FileMessage.__module__,
         FieldOperations,
         CorrelationFinder.__module__,
@@ -128,6 +132,7 @@ def getSuite():
         Format.__module__,
         Session.__module__,
         SortedTypedList,
+        Decorators,
         MessageCells,
         ApplicativeData.__module__,
         DomainEncodingFunction.__module__,
@@ -135,6 +140,7 @@ def getSuite():
         ZLibEncodingFunction.__module__,
         Base64EncodingFunction.__module__,
         SearchEngine.__module__,
+        MessageIndex.__module__,
         SearchTask,
         SearchResult,
         ClusterByApplicativeData,
@@ -154,6 +160,7 @@ def getSuite():
         SVAS.__module__,
 
         MessageParser.__module__,
+        ParsingCache.__module__,
         MessageSpecializer.__module__,
 
         FlowParser.__module__,
@@ -183,6 +190,11 @@ def getSuite():
         # Modules related to the import
         # -----------------------------
         PCAPImporter.__module__,
+        PCAPReader.__module__,
+        TCPReassembler.__module__,
+        ParallelPCAPImporter.__module__,
+        PCAPCache.__module__,
+        FileReader.__module__,
         FileImporter.__module__
 
         # Other
@@ -38,6 +38,7 @@ import sys
 from test_netzob import suite_Common
 from test_netzob import suite_Tutorials
 from test_netzob import suite_DocTests
+from test_netzob.test_Common import test_ImportTime
 
 #from test_netzob import suite_Import
 from common.xmlrunner import XMLTestRunner
@@ -46,7 +47,9 @@ from common.xmlrunner import XMLTestRunner
 def getSuite():
     globalSuite = unittest.TestSuite()
 
-    modulesOfTests = []
+    modulesOfTests = [
+        test_ImportTime,  # optional dependencies are not loaded on import
+    ]
     modulesOfSuites = [
         suite_DocTests,  # tests extracted from docstrings (doctests)
         # suite_Common,
@@ -0,0 +1,71 @@
+
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import os
+import subprocess
+import sys
+import unittest
+
+#+---------------------------------------------------------------------------+
+#| Local Imports
+#+---------------------------------------------------------------------------+
+import netzob
+
+
+class test_ImportTime(unittest.TestCase):
+    """Verify that importing netzob does not load the optional and slow
+    to import dependencies, which are only needed by some inference and
+    simulation features."""
+
+    DEFERRED_MODULES = ["numpy", "minepy", "arpreq"]
+
+    def test_deferredModules(self):
+        script = """
+import sys, time
+start = time.time()
+from netzob.all import *
+duration = time.time() - start
+print(duration)
+print(' '.join(m for m in {0} if m in sys.modules))
+""".format(repr(self.DEFERRED_MODULES))
+
+        env = dict(os.environ)
+        srcPath = os.path.dirname(os.path.dirname(netzob.__file__))
+        env["PYTHONPATH"] = os.pathsep.join(
+            [srcPath] + [p for p in [env.get("PYTHONPATH")] if p])
+        output = subprocess.check_output(
+            [sys.executable, "-c", script], env=env).decode("utf-8")
+        (duration, loadedModules) = (output.split("\n") + [""])[:2]
+
+        self.assertEqual(
+            loadedModules, "",
+            "Modules {0} are loaded when netzob is imported (import took {1}s)".
+            format(loadedModules, duration))